@@ -0,0 +1,66 @@
+"""Add per-session message sequence numbers.
+
+Revision ID: 002_message_seq
+Revises: 001_initial_schema
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_message_seq'
+down_revision = '001_initial_schema'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'sessions',
+        sa.Column('message_seq', sa.Integer(), nullable=False, server_default='0')
+    )
+    op.add_column('messages', sa.Column('seq', sa.Integer(), nullable=True))
+
+    # Number existing messages in creation order within each session
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("""
+            UPDATE messages AS m SET seq = ranked.rn
+            FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY session_id ORDER BY created_at, id
+                ) AS rn
+                FROM messages
+            ) AS ranked
+            WHERE ranked.id = m.id
+        """)
+    else:
+        op.execute("""
+            UPDATE messages SET seq = (
+                SELECT ranked.rn FROM (
+                    SELECT id, ROW_NUMBER() OVER (
+                        PARTITION BY session_id ORDER BY created_at, id
+                    ) AS rn
+                    FROM messages
+                ) AS ranked
+                WHERE ranked.id = messages.id
+            )
+        """)
+
+    op.execute("""
+        UPDATE sessions SET message_seq = COALESCE(
+            (SELECT MAX(seq) FROM messages WHERE messages.session_id = sessions.id), 0
+        )
+    """)
+
+    op.create_index(
+        'idx_messages_session_seq', 'messages', ['session_id', 'seq'], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_messages_session_seq', table_name='messages')
+    with op.batch_alter_table('messages') as batch_op:
+        batch_op.drop_column('seq')
+    with op.batch_alter_table('sessions') as batch_op:
+        batch_op.drop_column('message_seq')
@@ -0,0 +1,129 @@
+"""Partition audit_log and messages by month on PostgreSQL.
+
+Revision ID: 004_time_partitioning
+Revises: 003_message_search
+Create Date: 2026-10-19 11:00:00.000000
+
+Each table is rebuilt as a RANGE-partitioned parent with monthly partitions
+covering existing data through PARTITION_PREMAKE_MONTHS ahead, plus a
+default partition. PostgreSQL requires the partition key in every unique
+constraint, so the primary keys become (id, created_at) and the
+(session_id, seq) index is no longer unique; seq values stay unique because
+they are allocated from sessions.message_seq.
+
+SQLite keeps the single-table layout.
+
+Partitions are named <table>_pYYYYMM, the scheme PartitionManager expects.
+The partition DDL and date math are frozen here as of this revision.
+"""
+from datetime import datetime
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004_time_partitioning'
+down_revision = '003_message_search'
+branch_labels = None
+depends_on = None
+
+PARTITION_PREMAKE_MONTHS = 3
+
+FOREIGN_KEYS = {
+    'audit_log': [
+        "FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE SET NULL",
+    ],
+    'messages': [
+        "FOREIGN KEY (session_id) REFERENCES sessions (id) ON DELETE CASCADE",
+        "FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE",
+    ],
+}
+
+# (name, definition, unique on a plain table)
+INDEXES = {
+    'audit_log': [
+        ("idx_audit_action", "(action)", False),
+        ("idx_audit_created", "(created_at)", False),
+        ("idx_audit_entity", "(entity_type, entity_id)", False),
+        ("idx_audit_user", "(user_id)", False),
+    ],
+    'messages': [
+        ("idx_messages_created", "(created_at)", False),
+        ("idx_messages_role", "(role)", False),
+        ("idx_messages_session", "(session_id)", False),
+        ("idx_messages_user", "(user_id)", False),
+        ("idx_messages_session_seq", "(session_id, seq)", True),
+        ("idx_messages_content_fts", "USING gin (to_tsvector('english', content))", False),
+    ],
+}
+
+
+def _month_start(value: datetime) -> datetime:
+    """Truncate a timestamp to the first instant of its month."""
+    return datetime(value.year, value.month, 1)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    """Shift a month start by a number of months."""
+    index = value.year * 12 + value.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _create_partition_sql(table: str, start: datetime) -> str:
+    """DDL creating the monthly partition that starts at ``start``."""
+    end = _add_months(start, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {table}_p{start:%Y%m} "
+        f"PARTITION OF {table} "
+        f"FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+    )
+
+
+def _rebuild(table: str, partitioned: bool) -> None:
+    """Copy a table into a new (partitioned or plain) table of the same name."""
+    bind = op.get_bind()
+    old = f"{table}_old"
+
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(f"ALTER TABLE {old} RENAME CONSTRAINT {table}_pkey TO {old}_pkey")
+
+    if partitioned:
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE (created_at)"
+        )
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+        first = bind.exec_driver_sql(f"SELECT MIN(created_at) FROM {old}").scalar()
+        current = _month_start(datetime.utcnow())
+        start = _month_start(first) if first else current
+        while start <= _add_months(current, PARTITION_PREMAKE_MONTHS):
+            op.execute(_create_partition_sql(table, start))
+            start = _add_months(start, 1)
+    else:
+        op.execute(f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS)")
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    op.execute(f"DROP TABLE {old}")
+
+    primary_key = "id, created_at" if partitioned else "id"
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({primary_key})")
+    for constraint in FOREIGN_KEYS[table]:
+        op.execute(f"ALTER TABLE {table} ADD {constraint}")
+
+    for name, definition, unique in INDEXES[table]:
+        kind = "UNIQUE INDEX" if unique and not partitioned else "INDEX"
+        op.execute(f"CREATE {kind} {name} ON {table} {definition}")
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table in ('audit_log', 'messages'):
+        _rebuild(table, partitioned=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table in ('audit_log', 'messages'):
+        _rebuild(table, partitioned=False)
@@ -0,0 +1,35 @@
+"""Composite audit_log indexes for keyset pagination.
+
+Revision ID: 005_audit_keyset_indexes
+Revises: 004_time_partitioning
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005_audit_keyset_indexes'
+down_revision = '004_time_partitioning'
+branch_labels = None
+depends_on = None
+
+# (old single-purpose index, old columns, new composite index, new columns)
+REPLACEMENTS = [
+    ('idx_audit_user', ['user_id'], 'idx_audit_user_created', ['user_id', 'created_at']),
+    ('idx_audit_entity', ['entity_type', 'entity_id'],
+     'idx_audit_entity_created', ['entity_type', 'entity_id', 'created_at']),
+    ('idx_audit_action', ['action'], 'idx_audit_action_created', ['action', 'created_at']),
+]
+
+
+def upgrade() -> None:
+    # The composites lead with the same columns, so they replace the old ones
+    for old, _, new, columns in REPLACEMENTS:
+        op.create_index(new, 'audit_log', columns)
+        op.drop_index(old, table_name='audit_log')
+
+
+def downgrade() -> None:
+    for old, columns, new, _ in REPLACEMENTS:
+        op.create_index(old, 'audit_log', columns)
+        op.drop_index(new, table_name='audit_log')
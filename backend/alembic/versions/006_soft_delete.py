@@ -0,0 +1,50 @@
+"""Soft-delete columns and cascading session -> project foreign key.
+
+Revision ID: 006_soft_delete
+Revises: 005_audit_keyset_indexes
+Create Date: 2026-10-19 13:00:00.000000
+
+Large users, projects and sessions are marked with deleted_at and removed
+in batches by the purger. sessions.project_id now cascades so deleting a
+project no longer relies on the ORM loading its sessions.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006_soft_delete'
+down_revision = '005_audit_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+SOFT_DELETE_TABLES = ['users', 'projects', 'sessions']
+
+# The FK was created unnamed in 001; give it a name SQLite batch mode can find
+NAMING_CONVENTION = {"fk": "%(table_name)s_%(column_0_name)s_fkey"}
+SESSION_PROJECT_FK = 'sessions_project_id_fkey'
+
+
+def _set_session_project_ondelete(ondelete: str) -> None:
+    """Recreate sessions.project_id -> projects.id with a new ON DELETE action."""
+    with op.batch_alter_table('sessions', naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint(SESSION_PROJECT_FK, type_='foreignkey')
+        batch_op.create_foreign_key(
+            SESSION_PROJECT_FK, 'projects', ['project_id'], ['id'], ondelete=ondelete
+        )
+
+
+def upgrade() -> None:
+    for table in SOFT_DELETE_TABLES:
+        op.add_column(table, sa.Column('deleted_at', sa.DateTime(), nullable=True))
+        op.create_index(f'idx_{table}_deleted', table, ['deleted_at'])
+
+    _set_session_project_ondelete('CASCADE')
+
+
+def downgrade() -> None:
+    _set_session_project_ondelete('SET NULL')
+
+    for table in SOFT_DELETE_TABLES:
+        op.drop_index(f'idx_{table}_deleted', table_name=table)
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('deleted_at')
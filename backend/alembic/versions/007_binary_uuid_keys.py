@@ -0,0 +1,139 @@
+"""Store primary and foreign keys as 16-byte UUIDs.
+
+Revision ID: 007_binary_uuid_keys
+Revises: 006_soft_delete
+Create Date: 2026-10-19 14:00:00.000000
+
+IDs were stored as 32/36-character text, so every primary key, foreign key
+and their indexes compared strings more than twice the size of the value.
+
+PostgreSQL converts the columns to the native uuid type in place: foreign
+keys are dropped, every key column is cast with ``USING col::uuid`` and
+the foreign keys are recreated. Partitioned tables (messages, audit_log)
+propagate the type change to their partitions.
+
+SQLite has no ALTER COLUMN TYPE, but a column's declared type does not
+constrain BLOB values, so the text IDs are rewritten in place as 16-byte
+blobs in rowid batches. This avoids rebuilding the tables (and the
+messages_fts triggers and rowids that depend on them); foreign key checks
+are deferred to commit while parents and children are rewritten.
+"""
+import uuid
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '007_binary_uuid_keys'
+down_revision = '006_soft_delete'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 5000
+
+ID_COLUMNS = {
+    'users': ['id'],
+    'projects': ['id', 'owner_id'],
+    'sessions': ['id', 'owner_id', 'project_id'],
+    'messages': ['id', 'session_id', 'user_id'],
+    'user_preferences': ['id', 'user_id'],
+    'documents': ['id', 'owner_id', 'project_id'],
+    'audit_log': ['id', 'user_id', 'entity_id'],
+}
+
+# Columns that may hold IDs of other systems; non-UUID values become NULL
+LOOSE_COLUMNS = {('audit_log', 'entity_id')}
+
+# (table, column, referenced table, ON DELETE); PostgreSQL names them <table>_<column>_fkey
+FOREIGN_KEYS = [
+    ('projects', 'owner_id', 'users', 'CASCADE'),
+    ('sessions', 'owner_id', 'users', 'CASCADE'),
+    ('sessions', 'project_id', 'projects', 'CASCADE'),
+    ('messages', 'session_id', 'sessions', 'CASCADE'),
+    ('messages', 'user_id', 'users', 'CASCADE'),
+    ('user_preferences', 'user_id', 'users', 'CASCADE'),
+    ('documents', 'owner_id', 'users', 'CASCADE'),
+    ('documents', 'project_id', 'projects', 'SET NULL'),
+    ('audit_log', 'user_id', 'users', 'SET NULL'),
+]
+
+UUID_PATTERN = "'^[0-9a-fA-F]{8}-?([0-9a-fA-F]{4}-?){3}[0-9a-fA-F]{12}$'"
+
+
+def _to_bytes(value, loose: bool):
+    """Convert a text UUID to its 16 raw bytes."""
+    if value is None or isinstance(value, bytes):
+        return value
+    try:
+        return uuid.UUID(value).bytes
+    except ValueError:
+        if loose:
+            return None
+        raise
+
+
+def _to_text(value, loose: bool):
+    """Convert 16 raw bytes back to the canonical text form."""
+    if value is None or isinstance(value, str):
+        return value
+    return str(uuid.UUID(bytes=bytes(value)))
+
+
+def _rewrite_sqlite(convert) -> None:
+    """Rewrite every ID column in place, BATCH_SIZE rows at a time."""
+    bind = op.get_bind()
+    bind.exec_driver_sql("PRAGMA defer_foreign_keys = ON")
+
+    for table, columns in ID_COLUMNS.items():
+        select = f"SELECT rowid, {', '.join(columns)} FROM {table} WHERE rowid > ? ORDER BY rowid LIMIT ?"
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        update = f"UPDATE {table} SET {assignments} WHERE rowid = ?"
+
+        last = 0
+        while True:
+            rows = bind.exec_driver_sql(select, (last, BATCH_SIZE)).fetchall()
+            if not rows:
+                break
+            bind.exec_driver_sql(update, [
+                tuple(
+                    convert(value, (table, column) in LOOSE_COLUMNS)
+                    for column, value in zip(columns, row[1:])
+                ) + (row[0],)
+                for row in rows
+            ])
+            last = rows[-1][0]
+
+
+def _alter_postgresql(column_type: str, using: str) -> None:
+    """Change every ID column's type with foreign keys dropped meanwhile."""
+    for table, column, _, _ in FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_{column}_fkey")
+
+    for table, columns in ID_COLUMNS.items():
+        for column in columns:
+            expression = using.format(column=column)
+            if (table, column) in LOOSE_COLUMNS and column_type == 'uuid':
+                expression = f"CASE WHEN {column} ~ {UUID_PATTERN} THEN {expression} END"
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {column_type} USING {expression}"
+            )
+
+    for table, column, referenced, ondelete in FOREIGN_KEYS:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_fkey "
+            f"FOREIGN KEY ({column}) REFERENCES {referenced} (id) ON DELETE {ondelete}"
+        )
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        _alter_postgresql('uuid', '{column}::uuid')
+    else:
+        _rewrite_sqlite(_to_bytes)
+
+
+def downgrade() -> None:
+    # Back to the canonical 36-character form the models wrote before this revision
+    if op.get_bind().dialect.name == 'postgresql':
+        _alter_postgresql('varchar(36)', '{column}::text')
+    else:
+        _rewrite_sqlite(_to_text)
@@ -0,0 +1,57 @@
+"""Store JSON columns as JSONB on PostgreSQL, with GIN indexes.
+
+Revision ID: 008_jsonb_columns
+Revises: 007_binary_uuid_keys
+Create Date: 2026-10-19 15:00:00.000000
+
+json columns are stored as text and re-parsed on every access, and cannot
+be indexed. messages.meta, projects.technology_stack and
+audit_log.old_value/new_value become jsonb, and GIN indexes serve the
+repository filters:
+
+* idx_projects_technology_stack (jsonb_path_ops): technology_stack @> ...
+* idx_messages_meta (jsonb_ops): meta ? key, meta @> ...
+
+Changing the column type rewrites each table, messages included, under
+an exclusive lock; schedule the upgrade accordingly.
+
+SQLite keeps JSON text.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '008_jsonb_columns'
+down_revision = '007_binary_uuid_keys'
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = [
+    ('messages', 'meta'),
+    ('projects', 'technology_stack'),
+    ('audit_log', 'old_value'),
+    ('audit_log', 'new_value'),
+]
+
+# (name, table, definition)
+GIN_INDEXES = [
+    ('idx_projects_technology_stack', 'projects', '(technology_stack jsonb_path_ops)'),
+    ('idx_messages_meta', 'messages', '(meta)'),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+    for name, table, definition in GIN_INDEXES:
+        op.execute(f"CREATE INDEX {name} ON {table} USING gin {definition}")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for name, _, _ in GIN_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json")
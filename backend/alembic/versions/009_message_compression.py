@@ -0,0 +1,129 @@
+"""Compress message content at rest.
+
+Revision ID: 009_message_compression
+Revises: 008_jsonb_columns
+Create Date: 2026-10-19 16:00:00.000000
+
+PostgreSQL: content stays text so the to_tsvector GIN index and
+ts_headline keep working; large values are compressed by TOAST, switched
+from pglz to lz4 (PostgreSQL 14+), which is several times faster to
+compress and decompress. Only values written afterwards use lz4.
+
+SQLite: Message.content is a CompressedText column, so bodies above
+MESSAGE_COMPRESSION_MIN_BYTES are written as compressed blobs by the
+application. The FTS5 index is rebuilt to read content through the
+text_content() SQL function (a view for the external content plus the
+sync triggers). Existing rows stay text until they are rewritten.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '009_message_compression'
+down_revision = '008_jsonb_columns'
+branch_labels = None
+depends_on = None
+
+# FTS5 index reading content through text_content(), as of this revision
+SQLITE_FTS_STATEMENTS = [
+    """
+    CREATE VIEW IF NOT EXISTS messages_fts_source AS
+    SELECT rowid AS message_rowid, text_content(content) AS content FROM messages
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+        content,
+        content='messages_fts_source',
+        content_rowid='message_rowid',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages BEGIN
+        INSERT INTO messages_fts(rowid, content) VALUES (new.rowid, text_content(new.content));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN
+        INSERT INTO messages_fts(messages_fts, rowid, content)
+        VALUES ('delete', old.rowid, text_content(old.content));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE OF content ON messages BEGIN
+        INSERT INTO messages_fts(messages_fts, rowid, content)
+        VALUES ('delete', old.rowid, text_content(old.content));
+        INSERT INTO messages_fts(rowid, content) VALUES (new.rowid, text_content(new.content));
+    END
+    """,
+]
+
+# Layout created by 003_message_search, restored on downgrade
+PLAIN_CONTENT_FTS_STATEMENTS = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+        content,
+        content='messages',
+        content_rowid='rowid',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages BEGIN
+        INSERT INTO messages_fts(rowid, content) VALUES (new.rowid, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN
+        INSERT INTO messages_fts(messages_fts, rowid, content)
+        VALUES ('delete', old.rowid, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE OF content ON messages BEGIN
+        INSERT INTO messages_fts(messages_fts, rowid, content)
+        VALUES ('delete', old.rowid, old.content);
+        INSERT INTO messages_fts(rowid, content) VALUES (new.rowid, new.content);
+    END
+    """,
+]
+
+SQLITE_FTS_DROP_STATEMENTS = [
+    "DROP TRIGGER IF EXISTS messages_fts_au",
+    "DROP TRIGGER IF EXISTS messages_fts_ad",
+    "DROP TRIGGER IF EXISTS messages_fts_ai",
+    "DROP TABLE IF EXISTS messages_fts",
+    "DROP VIEW IF EXISTS messages_fts_source",
+]
+
+
+def _set_postgresql_compression(method: str) -> None:
+    """Set the TOAST compression method for messages.content if supported."""
+    bind = op.get_bind()
+    if int(bind.exec_driver_sql("SHOW server_version_num").scalar()) >= 140000:
+        op.execute(f"ALTER TABLE messages ALTER COLUMN content SET COMPRESSION {method}")
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        _set_postgresql_compression('lz4')
+        return
+
+    for statement in SQLITE_FTS_DROP_STATEMENTS:
+        op.execute(statement)
+    for statement in SQLITE_FTS_STATEMENTS:
+        op.execute(statement)
+    op.execute("INSERT INTO messages_fts(messages_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        _set_postgresql_compression('pglz')
+        return
+
+    # Earlier revisions read content as plain text
+    op.execute("UPDATE messages SET content = text_content(content) WHERE typeof(content) = 'blob'")
+    for statement in SQLITE_FTS_DROP_STATEMENTS:
+        op.execute(statement)
+    for statement in PLAIN_CONTENT_FTS_STATEMENTS:
+        op.execute(statement)
+    op.execute("INSERT INTO messages_fts(messages_fts) VALUES ('rebuild')")
@@ -0,0 +1,140 @@
+"""Offset index for messages moved to cold storage.
+
+Revision ID: 010_message_archives
+Revises: 009_message_compression
+Create Date: 2026-10-19 17:00:00.000000
+
+Messages of long-archived sessions are moved by scripts/archive_sessions.py
+to compressed, append-only segment files under ARCHIVE_DIR; this table
+records where each session's record is. Downgrading first copies every
+archived session's messages back to the messages table (the segment files
+must still be present); session statuses are left as they are. The segment
+and payload formats are decoded here as of this revision.
+"""
+import json
+import os
+import struct
+import uuid
+import zlib
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from backend.src.config import settings
+from backend.src.models.guid import GUID
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+    zstandard = None
+
+# revision identifiers, used by Alembic.
+revision = '010_message_archives'
+down_revision = '009_message_compression'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'message_archives',
+        sa.Column('session_id', GUID(), sa.ForeignKey('sessions.id', ondelete='CASCADE'),
+                  primary_key=True),
+        sa.Column('segment', sa.Integer(), nullable=False),
+        sa.Column('offset', sa.BigInteger(), nullable=False),
+        sa.Column('length', sa.Integer(), nullable=False),
+        sa.Column('message_count', sa.Integer(), nullable=False),
+        sa.Column('last_message_at', sa.DateTime(), nullable=True),
+        sa.Column('archived_at', sa.DateTime(), server_default=sa.func.now()),
+    )
+
+
+# Segment record header: magic, payload length, crc32
+SEGMENT_MAGIC = b'SEG1'
+SEGMENT_HEADER = struct.Struct('>4sII')
+
+# Payload codec header bytes
+ZLIB = 0x01
+ZSTD = 0x02
+ZSTD_DICT = 0x03
+
+# messages columns as of this revision
+messages = sa.table(
+    'messages',
+    sa.column('id'),
+    sa.column('session_id'),
+    sa.column('user_id'),
+    sa.column('seq', sa.Integer()),
+    sa.column('role', sa.String()),
+    sa.column('content', sa.Text()),
+    sa.column('message_type', sa.String()),
+    sa.column('meta', sa.JSON().with_variant(postgresql.JSONB(), 'postgresql')),
+    sa.column('created_at', sa.DateTime()),
+    sa.column('updated_at', sa.DateTime()),
+)
+
+UUID_COLUMNS = ('id', 'session_id', 'user_id')
+DATETIME_COLUMNS = ('created_at', 'updated_at')
+
+
+def _read_record(segment: int, offset: int, length: int) -> bytes:
+    """Read and verify one segment record, returning its payload."""
+    path = os.path.join(settings.ARCHIVE_DIR, f'{segment:08d}.seg')
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        record = f.read(length)
+    if len(record) < SEGMENT_HEADER.size:
+        raise ValueError(f'Truncated archive record at {segment}:{offset}')
+    magic, size, checksum = SEGMENT_HEADER.unpack_from(record)
+    payload = record[SEGMENT_HEADER.size:]
+    if magic != SEGMENT_MAGIC or size != len(payload) or zlib.crc32(payload) != checksum:
+        raise ValueError(f'Corrupted archive record at {segment}:{offset}')
+    return payload
+
+
+def _decompress(payload: bytes) -> bytes:
+    """Decompress a codec-prefixed payload."""
+    header, data = payload[0], payload[1:]
+    if header == ZLIB:
+        return zlib.decompress(data)
+    if header in (ZSTD, ZSTD_DICT) and zstandard is not None:
+        dictionary = None
+        if header == ZSTD_DICT and settings.MESSAGE_ZSTD_DICT_PATH:
+            with open(settings.MESSAGE_ZSTD_DICT_PATH, 'rb') as f:
+                dictionary = zstandard.ZstdCompressionDict(f.read())
+        if header == ZSTD or dictionary is not None:
+            return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(data)
+    raise ValueError(
+        f'Cannot decode archive record with codec {header:#04x}; '
+        f'install zstandard and configure MESSAGE_ZSTD_DICT_PATH'
+    )
+
+
+def _message_row(message: dict, postgres: bool) -> dict:
+    """Convert a decoded message to bind values for the messages table."""
+    row = {column.name: message.get(column.name) for column in messages.columns}
+    for column in UUID_COLUMNS:
+        if row[column] is not None:
+            value = uuid.UUID(row[column])
+            row[column] = str(value) if postgres else value.bytes
+    for column in DATETIME_COLUMNS:
+        if row[column] is not None:
+            row[column] = datetime.fromisoformat(row[column])
+    return row
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    postgres = bind.dialect.name == 'postgresql'
+    entries = bind.execute(sa.text(
+        'SELECT segment, "offset", length FROM message_archives ORDER BY segment, "offset"'
+    )).all()
+    for segment, offset, length in entries:
+        payload = _decompress(_read_record(segment, offset, length))
+        rows = [_message_row(message, postgres) for message in json.loads(payload)]
+        if rows:
+            bind.execute(messages.insert(), rows)
+
+    op.drop_table('message_archives')
@@ -0,0 +1,37 @@
+"""Materialized session transcripts.
+
+Revision ID: 011_session_transcripts
+Revises: 010_message_archives
+Create Date: 2026-10-19 18:00:00.000000
+
+One row per session holding its messages as gzip-compressed NDJSON,
+appended to on send and rebuilt on read when stale. Rows are a cache:
+the table starts empty and can be truncated at any time.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from backend.src.models.guid import GUID
+
+# revision identifiers, used by Alembic.
+revision = '011_session_transcripts'
+down_revision = '010_message_archives'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'session_transcripts',
+        sa.Column('session_id', GUID(), sa.ForeignKey('sessions.id', ondelete='CASCADE'),
+                  primary_key=True),
+        sa.Column('data', sa.LargeBinary(), nullable=False),
+        sa.Column('message_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_seq', sa.Integer(), nullable=False),
+        sa.Column('chunks', sa.Integer(), nullable=False, server_default='1'),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('session_transcripts')
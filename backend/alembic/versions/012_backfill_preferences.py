@@ -0,0 +1,72 @@
+"""Backfill default preferences.
+
+Revision ID: 012_backfill_preferences
+Revises: 011_session_transcripts
+Create Date: 2026-10-19 19:00:00.000000
+
+Preferences are now created at registration instead of on first read.
+Users registered before that get their default row here.
+"""
+import uuid
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.src.models.guid import GUID
+
+# revision identifiers, used by Alembic.
+revision = '012_backfill_preferences'
+down_revision = '011_session_transcripts'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+users = sa.table('users', sa.column('id', GUID()))
+user_preferences = sa.table(
+    'user_preferences',
+    sa.column('id', GUID()),
+    sa.column('user_id', GUID()),
+    sa.column('theme', sa.String()),
+    sa.column('llm_model', sa.String()),
+    sa.column('llm_temperature', sa.Float()),
+    sa.column('llm_max_tokens', sa.Integer()),
+    sa.column('auto_sync', sa.Boolean()),
+    sa.column('notifications_enabled', sa.Boolean()),
+    sa.column('created_at', sa.DateTime()),
+    sa.column('updated_at', sa.DateTime()),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    user_ids = bind.execute(
+        sa.select(users.c.id).where(
+            ~sa.exists().where(user_preferences.c.user_id == users.c.id)
+        )
+    ).scalars().all()
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            'id': uuid.uuid4(),
+            'user_id': user_id,
+            'theme': 'dark',
+            'llm_model': 'claude-3-sonnet',
+            'llm_temperature': 0.7,
+            'llm_max_tokens': 2000,
+            'auto_sync': False,
+            'notifications_enabled': True,
+            'created_at': now,
+            'updated_at': now,
+        }
+        for user_id in user_ids
+    ]
+    for start in range(0, len(rows), BATCH_SIZE):
+        bind.execute(user_preferences.insert(), rows[start:start + BATCH_SIZE])
+
+
+def downgrade() -> None:
+    # Backfilled rows are indistinguishable from ones created at registration
+    pass
@@ -0,0 +1,27 @@
+"""Composite sessions index for owner session lists.
+
+Revision ID: 013_session_list_index
+Revises: 012_backfill_preferences
+Create Date: 2026-10-19 20:00:00.000000
+
+Session lists filter by owner and page newest first. The last message of
+each listed session is found through idx_messages_session_seq.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '013_session_list_index'
+down_revision = '012_backfill_preferences'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Leads with owner_id, so it replaces the single-column index
+    op.create_index('idx_sessions_owner_created', 'sessions', ['owner_id', 'created_at'])
+    op.drop_index('idx_sessions_owner', table_name='sessions')
+
+
+def downgrade() -> None:
+    op.create_index('idx_sessions_owner', 'sessions', ['owner_id'])
+    op.drop_index('idx_sessions_owner_created', table_name='sessions')
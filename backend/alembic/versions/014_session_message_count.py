@@ -0,0 +1,38 @@
+"""Maintained per-session message counter.
+
+Revision ID: 014_session_message_count
+Revises: 013_session_list_index
+Create Date: 2026-10-20 09:00:00.000000
+
+``sessions.message_count`` is kept up to date by every write that adds or
+removes messages, so session versions, lists and the dashboard read it
+instead of counting messages. Archived messages stay counted.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '014_session_message_count'
+down_revision = '013_session_list_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'sessions',
+        sa.Column('message_count', sa.Integer(), nullable=False, server_default='0')
+    )
+    op.execute("""
+        UPDATE sessions SET message_count =
+            (SELECT COUNT(*) FROM messages WHERE messages.session_id = sessions.id)
+            + COALESCE(
+                (SELECT message_count FROM message_archives
+                 WHERE message_archives.session_id = sessions.id), 0
+            )
+    """)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('sessions') as batch_op:
+        batch_op.drop_column('message_count')
@@ -0,0 +1,35 @@
+"""Add id as the tie-breaker column of the audit_log keyset indexes.
+
+Revision ID: 015_audit_keyset_id_column
+Revises: 014_session_message_count
+Create Date: 2026-10-19 22:00:00.000000
+
+Audit pages are ordered by (created_at, id). Without id in the index, rows
+sharing a created_at are sorted after the index scan.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '015_audit_keyset_id_column'
+down_revision = '014_session_message_count'
+branch_labels = None
+depends_on = None
+
+# (index, columns before this revision)
+INDEXES = [
+    ('idx_audit_user_created', ['user_id', 'created_at']),
+    ('idx_audit_entity_created', ['entity_type', 'entity_id', 'created_at']),
+    ('idx_audit_action_created', ['action', 'created_at']),
+]
+
+
+def upgrade() -> None:
+    for name, columns in INDEXES:
+        op.drop_index(name, table_name='audit_log')
+        op.create_index(name, 'audit_log', columns + ['id'])
+
+
+def downgrade() -> None:
+    for name, columns in INDEXES:
+        op.drop_index(name, table_name='audit_log')
+        op.create_index(name, 'audit_log', columns)
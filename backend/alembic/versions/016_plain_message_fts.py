@@ -0,0 +1,166 @@
+"""Store plain text in the SQLite message search index.
+
+Revision ID: 016_plain_message_fts
+Revises: 015_audit_keyset_id_column
+Create Date: 2026-10-19 23:00:00.000000
+
+SQLite only. Since 009 the FTS5 index and its triggers decompressed
+message content through text_content(), a function only the application
+registers, so any other writer failed on insert. The index now keeps its
+own plain-text copy: triggers index text rows as they are written, and the
+application indexes the rows it stores compressed. Compressed content is
+decoded here as of this revision.
+"""
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.src.config import settings
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+    zstandard = None
+
+# revision identifiers, used by Alembic.
+revision = '016_plain_message_fts'
+down_revision = '015_audit_keyset_id_column'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+# Compressed content header bytes
+ZLIB = 0x01
+ZSTD = 0x02
+ZSTD_DICT = 0x03
+
+PLAIN_FTS_STATEMENTS = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+        content,
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages BEGIN
+        INSERT INTO messages_fts(rowid, content)
+        SELECT new.rowid, new.content WHERE typeof(new.content) = 'text';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN
+        DELETE FROM messages_fts WHERE rowid = old.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE OF content ON messages BEGIN
+        DELETE FROM messages_fts WHERE rowid = old.rowid;
+        INSERT INTO messages_fts(rowid, content)
+        SELECT new.rowid, new.content WHERE typeof(new.content) = 'text';
+    END
+    """,
+]
+
+# Layout created by 009_message_compression
+DECOMPRESSING_FTS_STATEMENTS = [
+    """
+    CREATE VIEW IF NOT EXISTS messages_fts_source AS
+    SELECT rowid AS message_rowid, text_content(content) AS content FROM messages
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+        content,
+        content='messages_fts_source',
+        content_rowid='message_rowid',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages BEGIN
+        INSERT INTO messages_fts(rowid, content) VALUES (new.rowid, text_content(new.content));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN
+        INSERT INTO messages_fts(messages_fts, rowid, content)
+        VALUES ('delete', old.rowid, text_content(old.content));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE OF content ON messages BEGIN
+        INSERT INTO messages_fts(messages_fts, rowid, content)
+        VALUES ('delete', old.rowid, text_content(old.content));
+        INSERT INTO messages_fts(rowid, content) VALUES (new.rowid, text_content(new.content));
+    END
+    """,
+]
+
+DROP_STATEMENTS = [
+    "DROP TRIGGER IF EXISTS messages_fts_au",
+    "DROP TRIGGER IF EXISTS messages_fts_ad",
+    "DROP TRIGGER IF EXISTS messages_fts_ai",
+    "DROP TABLE IF EXISTS messages_fts",
+    "DROP VIEW IF EXISTS messages_fts_source",
+]
+
+
+def _decoder():
+    """Build a function decoding compressed message content."""
+    decompressors = {}
+    if zstandard is not None:
+        decompressors[ZSTD] = zstandard.ZstdDecompressor()
+        if settings.MESSAGE_ZSTD_DICT_PATH:
+            with open(settings.MESSAGE_ZSTD_DICT_PATH, 'rb') as f:
+                dictionary = zstandard.ZstdCompressionDict(f.read())
+            decompressors[ZSTD_DICT] = zstandard.ZstdDecompressor(dict_data=dictionary)
+
+    def decode(value: bytes) -> str:
+        value = bytes(value)
+        header, data = value[0], value[1:]
+        if header == ZLIB:
+            return zlib.decompress(data).decode('utf-8')
+        if header in decompressors:
+            return decompressors[header].decompress(data).decode('utf-8')
+        raise ValueError(
+            f'Cannot decode compressed text with codec {header:#04x}; '
+            f'install zstandard and configure MESSAGE_ZSTD_DICT_PATH'
+        )
+
+    return decode
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+
+    for statement in DROP_STATEMENTS + PLAIN_FTS_STATEMENTS:
+        op.execute(statement)
+
+    op.execute(
+        "INSERT INTO messages_fts(rowid, content) "
+        "SELECT rowid, content FROM messages WHERE typeof(content) = 'text'"
+    )
+    compressed = bind.execute(
+        sa.text("SELECT rowid, content FROM messages WHERE typeof(content) = 'blob'")
+    )
+    insert = sa.text("INSERT INTO messages_fts(rowid, content) VALUES (:rowid, :content)")
+    decode = _decoder()
+    while True:
+        rows = compressed.fetchmany(BATCH_SIZE)
+        if not rows:
+            break
+        bind.execute(insert, [
+            {'rowid': rowid, 'content': decode(content)} for rowid, content in rows
+        ])
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for statement in DROP_STATEMENTS + DECOMPRESSING_FTS_STATEMENTS:
+        op.execute(statement)
+    op.execute("INSERT INTO messages_fts(messages_fts) VALUES ('rebuild')")
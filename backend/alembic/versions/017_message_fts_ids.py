@@ -0,0 +1,194 @@
+"""Key the SQLite message search index on message ids.
+
+Revision ID: 017_message_fts_ids
+Revises: 016_plain_message_fts
+Create Date: 2026-10-19 23:30:00.000000
+
+SQLite only. The FTS5 index was keyed on the implicit messages.rowid,
+which VACUUM may renumber because messages has a BLOB primary key; search
+then returned other messages' rows and snippets. Each index entry now
+stores the message id (UNINDEXED), which searches join on, and takes its
+rowid from messages_fts_keys, whose INTEGER PRIMARY KEY survives VACUUM
+and lets the triggers delete entries by message id without scanning the
+index. Compressed content is decoded here as of this revision.
+"""
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.src.config import settings
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+    zstandard = None
+
+# revision identifiers, used by Alembic.
+revision = '017_message_fts_ids'
+down_revision = '016_plain_message_fts'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+# Compressed content header bytes
+ZLIB = 0x01
+ZSTD = 0x02
+ZSTD_DICT = 0x03
+
+ID_FTS_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS messages_fts_keys (
+        fts_rowid INTEGER PRIMARY KEY,
+        message_id BLOB NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+        content,
+        message_id UNINDEXED,
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages
+    WHEN typeof(new.content) = 'text' BEGIN
+        INSERT INTO messages_fts_keys(message_id) VALUES (new.id);
+        INSERT INTO messages_fts(rowid, content, message_id)
+        SELECT fts_rowid, new.content, new.id FROM messages_fts_keys WHERE message_id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN
+        DELETE FROM messages_fts
+        WHERE rowid = (SELECT fts_rowid FROM messages_fts_keys WHERE message_id = old.id);
+        DELETE FROM messages_fts_keys WHERE message_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE OF content ON messages BEGIN
+        DELETE FROM messages_fts
+        WHERE rowid = (SELECT fts_rowid FROM messages_fts_keys WHERE message_id = old.id);
+        DELETE FROM messages_fts_keys WHERE message_id = old.id;
+        INSERT INTO messages_fts_keys(message_id)
+        SELECT new.id WHERE typeof(new.content) = 'text';
+        INSERT INTO messages_fts(rowid, content, message_id)
+        SELECT fts_rowid, new.content, new.id FROM messages_fts_keys
+        WHERE message_id = new.id AND typeof(new.content) = 'text';
+    END
+    """,
+]
+
+# Layout created by 016_plain_message_fts
+ROWID_FTS_STATEMENTS = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+        content,
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages BEGIN
+        INSERT INTO messages_fts(rowid, content)
+        SELECT new.rowid, new.content WHERE typeof(new.content) = 'text';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN
+        DELETE FROM messages_fts WHERE rowid = old.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE OF content ON messages BEGIN
+        DELETE FROM messages_fts WHERE rowid = old.rowid;
+        INSERT INTO messages_fts(rowid, content)
+        SELECT new.rowid, new.content WHERE typeof(new.content) = 'text';
+    END
+    """,
+]
+
+DROP_TRIGGER_STATEMENTS = [
+    "DROP TRIGGER IF EXISTS messages_fts_au",
+    "DROP TRIGGER IF EXISTS messages_fts_ad",
+    "DROP TRIGGER IF EXISTS messages_fts_ai",
+]
+
+
+def _decoder():
+    """Build a function decoding compressed message content."""
+    decompressors = {}
+    if zstandard is not None:
+        decompressors[ZSTD] = zstandard.ZstdDecompressor()
+        if settings.MESSAGE_ZSTD_DICT_PATH:
+            with open(settings.MESSAGE_ZSTD_DICT_PATH, 'rb') as f:
+                dictionary = zstandard.ZstdCompressionDict(f.read())
+            decompressors[ZSTD_DICT] = zstandard.ZstdDecompressor(dict_data=dictionary)
+
+    def decode(value: bytes) -> str:
+        value = bytes(value)
+        header, data = value[0], value[1:]
+        if header == ZLIB:
+            return zlib.decompress(data).decode('utf-8')
+        if header in decompressors:
+            return decompressors[header].decompress(data).decode('utf-8')
+        raise ValueError(
+            f'Cannot decode compressed text with codec {header:#04x}; '
+            f'install zstandard and configure MESSAGE_ZSTD_DICT_PATH'
+        )
+
+    return decode
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+
+    for statement in DROP_TRIGGER_STATEMENTS + ["DROP TABLE IF EXISTS messages_fts"]:
+        op.execute(statement)
+    for statement in ID_FTS_STATEMENTS:
+        op.execute(statement)
+
+    op.execute("INSERT INTO messages_fts_keys(message_id) SELECT id FROM messages")
+    op.execute(
+        "INSERT INTO messages_fts(rowid, content, message_id) "
+        "SELECT messages_fts_keys.fts_rowid, messages.content, messages.id "
+        "FROM messages JOIN messages_fts_keys ON messages_fts_keys.message_id = messages.id "
+        "WHERE typeof(messages.content) = 'text'"
+    )
+    compressed = bind.execute(sa.text(
+        "SELECT messages_fts_keys.fts_rowid, messages.content, messages.id "
+        "FROM messages JOIN messages_fts_keys ON messages_fts_keys.message_id = messages.id "
+        "WHERE typeof(messages.content) = 'blob'"
+    ))
+    insert = sa.text(
+        "INSERT INTO messages_fts(rowid, content, message_id) VALUES (:rowid, :content, :id)"
+    )
+    decode = _decoder()
+    while True:
+        rows = compressed.fetchmany(BATCH_SIZE)
+        if not rows:
+            break
+        bind.execute(insert, [
+            {'rowid': rowid, 'content': decode(content), 'id': message_id}
+            for rowid, content, message_id in rows
+        ])
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for statement in DROP_TRIGGER_STATEMENTS:
+        op.execute(statement)
+    op.execute("ALTER TABLE messages_fts RENAME TO messages_fts_ids")
+    for statement in ROWID_FTS_STATEMENTS:
+        op.execute(statement)
+    op.execute(
+        "INSERT INTO messages_fts(rowid, content) "
+        "SELECT messages.rowid, messages_fts_ids.content "
+        "FROM messages_fts_ids JOIN messages ON messages.id = messages_fts_ids.message_id"
+    )
+    op.execute("DROP TABLE messages_fts_ids")
+    op.execute("DROP TABLE messages_fts_keys")
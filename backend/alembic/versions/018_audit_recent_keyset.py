@@ -0,0 +1,27 @@
+"""Add id to the audit_log created_at index.
+
+Revision ID: 018_audit_recent_keyset
+Revises: 017_message_fts_ids
+Create Date: 2026-10-20 00:00:00.000000
+
+The unfiltered audit feed is paged by (created_at, id) instead of by id
+alone, because rows written before 007 keep random uuid4 IDs. With id in
+the index each page is a range scan without a sort.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '018_audit_recent_keyset'
+down_revision = '017_message_fts_ids'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_audit_created', table_name='audit_log')
+    op.create_index('idx_audit_created', 'audit_log', ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_audit_created', table_name='audit_log')
+    op.create_index('idx_audit_created', 'audit_log', ['created_at'])
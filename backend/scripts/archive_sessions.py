@@ -0,0 +1,58 @@
+"""Move messages of long-archived sessions to cold storage.
+
+Sessions that have been ARCHIVED for at least ARCHIVE_MIN_AGE_DAYS have
+their messages written to compressed segment files under ARCHIVE_DIR and
+removed from the messages table. They stay readable through the API and
+are restored automatically when the session is used again. Safe to run at
+any time; sessions already in cold storage are skipped. Afterwards,
+segments holding records of restored or deleted sessions are compacted.
+
+Run daily from cron:
+    python -m backend.scripts.archive_sessions [--min-age-days 7] [--limit N]
+"""
+
+import argparse
+import logging
+from typing import Tuple
+
+from backend.src.config import settings
+from backend.src.database import SessionLocal
+from backend.src.services.archive_service import ArchiveService
+
+
+def run(min_age_days: int, limit: int = None) -> Tuple[int, int]:
+    """Archive every eligible session, then compact segments.
+
+    Args:
+        min_age_days: Days a session must have been archived
+        limit: Maximum sessions to archive
+
+    Returns:
+        Tuple of (sessions archived, segments removed)
+    """
+    db = SessionLocal()
+    try:
+        service = ArchiveService(db)
+        return service.archive_pending(min_age_days, limit), service.compact()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-age-days", type=int, default=settings.ARCHIVE_MIN_AGE_DAYS)
+    parser.add_argument("--limit", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    archived, compacted = run(args.min_age_days, args.limit)
+    print(f"sessions archived: {archived}")
+    print(f"segments compacted: {compacted}")
+
+
+if __name__ == "__main__":
+    main()
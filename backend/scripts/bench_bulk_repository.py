@@ -0,0 +1,123 @@
+"""Benchmark BaseRepository bulk methods against their per-row versions.
+
+For N projects, compares wall time and SQL statements issued by:
+
+* create   x N  vs  create_many
+* get_by_id x N vs  get_many
+* update   x N  vs  update_many
+* delete   x N  vs  delete_many
+
+In-memory SQLite has no network round trip, so it understates the gap;
+point ``--database-url`` at PostgreSQL for representative numbers.
+
+Usage:
+    python -m backend.scripts.bench_bulk_repository [--rows 2000] [--database-url URL]
+"""
+
+import argparse
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.src.models import Base, User
+from backend.src.repositories import ProjectRepository
+
+
+class StatementCounter:
+    """Count statements executed on an engine."""
+
+    def __init__(self, engine):
+        """Attach to an engine."""
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        """Count one statement."""
+        self.count += 1
+
+
+def setup_db(database_url: str):
+    """Create the schema and a project owner."""
+    if database_url.startswith("sqlite"):
+        engine = create_engine(
+            database_url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    else:
+        engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine, expire_on_commit=False)()
+
+    user = User(username="bench", email="bench@example.com", password_hash="x")
+    db.add(user)
+    db.commit()
+    return engine, db, user.id
+
+
+def measure(db, counter, fn):
+    """Run fn in a transaction that is rolled back; return (ms, statements)."""
+    db.expunge_all()
+    before = counter.count
+    start = time.perf_counter()
+    fn()
+    db.flush()
+    elapsed = (time.perf_counter() - start) * 1000
+    statements = counter.count - before
+    return elapsed, statements
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--database-url", default="sqlite:///:memory:")
+    args = parser.parse_args()
+
+    engine, db, owner_id = setup_db(args.database_url)
+    counter = StatementCounter(engine)
+    repo = ProjectRepository(db)
+    rows = [
+        {"owner_id": owner_id, "name": f"Project {i}", "status": "PLANNING"}
+        for i in range(args.rows)
+    ]
+
+    results = []
+
+    def per_row_create():
+        return [repo.create(row).id for row in rows]
+
+    results.append(("create", measure(db, counter, per_row_create)))
+    db.rollback()
+    results.append(("create_many", measure(db, counter, lambda: repo.create_many(rows))))
+
+    # Keep one committed set of rows for the read/update/delete comparisons
+    ids = repo.create_many(rows)
+    db.commit()
+
+    results.append(("get_by_id", measure(db, counter, lambda: [repo.get_by_id(i) for i in ids])))
+    results.append(("get_many", measure(db, counter, lambda: repo.get_many(ids))))
+
+    results.append(("update", measure(
+        db, counter, lambda: [repo.update(i, {"status": "ACTIVE"}) for i in ids]
+    )))
+    db.rollback()
+    results.append(("update_many", measure(
+        db, counter, lambda: repo.update_many(ids, {"status": "ACTIVE"})
+    )))
+    db.rollback()
+
+    results.append(("delete", measure(db, counter, lambda: [repo.delete(i) for i in ids])))
+    db.rollback()
+    results.append(("delete_many", measure(db, counter, lambda: repo.delete_many(ids))))
+    db.rollback()
+
+    print(f"{args.rows} rows on {engine.dialect.name}")
+    for name, (elapsed, statements) in results:
+        print(f"{name:>12}: {elapsed:9.1f} ms  {statements:6d} statements")
+
+
+if __name__ == "__main__":
+    main()
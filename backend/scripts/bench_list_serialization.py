@@ -0,0 +1,133 @@
+"""Benchmark list endpoint serialization: Pydantic per-row vs projected rows.
+
+Measures CPU time per request for a 500-message page (the max ``limit`` of
+``GET /sessions/{id}/messages``) through both response paths:
+
+* before: ORM entities -> ``MessageResponse.model_validate`` per row ->
+  FastAPI ``response_model`` validation -> stdlib json
+* after: column-projected query -> plain dicts -> orjson
+
+Usage:
+    python -m backend.scripts.bench_list_serialization [--messages 500] [--runs 50]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.src.api.responses import FastJSONResponse
+from backend.src.models import Base, User, Session, Message
+from backend.src.schemas.message import MessageResponse, MessageListResponse
+from backend.src.services.message_service import MessageService
+
+SAMPLE_TEXT = (
+    "What assumptions are you making about the problem, and how would the "
+    "design change if one of them turned out to be false? "
+)
+
+
+def setup_db(message_count: int):
+    """Create an in-memory database with one session of messages."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine, expire_on_commit=False)()
+
+    user = User(username="bench", email="bench@example.com", password_hash="x")
+    db.add(user)
+    db.flush()
+    session = Session(owner_id=user.id, name="Bench", mode="chat", status="ACTIVE")
+    db.add(session)
+    db.flush()
+
+    for i in range(message_count):
+        db.add(Message(
+            session_id=session.id,
+            user_id=user.id,
+            role="user" if i % 2 == 0 else "assistant",
+            content=SAMPLE_TEXT * 8,
+            message_type="text",
+        ))
+    db.commit()
+    return db, session.id
+
+
+def pydantic_path(service: MessageService, session_id, limit: int) -> bytes:
+    """Render a page the way the route did before the fast path."""
+    messages = service.get_messages_paginated(session_id, page=1, limit=limit)
+    payload = {
+        "messages": [MessageResponse.model_validate(m) for m in messages],
+        "total": len(messages),
+        "page": 1,
+        "limit": limit,
+    }
+    field = create_response_field(name="response", type_=MessageListResponse)
+    content = asyncio.run(serialize_response(field=field, response_content=payload))
+    return JSONResponse(content).body
+
+
+def fast_path(service: MessageService, session_id, limit: int) -> bytes:
+    """Render a page with projected rows and orjson."""
+    messages = service.get_messages_paginated_rows(session_id, page=1, limit=limit)
+    payload = {
+        "messages": messages,
+        "total": len(messages),
+        "page": 1,
+        "limit": limit,
+    }
+    return FastJSONResponse(payload).body
+
+
+def measure(fn, runs: int) -> list:
+    """Return CPU milliseconds per run."""
+    samples = []
+    for _ in range(runs):
+        start = time.process_time()
+        fn()
+        samples.append((time.process_time() - start) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    db, session_id = setup_db(args.messages)
+    service = MessageService(db, anthropic_api_key="")
+
+    # Warm up and sanity-check that both paths agree on the payload size
+    before_body = pydantic_path(service, session_id, args.messages)
+    after_body = fast_path(service, session_id, args.messages)
+    db.expunge_all()
+
+    results = {}
+    for name, fn in (("pydantic", pydantic_path), ("orjson rows", fast_path)):
+        samples = measure(lambda: (fn(service, session_id, args.messages), db.expunge_all()), args.runs)
+        results[name] = samples
+
+    print(f"{args.messages} messages per page, {args.runs} runs")
+    print(f"payload bytes: pydantic={len(before_body)} orjson={len(after_body)}")
+    for name, samples in results.items():
+        print(
+            f"{name:>12}: median {statistics.median(samples):7.2f} ms CPU/request, "
+            f"p95 {sorted(samples)[int(len(samples) * 0.95) - 1]:7.2f} ms"
+        )
+    speedup = statistics.median(results["pydantic"]) / statistics.median(results["orjson rows"])
+    print(f"speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark insert throughput of UUIDv4 against UUIDv7 primary keys.
+
+Inserts the same number of message-sized rows into two GUID-keyed tables,
+one with random ``uuid4`` keys and one with time-ordered ``uuid7`` keys,
+in committed batches (as the message and audit writers do), and reports
+rows per second and the final primary-key index size. Random keys split
+pages all over the index, while sequential keys append to its right
+edge.
+
+The gap grows once the index no longer fits in cache, so use enough rows
+(and ``--database-url`` pointing at PostgreSQL) for representative numbers.
+
+Usage:
+    python -m backend.scripts.bench_uuid7_inserts [--rows 500000] [--batch 1000]
+        [--database-url URL]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import Column, Integer, MetaData, Table, Text, create_engine, insert, text
+
+from backend.src.models.guid import GUID
+from backend.src.utils.ids import uuid7
+
+
+def build_table(metadata: MetaData, name: str) -> Table:
+    """Define a GUID-keyed table shaped like messages."""
+    return Table(
+        name, metadata,
+        Column("id", GUID(), primary_key=True),
+        Column("seq", Integer),
+        Column("content", Text),
+    )
+
+
+def pk_index_bytes(conn, table: Table) -> int:
+    """On-disk size of a table's primary-key index."""
+    if conn.dialect.name == "postgresql":
+        return conn.execute(
+            text("SELECT pg_relation_size(:i)"), {"i": f"{table.name}_pkey"}
+        ).scalar()
+    return conn.execute(text(
+        "SELECT COALESCE(SUM(pgsize), 0) FROM dbstat WHERE name IN "
+        "(SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :t)"
+    ), {"t": table.name}).scalar()
+
+
+def run(engine, table: Table, new_id, rows: int, batch: int) -> float:
+    """Insert ``rows`` rows in committed batches; return rows per second."""
+    start = time.perf_counter()
+    for offset in range(0, rows, batch):
+        with engine.begin() as conn:
+            conn.execute(insert(table), [
+                {"id": new_id(), "seq": i, "content": "x" * 200}
+                for i in range(offset, min(offset + batch, rows))
+            ])
+    return rows / (time.perf_counter() - start)
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500000)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    # dbstat needs a real file; an in-memory database reports no pages
+    path = None
+    database_url = args.database_url
+    if database_url is None:
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        database_url = f"sqlite:///{path}"
+    engine = create_engine(database_url)
+
+    metadata = MetaData()
+    layouts = {
+        "uuid4": (build_table(metadata, "bench_uuid4"), uuid.uuid4),
+        "uuid7": (build_table(metadata, "bench_uuid7"), uuid7),
+    }
+
+    try:
+        metadata.drop_all(engine)
+        metadata.create_all(engine)
+        print(f"{args.rows} rows in batches of {args.batch} on {engine.dialect.name}")
+        for name, (table, new_id) in layouts.items():
+            rate = run(engine, table, new_id, args.rows, args.batch)
+            with engine.connect() as conn:
+                size = pk_index_bytes(conn, table)
+            print(f"{name:>6}: {rate:10.0f} rows/s  pk index {size / 1024 / 1024:8.2f} MiB")
+    finally:
+        metadata.drop_all(engine)
+        engine.dispose()
+        if path:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
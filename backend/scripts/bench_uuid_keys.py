@@ -0,0 +1,153 @@
+"""Benchmark text UUID keys against 16-byte GUID keys.
+
+Builds two copies of a sessions -> messages pair of tables, one keyed by
+``String(36)`` (the previous layout) and one by ``GUID`` (native uuid on
+PostgreSQL, 16-byte BLOB on SQLite), fills them with the same IDs and
+reports, per layout:
+
+* index size of the messages table (primary key + session_id index)
+* point lookups by primary key
+* a join of every message to its session
+
+Usage:
+    python -m backend.scripts.bench_uuid_keys [--messages 200000] [--sessions 2000]
+        [--lookups 20000] [--database-url URL]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import (
+    Column, ForeignKey, Integer, MetaData, String, Table, Text, create_engine, func, insert,
+    select, text
+)
+
+from backend.src.models.guid import GUID
+
+BATCH_SIZE = 5000
+
+
+def build_tables(metadata: MetaData, prefix: str, id_type):
+    """Define a sessions/messages table pair keyed by ``id_type``."""
+    sessions = Table(
+        f"{prefix}_sessions", metadata,
+        Column("id", id_type, primary_key=True),
+        Column("name", String(255)),
+    )
+    messages = Table(
+        f"{prefix}_messages", metadata,
+        Column("id", id_type, primary_key=True),
+        Column("session_id", id_type, ForeignKey(sessions.c.id), nullable=False, index=True),
+        Column("seq", Integer),
+        Column("content", Text),
+    )
+    return sessions, messages
+
+
+def fill(conn, sessions, messages, session_ids, message_rows, as_text: bool):
+    """Insert the shared IDs into one layout."""
+    key = str if as_text else (lambda value: value)
+    conn.execute(insert(sessions), [{"id": key(i), "name": "Session"} for i in session_ids])
+    for start in range(0, len(message_rows), BATCH_SIZE):
+        conn.execute(insert(messages), [
+            {"id": key(message_id), "session_id": key(session_id), "seq": seq, "content": "x"}
+            for message_id, session_id, seq in message_rows[start:start + BATCH_SIZE]
+        ])
+
+
+def index_bytes(conn, table) -> int:
+    """Total on-disk size of a table's indexes."""
+    if conn.dialect.name == "postgresql":
+        return conn.execute(text("SELECT pg_indexes_size(:t)"), {"t": table.name}).scalar()
+    return conn.execute(text(
+        "SELECT COALESCE(SUM(pgsize), 0) FROM dbstat WHERE name IN "
+        "(SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :t)"
+    ), {"t": table.name}).scalar()
+
+
+def time_lookups(conn, messages, ids) -> float:
+    """Milliseconds for one primary-key lookup per ID."""
+    start = time.perf_counter()
+    for message_id in ids:
+        conn.execute(select(messages.c.seq).where(messages.c.id == message_id)).scalar()
+    return (time.perf_counter() - start) * 1000
+
+
+def time_join(conn, sessions, messages) -> float:
+    """Milliseconds to join every message to its session."""
+    query = select(func.count()).select_from(
+        messages.join(sessions, sessions.c.id == messages.c.session_id)
+    )
+    start = time.perf_counter()
+    conn.execute(query).scalar()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=200000)
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    # dbstat needs a real file; an in-memory database reports no pages
+    path = None
+    database_url = args.database_url
+    if database_url is None:
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        database_url = f"sqlite:///{path}"
+    engine = create_engine(database_url)
+
+    metadata = MetaData()
+    layouts = {
+        "String(36)": build_tables(metadata, "bench_text", String(36)),
+        "GUID": build_tables(metadata, "bench_guid", GUID()),
+    }
+
+    session_ids = [uuid.uuid4() for _ in range(args.sessions)]
+    message_rows = [
+        (uuid.uuid4(), session_ids[i % args.sessions], i // args.sessions + 1)
+        for i in range(args.messages)
+    ]
+    lookup_ids = [row[0] for row in random.sample(message_rows, min(args.lookups, args.messages))]
+
+    try:
+        metadata.drop_all(engine)
+        metadata.create_all(engine)
+        print(f"{args.messages} messages in {args.sessions} sessions on {engine.dialect.name}")
+        for name, (sessions, messages) in layouts.items():
+            as_text = name != "GUID"
+            with engine.begin() as conn:
+                fill(conn, sessions, messages, session_ids, message_rows, as_text)
+                if engine.dialect.name == "postgresql":
+                    conn.execute(text(f"ANALYZE {sessions.name}"))
+                    conn.execute(text(f"ANALYZE {messages.name}"))
+                else:
+                    conn.execute(text("ANALYZE"))
+
+            with engine.connect() as conn:
+                size = index_bytes(conn, messages)
+                keys = [str(i) for i in lookup_ids] if as_text else lookup_ids
+                lookups = time_lookups(conn, messages, keys)
+                join = time_join(conn, sessions, messages)
+
+            print(
+                f"{name:>10}: indexes {size / 1024 / 1024:8.2f} MiB  "
+                f"{len(keys)} lookups {lookups:8.1f} ms  join {join:8.1f} ms"
+            )
+    finally:
+        metadata.drop_all(engine)
+        engine.dispose()
+        if path:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Bulk-import history from an NDJSON export file.
+
+Loads projects, sessions and messages (the format written by
+``GET /api/export``) for an existing user without going through the
+message API, so no LLM calls are made. ``.gz`` files are decompressed on
+the fly.
+
+Usage:
+    python -m backend.scripts.import_history USERNAME FILE
+        [--batch-size 1000] [--transaction-size 10000]
+"""
+
+import argparse
+import gzip
+import sys
+
+from backend.src.config import settings
+from backend.src.database import SessionLocal
+from backend.src.repositories import UserRepository
+from backend.src.services.import_service import ImportService
+
+
+def print_progress(report: dict) -> None:
+    """Print a one-line progress update after each committed chunk."""
+    print(
+        f"\r{report['projects']} projects, {report['sessions']} sessions, "
+        f"{report['messages']} messages, {report['skipped']} skipped "
+        f"({report['rows_per_second']:.0f} rows/s)",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("username", help="user who will own the imported data")
+    parser.add_argument("file", help="NDJSON file (optionally .gz)")
+    parser.add_argument("--batch-size", type=int, default=settings.IMPORT_BATCH_SIZE)
+    parser.add_argument("--transaction-size", type=int, default=settings.IMPORT_TRANSACTION_SIZE)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        user = UserRepository(db).get_by_username(args.username)
+        if not user:
+            parser.error(f"User not found: {args.username}")
+
+        opener = gzip.open if args.file.endswith(".gz") else open
+        service = ImportService(
+            db,
+            batch_size=args.batch_size,
+            transaction_size=args.transaction_size,
+            progress=print_progress,
+        )
+        with opener(args.file, "rb") as lines:
+            report = service.import_lines(user.id, lines)
+    finally:
+        db.close()
+
+    print(file=sys.stderr)
+    print(
+        f"Imported {report['projects']} projects, {report['sessions']} sessions, "
+        f"{report['messages']} messages in {report['elapsed_seconds']:.1f}s "
+        f"({report['rows_per_second']:.0f} rows/s)"
+    )
+    for error in report["errors"]:
+        print(f"line {error['line']}: {error['error']}", file=sys.stderr)
+    if report["skipped"] > len(report["errors"]):
+        print(f"... {report['skipped'] - len(report['errors'])} more skipped lines", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Roll monthly partitions forward and apply retention.
+
+Creates the next PARTITION_PREMAKE_MONTHS partitions of ``audit_log`` and
+``messages`` and removes months past AUDIT_LOG_RETENTION_MONTHS /
+MESSAGE_RETENTION_MONTHS (0 disables retention for that table). Expired
+partitions are detached and dropped, or moved to PARTITION_ARCHIVE_SCHEMA
+when it is set. On SQLite only retention runs, as batched deletes.
+
+Run daily from cron or a scheduler:
+    python -m backend.scripts.partition_maintenance [--dry-run]
+"""
+
+import argparse
+import logging
+
+from backend.src.config import settings
+from backend.src.database import SessionLocal
+from backend.src.repositories import SessionRepository
+from backend.src.utils.partitions import PartitionManager, retention_cutoff
+
+logger = logging.getLogger(__name__)
+
+
+def retention_policy() -> dict:
+    """Months to keep per table; tables with 0 are skipped."""
+    return {
+        "audit_log": settings.AUDIT_LOG_RETENTION_MONTHS,
+        "messages": settings.MESSAGE_RETENTION_MONTHS,
+    }
+
+
+def run(dry_run: bool = False) -> dict:
+    """Run partition maintenance in one transaction.
+
+    Args:
+        dry_run: Roll back instead of committing
+
+    Returns:
+        Dict of table -> {"created": [...], "removed": [...]}
+    """
+    db = SessionLocal()
+    try:
+        manager = PartitionManager(db)
+        report = {}
+        for table, keep_months in retention_policy().items():
+            created = manager.ensure_partitions(table, settings.PARTITION_PREMAKE_MONTHS)
+            removed = []
+            if keep_months > 0:
+                removed = manager.apply_retention(
+                    table,
+                    keep_months,
+                    archive_schema=settings.PARTITION_ARCHIVE_SCHEMA or None,
+                )
+                if table == "messages" and removed:
+                    # Dropped rows bypassed the per-session message counters
+                    SessionRepository(db).recount_messages(retention_cutoff(keep_months))
+            report[table] = {"created": created, "removed": removed}
+
+        if dry_run:
+            db.rollback()
+        else:
+            db.commit()
+        return report
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="report without committing")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    for table, changes in run(dry_run=args.dry_run).items():
+        print(
+            f"{table}: created {changes['created'] or 'none'}, "
+            f"removed {changes['removed'] or 'none'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
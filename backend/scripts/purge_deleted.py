@@ -0,0 +1,50 @@
+"""Purge soft-deleted users, projects and sessions.
+
+Large deletes are soft-deleted by the API and purged by a background task.
+If the process stops before a purge finishes, the rows stay hidden but are
+not removed; this finishes them. Safe to run at any time.
+
+Run after deploys or daily from cron:
+    python -m backend.scripts.purge_deleted [--batch-size 1000]
+"""
+
+import argparse
+import logging
+
+from backend.src.config import settings
+from backend.src.database import SessionLocal
+from backend.src.services.purge_service import PurgeService
+
+
+def run(batch_size: int) -> dict:
+    """Purge every pending entity.
+
+    Args:
+        batch_size: Rows per DELETE statement
+
+    Returns:
+        Dict of entity type -> number of entities purged
+    """
+    db = SessionLocal()
+    try:
+        return PurgeService(db, batch_size).purge_pending()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=settings.PURGE_BATCH_SIZE)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    for entity_type, count in run(args.batch_size).items():
+        print(f"{entity_type}: purged {count}")
+
+
+if __name__ == "__main__":
+    main()
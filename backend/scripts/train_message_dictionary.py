@@ -0,0 +1,52 @@
+"""Train a zstd dictionary for compressing message content.
+
+Samples recent message bodies and writes a dictionary for
+MESSAGE_ZSTD_DICT_PATH. Once rows have been written with a dictionary it
+must stay available to read them: train once, then keep the file (a new
+dictionary needs a new path and a re-compression pass).
+
+Requires the optional ``zstandard`` package:
+    python -m backend.scripts.train_message_dictionary dict.zstd [--samples 20000] [--size 112640]
+"""
+
+import argparse
+
+from sqlalchemy import select
+
+from backend.src.database import SessionLocal
+from backend.src.models import Message
+from backend.src.models.compressed import zstandard
+
+
+def load_samples(limit: int) -> list:
+    """Load the most recent message bodies as UTF-8 bytes."""
+    db = SessionLocal()
+    try:
+        rows = db.execute(
+            select(Message.content).order_by(Message.id.desc()).limit(limit)
+        ).scalars()
+        return [content.encode("utf-8") for content in rows]
+    finally:
+        db.close()
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output")
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--size", type=int, default=110 * 1024, help="Dictionary size in bytes")
+    args = parser.parse_args()
+
+    if zstandard is None:
+        parser.error("zstandard is not installed")
+
+    samples = load_samples(args.samples)
+    dictionary = zstandard.train_dictionary(args.size, samples)
+    with open(args.output, "wb") as f:
+        f.write(dictionary.as_bytes())
+    print(f"Trained {len(dictionary.as_bytes())} byte dictionary on {len(samples)} messages")
+
+
+if __name__ == "__main__":
+    main()
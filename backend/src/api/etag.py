@@ -0,0 +1,72 @@
+"""Weak ETag helpers for conditional GET requests."""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from version parts.
+
+    Args:
+        *parts: Values identifying the representation version
+            (e.g. entity ID, ``updated_at``, message counters)
+
+    Returns:
+        Weak ETag header value
+    """
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def _opaque(tag: str) -> str:
+    """Strip the weak prefix for weak comparison."""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check ``If-None-Match`` against an ETag using weak comparison.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag
+
+    Returns:
+        True if the client's cached representation is current
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    current = _opaque(etag)
+    return any(_opaque(tag) == current for tag in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response.
+
+    Args:
+        etag: Current ETag
+
+    Returns:
+        304 response carrying the ETag
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "private, no-cache"},
+    )
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach ETag headers to a response.
+
+    Args:
+        response: Response to update
+        etag: Current ETag
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
@@ -0,0 +1,20 @@
+"""Custom response classes."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from backend.src.utils.serialization import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Routes opt in by returning this response directly with plain rows, which
+    skips per-row Pydantic model construction and ``response_model``
+    re-validation. Keep ``response_model`` on the route for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Render content to JSON bytes."""
+        return dumps(content)
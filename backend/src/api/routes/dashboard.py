@@ -0,0 +1,26 @@
+"""Dashboard API routes."""
+
+from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy.orm import Session
+
+from backend.src.database import get_db
+from backend.src.api.responses import FastJSONResponse
+from backend.src.services.dashboard_service import DashboardService
+from backend.src.dependencies import get_current_user
+from backend.src.schemas.dashboard import DashboardResponse
+from backend.src.models.user import User
+
+router = APIRouter(tags=["dashboard"])
+
+
+@router.get("/dashboard", response_model=DashboardResponse)
+async def get_dashboard(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the current user's project, session and message totals and recent sessions."""
+    try:
+        service = DashboardService(db)
+        return FastJSONResponse(service.get_dashboard(current_user.id))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Failed to load dashboard")
@@ -0,0 +1,55 @@
+"""Export API routes."""
+
+from datetime import datetime
+from typing import Iterator, Optional
+from uuid import UUID
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from backend.src.database import SessionLocal
+from backend.src.services.export_service import ExportService, export_file_format
+from backend.src.dependencies import get_current_user
+from backend.src.models.user import User
+
+router = APIRouter(tags=["export"])
+
+
+def stream_export(owner_id: UUID, compression: Optional[str]) -> Iterator[bytes]:
+    """Stream an export with a database session owned by the generator.
+
+    The request's session is closed once the endpoint returns, so the
+    generator opens its own for the lifetime of the download. Starlette
+    iterates sync generators in a worker thread, so slow exports do not
+    block the event loop.
+
+    Args:
+        owner_id: Owner user ID
+        compression: ``gzip``, ``zstd`` or None
+
+    Yields:
+        Export chunks
+    """
+    db = SessionLocal()
+    try:
+        yield from ExportService(db).iter_ndjson(owner_id, compression)
+    finally:
+        db.close()
+
+
+@router.get("/export")
+async def export_history(
+    compression: Optional[str] = Query(None, pattern="^(gzip|zstd)$"),
+    current_user: User = Depends(get_current_user)
+):
+    """Download all projects, sessions and messages as NDJSON."""
+    try:
+        extension, media_type = export_file_format(compression)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    filename = f"socrates-export-{datetime.utcnow():%Y%m%d}{extension}"
+    return StreamingResponse(
+        stream_export(current_user.id, compression),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,58 @@
+"""Bulk history import API routes."""
+
+import gzip
+import tempfile
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from backend.src.database import get_db
+from backend.src.services.import_service import ImportService
+from backend.src.dependencies import get_current_user
+from backend.src.schemas.history_import import ImportReport
+from backend.src.models.user import User
+from backend.src.config import settings
+
+router = APIRouter(tags=["import"])
+
+# Request bodies larger than this are spooled to disk while uploading
+SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
+
+@router.post("/import", response_model=ImportReport)
+async def import_history(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Import projects, sessions and messages from an NDJSON body.
+
+    Accepts the format produced by ``GET /export``; send
+    ``Content-Encoding: gzip`` for compressed uploads.
+    """
+    encoding = request.headers.get("content-encoding", "identity").lower()
+    if encoding not in ("identity", "gzip"):
+        raise HTTPException(status_code=415, detail=f"Unsupported content encoding: {encoding}")
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY) as body:
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > settings.IMPORT_MAX_BYTES:
+                raise HTTPException(status_code=413, detail="Import file too large")
+            body.write(chunk)
+        body.seek(0)
+
+        lines = gzip.GzipFile(fileobj=body) if encoding == "gzip" else body
+        service = ImportService(
+            db,
+            batch_size=settings.IMPORT_BATCH_SIZE,
+            transaction_size=settings.IMPORT_TRANSACTION_SIZE
+        )
+        try:
+            # Parsing and inserts are blocking; keep them off the event loop
+            return await run_in_threadpool(service.import_lines, current_user.id, lines)
+        except (OSError, EOFError):
+            raise HTTPException(status_code=400, detail="Invalid gzip body")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail="Failed to import history")
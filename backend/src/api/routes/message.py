@@ -5,10 +5,14 @@ from sqlalchemy.orm import Session
 from uuid import UUID
 
 from backend.src.database import get_db
+from backend.src.api.responses import FastJSONResponse
 from backend.src.services.message_service import MessageService
 from backend.src.services.session_service import SessionService
 from backend.src.dependencies import get_current_user
-from backend.src.schemas.message import MessageCreate, MessageResponse, MessageListResponse, SendMessageResponse
+from backend.src.schemas.message import (
+    MessageCreate, MessageResponse, MessageListResponse, MessageSyncResponse,
+    MessageTranscriptResponse, SendMessageResponse
+)
 from backend.src.models.user import User
 from backend.src.config import settings
 
@@ -39,24 +43,80 @@ async def get_messages(
         message_service = MessageService(db, settings.ANTHROPIC_API_KEY)
         total = message_service.count_messages(session_id=session_id)
 
-        messages = message_service.get_messages_paginated(
+        messages = message_service.get_messages_paginated_rows(
             session_id=session_id,
             page=page,
             limit=limit
         )
 
-        return {
-            "messages": [MessageResponse.model_validate(m) for m in messages],
+        return FastJSONResponse({
+            "messages": messages,
             "total": total,
             "page": page,
             "limit": limit
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to retrieve messages")
 
 
+@router.get("/sessions/{session_id}/messages/sync", response_model=MessageSyncResponse)
+async def sync_messages(
+    session_id: UUID,
+    after_seq: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=500),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get messages added after the client's last seen sequence number."""
+    try:
+        # Verify session ownership
+        session_service = SessionService(db)
+        session = session_service.get_session_by_id(session_id)
+
+        if not session:
+            raise HTTPException(status_code=404, detail="Session not found")
+
+        if session.owner_id != current_user.id:
+            raise HTTPException(status_code=403, detail="Not authorized to view this session")
+
+        message_service = MessageService(db, settings.ANTHROPIC_API_KEY)
+        return FastJSONResponse(
+            message_service.get_messages_since(session_id, after_seq=after_seq, limit=limit)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Failed to sync messages")
+
+
+@router.get("/sessions/{session_id}/transcript", response_model=MessageTranscriptResponse)
+async def get_transcript(
+    session_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get a session's whole message history in one response."""
+    try:
+        # Verify session ownership
+        session_service = SessionService(db)
+        session = session_service.get_session_by_id(session_id)
+
+        if not session:
+            raise HTTPException(status_code=404, detail="Session not found")
+
+        if session.owner_id != current_user.id:
+            raise HTTPException(status_code=403, detail="Not authorized to view this session")
+
+        message_service = MessageService(db, settings.ANTHROPIC_API_KEY)
+        return FastJSONResponse(message_service.get_transcript(session_id))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Failed to retrieve transcript")
+
+
 @router.post("/sessions/{session_id}/messages", response_model=SendMessageResponse)
 async def send_message(
     session_id: UUID,
@@ -1,11 +1,13 @@
 """Profile and settings API routes."""
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Depends, Request, Response
 from sqlalchemy.orm import Session
 
 from backend.src.database import get_db
+from backend.src.api.etag import make_etag, etag_matches, not_modified, set_etag
 from backend.src.services.user_service import UserService
 from backend.src.services.preference_service import PreferenceService
+from backend.src.services.purge_service import purge_in_background
 from backend.src.dependencies import get_current_user
 from backend.src.schemas.profile import (
     ProfileResponse, ProfileUpdate, ChangePasswordRequest,
@@ -18,11 +20,19 @@ router = APIRouter(tags=["profile"])
 
 @router.get("/profile", response_model=dict)
 async def get_profile(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get current user's profile."""
     try:
+        # The user row is already loaded by authentication
+        etag = make_etag(current_user.id, current_user.updated_at)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        set_etag(response, etag)
         return {
             "success": True,
             "data": ProfileResponse.model_validate(current_user),
@@ -65,6 +75,30 @@ async def update_profile(
         raise HTTPException(status_code=500, detail="Failed to update profile")
 
 
+@router.delete("/profile", response_model=dict)
+async def delete_account(
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete current user's account and all of its data."""
+    try:
+        service = UserService(db)
+        service.delete_user(current_user.id)
+
+        # The account is hidden immediately; its history is purged in batches
+        background_tasks.add_task(purge_in_background, "user", current_user.id)
+
+        return {
+            "success": True,
+            "data": None,
+            "message": "Account scheduled for deletion"
+        }
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Failed to delete account")
+
+
 @router.post("/profile/password", response_model=dict)
 async def change_password(
     request: ChangePasswordRequest,
@@ -105,13 +139,24 @@ async def change_password(
 
 @router.get("/settings", response_model=dict)
 async def get_settings(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get current user's preferences/settings."""
     try:
         service = PreferenceService(db)
-        preferences = service.get_or_create_preferences(current_user.id)
+        preferences = service.get_preferences_row(current_user.id)
+
+        if preferences is None:
+            service.get_or_create_preferences(current_user.id)
+            preferences = service.get_preferences_row(current_user.id)
+
+        etag = make_etag(preferences["id"], preferences["updated_at"])
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
 
         return {
             "success": True,
@@ -131,26 +176,9 @@ async def update_settings(
     """Update current user's preferences/settings."""
     try:
         service = PreferenceService(db)
-        preferences = service.get_or_create_preferences(current_user.id)
-
-        # Update fields
-        if request.theme is not None:
-            preferences.theme = request.theme
-        if request.llm_model is not None:
-            preferences.llm_model = request.llm_model
-        if request.llm_temperature is not None:
-            preferences.llm_temperature = request.llm_temperature
-        if request.llm_max_tokens is not None:
-            preferences.llm_max_tokens = request.llm_max_tokens
-        if request.ide_type is not None:
-            preferences.ide_type = request.ide_type
-        if request.auto_sync is not None:
-            preferences.auto_sync = request.auto_sync
-        if request.notifications_enabled is not None:
-            preferences.notifications_enabled = request.notifications_enabled
-
-        db.commit()
-        db.refresh(preferences)
+        service.update_preferences(current_user.id, **request.model_dump(exclude_none=True))
+        # Reloaded once: update_preferences drops the cached row
+        preferences = service.get_preferences_row(current_user.id)
 
         return {
             "success": True,
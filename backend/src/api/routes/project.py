@@ -1,11 +1,14 @@
 """Project API routes."""
 
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from backend.src.database import get_db
+from backend.src.api.responses import FastJSONResponse
+from backend.src.api.etag import make_etag, etag_matches, not_modified, set_etag
 from backend.src.services.project_service import ProjectService
+from backend.src.services.purge_service import purge_in_background
 from backend.src.dependencies import get_current_user
 from backend.src.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListResponse
 from backend.src.models.user import User
@@ -18,6 +21,7 @@ async def list_projects(
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
     status_filter: str = Query(None),
+    technology: str = Query(None, max_length=100),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -26,22 +30,25 @@ async def list_projects(
         service = ProjectService(db)
 
         # Get total count
-        total = service.count_projects(owner_id=current_user.id)
+        total = service.count_projects(
+            owner_id=current_user.id, status=status_filter, technology=technology
+        )
 
         # Get paginated projects
-        projects = service.get_projects_paginated(
+        projects = service.get_projects_paginated_rows(
             owner_id=current_user.id,
             page=page,
             limit=limit,
-            status=status_filter
+            status=status_filter,
+            technology=technology
         )
 
-        return {
-            "projects": [ProjectResponse.model_validate(p) for p in projects],
+        return FastJSONResponse({
+            "projects": projects,
             "total": total,
             "page": page,
             "limit": limit
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to list projects")
 
@@ -79,21 +86,30 @@ async def create_project(
 @router.get("/projects/{project_id}", response_model=dict)
 async def get_project(
     project_id: UUID,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get project details by ID."""
     try:
         service = ProjectService(db)
-        project = service.get_project_by_id(project_id)
+        version = service.get_project_version(project_id)
 
-        if not project:
+        if not version:
             raise HTTPException(status_code=404, detail="Project not found")
 
         # Check authorization
-        if project.owner_id != current_user.id:
+        if version.owner_id != current_user.id:
             raise HTTPException(status_code=403, detail="Not authorized to view this project")
 
+        etag = make_etag(project_id, version.updated_at)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        project = service.get_project_by_id(project_id)
+        set_etag(response, etag)
+
         return {
             "success": True,
             "data": ProjectResponse.model_validate(project),
@@ -115,28 +131,21 @@ async def update_project(
     """Update project details."""
     try:
         service = ProjectService(db)
-        project = service.get_project_by_id(project_id)
+        project = service.update_project(
+            project_id,
+            current_user.id,
+            name=request.name,
+            description=request.description,
+            status=request.status,
+            technology_stack=request.technology_stack
+        )
 
         if not project:
+            # Only the failure path pays for a lookup to tell 404 from 403
+            if service.get_project_by_id(project_id):
+                raise HTTPException(status_code=403, detail="Not authorized to update this project")
             raise HTTPException(status_code=404, detail="Project not found")
 
-        # Check authorization
-        if project.owner_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Not authorized to update this project")
-
-        # Update fields
-        if request.name is not None:
-            project.name = request.name
-        if request.description is not None:
-            project.description = request.description
-        if request.status is not None:
-            project.status = request.status
-        if request.technology_stack is not None:
-            project.technology_stack = request.technology_stack
-
-        db.commit()
-        db.refresh(project)
-
         return {
             "success": True,
             "data": ProjectResponse.model_validate(project),
@@ -144,6 +153,8 @@ async def update_project(
         }
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail="Failed to update project")
@@ -152,6 +163,7 @@ async def update_project(
 @router.delete("/projects/{project_id}", response_model=dict)
 async def delete_project(
     project_id: UUID,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -167,9 +179,14 @@ async def delete_project(
         if project.owner_id != current_user.id:
             raise HTTPException(status_code=403, detail="Not authorized to delete this project")
 
-        # Delete project (cascade will delete sessions and messages)
-        service.delete_project(project_id)
-        db.commit()
+        # Small projects cascade in the database; large ones are purged in batches
+        if not service.delete_project(project_id, current_user.id):
+            background_tasks.add_task(purge_in_background, "project", project_id)
+            return {
+                "success": True,
+                "data": None,
+                "message": "Project scheduled for deletion"
+            }
 
         return {
             "success": True,
@@ -0,0 +1,44 @@
+"""Search API routes."""
+
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Query
+from sqlalchemy.orm import Session
+from uuid import UUID
+
+from backend.src.database import get_db
+from backend.src.api.responses import FastJSONResponse
+from backend.src.services.search_service import SearchService
+from backend.src.dependencies import get_current_user
+from backend.src.schemas.search import SearchResponse
+from backend.src.models.user import User
+
+router = APIRouter(tags=["search"])
+
+
+@router.get("/search", response_model=SearchResponse)
+async def search_messages(
+    q: str = Query(..., min_length=1, max_length=200),
+    project_id: Optional[UUID] = None,
+    session_id: Optional[UUID] = None,
+    page: int = Query(1, ge=1),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Search the current user's message history."""
+    try:
+        search_service = SearchService(db)
+        return FastJSONResponse(
+            search_service.search_messages(
+                owner_id=current_user.id,
+                query=q,
+                project_id=project_id,
+                session_id=session_id,
+                page=page,
+                limit=limit
+            )
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Failed to search messages")
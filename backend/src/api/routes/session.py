@@ -1,11 +1,17 @@
 """Session API routes."""
 
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Depends, Query, Request, Response
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from uuid import UUID
 
+from backend.src.cache import invalidate
 from backend.src.database import get_db
+from backend.src.api.responses import FastJSONResponse
+from backend.src.api.etag import make_etag, etag_matches, not_modified, set_etag
 from backend.src.services.session_service import SessionService
+from backend.src.services.purge_service import purge_in_background
+from backend.src.services.archive_service import ArchiveService
 from backend.src.dependencies import get_current_user
 from backend.src.schemas.session import (
     SessionCreate, SessionUpdate, SessionToggleMode, SessionResponse, SessionListResponse
@@ -21,10 +27,15 @@ async def list_sessions(
     limit: int = Query(10, ge=1, le=100),
     project_id: UUID = Query(None),
     status_filter: str = Query(None),
+    include_last_message: bool = Query(False),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """List sessions owned by current user with pagination."""
+    """List sessions owned by current user with pagination.
+
+    With ``include_last_message``, each session also carries its message
+    count and a preview of its last message.
+    """
     try:
         service = SessionService(db)
 
@@ -32,20 +43,21 @@ async def list_sessions(
         total = service.count_sessions(owner_id=current_user.id, project_id=project_id)
 
         # Get paginated sessions
-        sessions = service.get_sessions_paginated(
+        sessions = service.get_sessions_paginated_rows(
             owner_id=current_user.id,
             project_id=project_id,
             page=page,
             limit=limit,
-            status=status_filter
+            status=status_filter,
+            include_last_message=include_last_message
         )
 
-        return {
-            "sessions": [SessionResponse.model_validate(s) for s in sessions],
+        return FastJSONResponse({
+            "sessions": sessions,
             "total": total,
             "page": page,
             "limit": limit
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to list sessions")
 
@@ -84,24 +96,34 @@ async def create_session(
 @router.get("/sessions/{session_id}", response_model=dict)
 async def get_session(
     session_id: UUID,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get session details with message count."""
     try:
         service = SessionService(db)
-        session = service.get_session_by_id(session_id)
+        version = service.get_session_version(session_id)
 
-        if not session:
+        if not version:
             raise HTTPException(status_code=404, detail="Session not found")
 
         # Check authorization
-        if session.owner_id != current_user.id:
+        if version.owner_id != current_user.id:
             raise HTTPException(status_code=403, detail="Not authorized to view this session")
 
+        etag = make_etag(session_id, version.updated_at, version.message_seq)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        session = service.get_session_by_id(session_id)
+        data = SessionResponse.model_validate(session)
+        set_etag(response, etag)
+
         return {
             "success": True,
-            "data": SessionResponse.model_validate(session),
+            "data": data,
             "message": "Session retrieved successfully"
         }
     except HTTPException:
@@ -135,9 +157,15 @@ async def update_session(
         if request.mode is not None:
             session.mode = request.mode
         if request.status is not None:
+            if session.status == "ARCHIVED" and request.status != "ARCHIVED":
+                # Bring messages moved to cold storage back to the hot table
+                ArchiveService(db).restore_session(session_id)
+            elif request.status == "ARCHIVED" and session.status != "ARCHIVED":
+                session.archived_at = func.now()
             session.status = request.status
 
         db.commit()
+        invalidate("sessions", current_user.id)
         db.refresh(session)
 
         return {
@@ -162,24 +190,14 @@ async def toggle_session_mode(
     """Toggle session mode (chat, question, teaching, review)."""
     try:
         service = SessionService(db)
-        session = service.get_session_by_id(session_id)
+        session = service.toggle_mode(session_id, current_user.id, request.mode)
 
         if not session:
+            # Only the failure path pays for a lookup to tell 404 from 403
+            if service.get_session_by_id(session_id):
+                raise HTTPException(status_code=403, detail="Not authorized to update this session")
             raise HTTPException(status_code=404, detail="Session not found")
 
-        # Check authorization
-        if session.owner_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Not authorized to update this session")
-
-        # Validate mode
-        if request.mode not in ["chat", "question", "teaching", "review"]:
-            raise HTTPException(status_code=400, detail="Invalid mode")
-
-        # Update mode
-        session.mode = request.mode
-        db.commit()
-        db.refresh(session)
-
         return {
             "success": True,
             "data": SessionResponse.model_validate(session),
@@ -187,6 +205,8 @@ async def toggle_session_mode(
         }
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail="Failed to toggle session mode")
@@ -195,6 +215,7 @@ async def toggle_session_mode(
 @router.delete("/sessions/{session_id}", response_model=dict)
 async def delete_session(
     session_id: UUID,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -210,9 +231,14 @@ async def delete_session(
         if session.owner_id != current_user.id:
             raise HTTPException(status_code=403, detail="Not authorized to delete this session")
 
-        # Delete session (cascade will delete messages)
-        service.delete_session(session_id)
-        db.commit()
+        # Small sessions cascade in the database; large ones are purged in batches
+        if not service.delete_session(session_id, current_user.id):
+            background_tasks.add_task(purge_in_background, "session", session_id)
+            return {
+                "success": True,
+                "data": None,
+                "message": "Session scheduled for deletion"
+            }
 
         return {
             "success": True,
@@ -0,0 +1,29 @@
+"""Caching layer.
+
+``Cache`` adds namespaced keys, JSON serialization, single-flight loading
+and scoped invalidation on top of a backend: ``MemoryBackend`` (per
+process LRU with TTL) or ``RedisBackend`` (shared). Services opt in with
+the ``cached`` decorator and call ``invalidate`` after committing writes.
+Configured by the CACHE_* settings.
+"""
+
+from backend.src.cache.backends import MemoryBackend, RedisBackend
+from backend.src.cache.cache import (
+    Cache,
+    build_cache,
+    cached,
+    configure_cache,
+    get_cache,
+    invalidate,
+)
+
+__all__ = [
+    "Cache",
+    "MemoryBackend",
+    "RedisBackend",
+    "build_cache",
+    "cached",
+    "configure_cache",
+    "get_cache",
+    "invalidate",
+]
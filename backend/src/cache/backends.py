@@ -0,0 +1,137 @@
+"""Cache storage backends.
+
+Backends store opaque bytes under string keys and know nothing about
+serialization or namespaces (see ``Cache``). All of them implement:
+
+* ``get(key)`` / ``get_many(keys)``: value bytes, None / absent on miss
+* ``set(key, value, ttl)``: store with a time to live in seconds
+* ``add(key, value, ttl)``: store only if absent; True if stored
+* ``delete(*keys)``
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - redis is optional
+    redis = None
+
+
+class MemoryBackend:
+    """In-process LRU cache with per-entry expiry.
+
+    Entries are evicted least recently used first once ``max_entries`` is
+    reached; expired entries are dropped when read. Not shared between
+    worker processes.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        """Initialize memory backend.
+
+        Args:
+            max_entries: Maximum number of entries kept
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str, now: float) -> Optional[bytes]:
+        """Read an entry, dropping it if expired. Caller holds the lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._get(key, time.monotonic())
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        now = time.monotonic()
+        with self._lock:
+            found = {key: self._get(key, now) for key in keys}
+        return {key: value for key, value in found.items() if value is not None}
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        with self._lock:
+            if self._get(key, time.monotonic()) is not None:
+                return False
+        self.set(key, value, ttl)
+        return True
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisBackend:
+    """Redis-backed cache shared by all workers."""
+
+    def __init__(self, client):
+        """Initialize Redis backend.
+
+        Args:
+            client: ``redis.Redis`` client (or a compatible fake)
+        """
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 0.5) -> "RedisBackend":
+        """Connect to Redis by URL.
+
+        Args:
+            url: Redis URL, e.g. ``redis://redis:6379/0``
+            timeout: Connect and socket timeout in seconds
+
+        Returns:
+            Redis backend
+
+        Raises:
+            RuntimeError: If the redis package is not installed
+        """
+        if redis is None:
+            raise RuntimeError("redis is not installed")
+        return cls(redis.Redis.from_url(
+            url, socket_timeout=timeout, socket_connect_timeout=timeout
+        ))
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        values = self.client.mget(keys)
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.client.set(key, value, px=max(1, int(ttl * 1000)))
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        return bool(self.client.set(key, value, px=max(1, int(ttl * 1000)), nx=True))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*keys)
@@ -0,0 +1,339 @@
+"""Cache front end: namespaced keys, serialization, single-flight and invalidation."""
+
+import functools
+import inspect
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from backend.src.config import settings
+from backend.src.utils.serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class Cache:
+    """Namespaced JSON cache over a storage backend.
+
+    Values are stored as JSON, so every read, including the first one that
+    filled the cache, returns JSON types (UUIDs and datetimes come back as
+    strings). Backend errors never reach callers: they are logged, count
+    as misses, and the backend is bypassed for ``retry_after`` seconds.
+
+    Scoped entries (see ``scope_token``) can be invalidated together, e.g.
+    every cached page of one user's project list.
+    """
+
+    def __init__(
+        self,
+        backend,
+        prefix: str = "socrates",
+        default_ttl: float = 300,
+        lock_timeout: float = 5.0,
+        retry_after: float = 5.0,
+    ):
+        """Initialize cache.
+
+        Args:
+            backend: Storage backend (``MemoryBackend``, ``RedisBackend``)
+            prefix: Prefix of every key, to share a Redis database safely
+            default_ttl: Seconds entries live unless a TTL is given
+            lock_timeout: Seconds a loader may hold the fill lock
+            retry_after: Seconds the backend is bypassed after an error
+        """
+        self.backend = backend
+        self.prefix = prefix
+        self.default_ttl = default_ttl
+        self.lock_timeout = lock_timeout
+        self.retry_after = retry_after
+        self._down_until = 0.0
+        self._fill_locks: Dict[str, threading.Lock] = {}
+        self._fill_locks_guard = threading.Lock()
+
+    def key(self, namespace: str, key: Any) -> str:
+        """Build the backend key for a namespaced key."""
+        return f"{self.prefix}:{namespace}:{key}"
+
+    def _call(self, operation: str, *args, default=None):
+        """Run a backend operation, failing open while the backend is down."""
+        if time.monotonic() < self._down_until:
+            return default
+        try:
+            return getattr(self.backend, operation)(*args)
+        except Exception as e:
+            self._down_until = time.monotonic() + self.retry_after
+            logger.warning(f"Cache {operation} failed, bypassing for {self.retry_after}s: {e}")
+            return default
+
+    def get(self, namespace: str, key: Any, default: Any = None) -> Any:
+        """Get a cached value.
+
+        Args:
+            namespace: Key namespace
+            key: Key within the namespace
+            default: Returned on a miss
+
+        Returns:
+            Cached value or ``default``
+        """
+        data = self._call("get", self.key(namespace, key))
+        return default if data is None else loads(data)
+
+    def get_many(self, namespace: str, keys: Iterable[Any]) -> Dict[Any, Any]:
+        """Get several cached values in one round trip.
+
+        Args:
+            namespace: Key namespace
+            keys: Keys within the namespace
+
+        Returns:
+            Dict of key -> value for the keys that were cached
+        """
+        full_keys = {self.key(namespace, key): key for key in keys}
+        found = self._call("get_many", list(full_keys), default={})
+        return {full_keys[full_key]: loads(data) for full_key, data in found.items()}
+
+    def set(self, namespace: str, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache a value.
+
+        Args:
+            namespace: Key namespace
+            key: Key within the namespace
+            value: JSON-serializable value
+            ttl: Seconds to keep it (defaults to ``default_ttl``)
+        """
+        self._call("set", self.key(namespace, key), dumps(value), ttl or self.default_ttl)
+
+    def delete(self, namespace: str, *keys: Any) -> None:
+        """Remove cached values.
+
+        Args:
+            namespace: Key namespace
+            *keys: Keys within the namespace
+        """
+        self._call("delete", *[self.key(namespace, key) for key in keys])
+
+    def get_or_set(
+        self,
+        namespace: str,
+        key: Any,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """Get a cached value, loading and caching it on a miss.
+
+        Concurrent misses for the same key are collapsed: within a process
+        callers wait on a lock, and across processes the first one takes a
+        short-lived fill lock in the backend while the others poll for the
+        value (falling back to loading themselves after ``lock_timeout``).
+
+        Args:
+            namespace: Key namespace
+            key: Key within the namespace
+            loader: Computes the value on a miss
+            ttl: Seconds to keep it (defaults to ``default_ttl``)
+
+        Returns:
+            Cached or freshly loaded value (as JSON types)
+        """
+        value = self.get(namespace, key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        full_key = self.key(namespace, key)
+        with self._fill_lock(full_key):
+            value = self.get(namespace, key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+            lock_key = f"{full_key}:lock"
+            locked = self._call("add", lock_key, b"1", self.lock_timeout, default=True)
+            if not locked:
+                value = self._wait_for(namespace, key, lock_key)
+                if value is not _MISSING:
+                    return value
+            try:
+                data = dumps(loader())
+                self._call("set", full_key, data, ttl or self.default_ttl)
+            finally:
+                if locked:
+                    self._call("delete", lock_key)
+            return loads(data)
+
+    def _fill_lock(self, full_key: str) -> threading.Lock:
+        """Get the in-process lock serializing loads of one key."""
+        with self._fill_locks_guard:
+            if len(self._fill_locks) > 10000:
+                # Drop idle locks so the table does not grow without bound
+                self._fill_locks = {k: v for k, v in self._fill_locks.items() if v.locked()}
+            return self._fill_locks.setdefault(full_key, threading.Lock())
+
+    def _wait_for(self, namespace: str, key: Any, lock_key: str) -> Any:
+        """Poll for a value another process is loading."""
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(0.02)
+            value = self.get(namespace, key, _MISSING)
+            if value is not _MISSING:
+                return value
+            if self._call("get", lock_key) is None:
+                break
+        return _MISSING
+
+    def scope_token(self, namespace: str, scope: Any) -> str:
+        """Get the current generation token of a scope.
+
+        Scoped keys embed the token, so dropping it (``invalidate``) makes
+        every entry written under the old token unreachable at once; they
+        expire on their own. A reader that loaded data before a write
+        stores it under the old token, so it cannot resurrect stale data.
+
+        Args:
+            namespace: Key namespace
+            scope: Scope within the namespace, e.g. an owner ID
+
+        Returns:
+            Generation token
+        """
+        token_key = self.key(namespace, f"{scope}:token")
+        token = self._call("get", token_key)
+        if token is None:
+            token = uuid.uuid4().hex.encode()
+            if not self._call("add", token_key, token, 24 * 3600, default=False):
+                token = self._call("get", token_key) or token
+        return token.decode() if isinstance(token, bytes) else token
+
+    def invalidate(self, namespace: str, scope: Any) -> None:
+        """Drop every entry cached under a scope.
+
+        Args:
+            namespace: Key namespace
+            scope: Scope within the namespace
+        """
+        self._call("delete", self.key(namespace, f"{scope}:token"))
+
+
+_cache: Optional[Cache] = None
+_cache_configured = False
+_configure_lock = threading.Lock()
+
+
+def build_cache() -> Optional[Cache]:
+    """Build the cache described by the CACHE_* settings.
+
+    Returns:
+        Cache, or None if CACHE_BACKEND is ``none``
+
+    Raises:
+        ValueError: If CACHE_BACKEND is unknown
+    """
+    from backend.src.cache.backends import MemoryBackend, RedisBackend
+
+    name = settings.CACHE_BACKEND.lower()
+    if name == "none":
+        return None
+    if name == "memory":
+        backend = MemoryBackend(settings.CACHE_MAX_ENTRIES)
+    elif name == "redis":
+        backend = RedisBackend.from_url(settings.CACHE_REDIS_URL)
+    else:
+        raise ValueError(f"Unknown CACHE_BACKEND: {settings.CACHE_BACKEND}")
+    return Cache(
+        backend,
+        prefix=settings.CACHE_KEY_PREFIX,
+        default_ttl=settings.CACHE_DEFAULT_TTL,
+        lock_timeout=settings.CACHE_LOCK_TIMEOUT,
+        retry_after=settings.CACHE_RETRY_AFTER,
+    )
+
+
+def get_cache() -> Optional[Cache]:
+    """Get the process-wide cache, building it on first use.
+
+    Returns:
+        Cache, or None if caching is disabled
+    """
+    global _cache, _cache_configured
+    if not _cache_configured:
+        with _configure_lock:
+            if not _cache_configured:
+                _cache = build_cache()
+                _cache_configured = True
+    return _cache
+
+
+def configure_cache(cache: Optional[Cache]) -> None:
+    """Replace the process-wide cache (None disables caching).
+
+    Args:
+        cache: Cache to use
+    """
+    global _cache, _cache_configured
+    with _configure_lock:
+        _cache = cache
+        _cache_configured = True
+
+
+def invalidate(namespace: str, scope: Any) -> None:
+    """Drop every entry cached under a scope, if caching is enabled.
+
+    Call after the write has been committed.
+
+    Args:
+        namespace: Key namespace
+        scope: Scope within the namespace
+    """
+    cache = get_cache()
+    if cache is not None:
+        cache.invalidate(namespace, scope)
+
+
+def cached(namespace: str, scope: Optional[str] = None, ttl: Optional[float] = None):
+    """Cache a function's result keyed by its arguments.
+
+    Arguments are bound to the signature (``self`` is skipped), so
+    positional and keyword calls share entries. With ``scope`` naming an
+    argument, entries are grouped by that argument's value and dropped
+    together by ``invalidate(namespace, value)``. Results must be
+    JSON-serializable and are returned as JSON types.
+
+    Usage:
+        @cached("projects", scope="owner_id")
+        def get_projects_paginated_rows(self, owner_id, page=1, limit=10): ...
+
+        invalidate("projects", owner_id)  # after committing a change
+
+    Args:
+        namespace: Key namespace
+        scope: Name of the argument whose value scopes invalidation
+        ttl: Seconds to keep entries (defaults to CACHE_DEFAULT_TTL)
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_cache()
+            if cache is None:
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = {k: v for k, v in bound.arguments.items() if k != "self"}
+
+            entry_namespace = f"{namespace}:{func.__name__}"
+            if scope is not None:
+                scope_value = arguments[scope]
+                token = cache.scope_token(namespace, scope_value)
+                entry_namespace = f"{entry_namespace}:{scope_value}:{token}"
+            key = ":".join(f"{name}={value}" for name, value in arguments.items())
+
+            return cache.get_or_set(entry_namespace, key, lambda: func(*args, **kwargs), ttl)
+
+        return wrapper
+
+    return decorator
@@ -1,8 +1,11 @@
 """Configuration settings for Socrates 8.0 backend."""
 
+from pathlib import Path
 from pydantic_settings import BaseSettings
 from typing import List
 
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
 
 class Settings(BaseSettings):
     """Application settings."""
@@ -17,13 +20,78 @@ class Settings(BaseSettings):
 
     # Anthropic API
     ANTHROPIC_API_KEY: str = ""
+    LLM_DEFAULT_MODEL: str = "claude-3-5-sonnet-20241022"
 
     # CORS
     CORS_ORIGINS: str = "http://localhost:3000"
 
+    # Response compression
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    COMPRESSION_CONTENT_TYPES: str = (
+        "application/json,application/x-ndjson,text/event-stream,"
+        "text/plain,text/html,text/css,application/javascript"
+    )
+
+    # Audit log writer
+    AUDIT_LOG_ASYNC: bool = True
+    AUDIT_LOG_FLUSH_INTERVAL: float = 1.0
+    AUDIT_LOG_BATCH_SIZE: int = 500
+    AUDIT_LOG_MAX_QUEUE: int = 10000
+    AUDIT_LOG_SPILL_DIR: str = str(BACKEND_DIR / "var" / "audit_spill")  # One spill file per process
+
+    # Partition maintenance (PostgreSQL monthly partitions)
+    PARTITION_PREMAKE_MONTHS: int = 3
+    PARTITION_ARCHIVE_SCHEMA: str = ""  # Empty drops expired partitions
+    AUDIT_LOG_RETENTION_MONTHS: int = 13
+    MESSAGE_RETENTION_MONTHS: int = 0  # 0 keeps messages indefinitely
+
+    # Bulk history import
+    IMPORT_BATCH_SIZE: int = 1000
+    IMPORT_TRANSACTION_SIZE: int = 10000
+    IMPORT_MAX_BYTES: int = 512 * 1024 * 1024
+
+    # Deletion: larger deletes are soft-deleted and purged in the background
+    DELETE_INLINE_MAX_ROWS: int = 5000
+    PURGE_BATCH_SIZE: int = 1000
+
+    # Message content compression at rest; SQLite only (PostgreSQL stores text, TOAST lz4)
+    MESSAGE_COMPRESSION_ENABLED: bool = True
+    MESSAGE_COMPRESSION_MIN_BYTES: int = 1024
+    MESSAGE_ZSTD_LEVEL: int = 3
+    MESSAGE_ZSTD_DICT_PATH: str = ""  # Trained dictionary; keep it once rows use it
+
+    # Cold storage: messages of archived sessions move to compressed segment files
+    ARCHIVE_DIR: str = str(BACKEND_DIR / "var" / "archive")  # Sole copy of archived messages
+    ARCHIVE_SEGMENT_MAX_BYTES: int = 256 * 1024 * 1024
+    ARCHIVE_MIN_AGE_DAYS: int = 7  # Sessions archived at least this long are moved
+    ARCHIVE_COMPACT_MAX_DEAD_RATIO: float = 0.0  # Dead bytes left per segment; 0 drops deleted data
+    ARCHIVE_COMPACT_MIN_AGE_SECONDS: int = 3600  # Segments written to more recently are skipped
+
+    # Materialized session transcripts (whole-history reads)
+    TRANSCRIPT_CACHE_ENABLED: bool = True
+    TRANSCRIPT_MAX_CHUNKS: int = 64  # Appends before the blob is recompressed as one member
+
+    # Cache: "memory" (per process), "redis" (shared) or "none"
+    CACHE_BACKEND: str = "memory"
+    CACHE_REDIS_URL: str = "redis://redis:6379/0"
+    CACHE_KEY_PREFIX: str = "socrates"
+    CACHE_DEFAULT_TTL: int = 300
+    CACHE_MAX_ENTRIES: int = 10000  # Memory backend only
+    CACHE_LOCK_TIMEOUT: float = 5.0  # Seconds other workers wait for a value being loaded
+    CACHE_RETRY_AFTER: float = 5.0  # Seconds the backend is bypassed after an error
+
+    # Dashboard and session list previews
+    DASHBOARD_RECENT_SESSIONS: int = 5
+    MESSAGE_PREVIEW_CHARS: int = 160
+
     # Environment
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
+    STRICT_LOADING: bool = False  # Raise on lazy relationship loads (development and tests)
 
     @property
     def cors_origins_list(self) -> List[str]:
@@ -32,6 +100,11 @@ class Settings(BaseSettings):
             return [self.CORS_ORIGINS]
         return self.CORS_ORIGINS
 
+    @property
+    def compression_content_types_list(self) -> List[str]:
+        """Get compressible content types as list."""
+        return [t.strip() for t in self.COMPRESSION_CONTENT_TYPES.split(",") if t.strip()]
+
     class Config:
         """Pydantic config."""
 
@@ -1,9 +1,10 @@
 """Database configuration and session management."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 from backend.src.config import settings
+from backend.src.utils.loading import enable_strict_loading
 
 # Create database engine
 if settings.DATABASE_URL.startswith("sqlite"):
@@ -12,6 +13,13 @@ if settings.DATABASE_URL.startswith("sqlite"):
         connect_args={"check_same_thread": False},
         echo=False,
     )
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_conn, connection_record):
+        """Enable foreign keys so ON DELETE CASCADE applies (passive deletes rely on it)."""
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
 else:
     engine = create_engine(
         settings.DATABASE_URL,
@@ -27,6 +35,9 @@ SessionLocal = sessionmaker(
     expire_on_commit=False,  # Keep objects after commit
 )
 
+if settings.STRICT_LOADING:
+    enable_strict_loading(SessionLocal)
+
 
 def get_db():
     """Get database session."""
@@ -1,16 +1,24 @@
 """FastAPI application entry point."""
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Depends, status as http_status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 import json
-from typing import Set
+from typing import Optional, Set
 from uuid import UUID
 
 from backend.src.config import settings
-from backend.src.api.routes import auth, project, session, message, profile
+from backend.src.api.routes import (
+    auth, project, session, message, profile, search, export, history_import, dashboard
+)
 from backend.src.auth.jwt_handler import JWTHandler
 from backend.src.repositories import UserRepository
-from backend.src.database import get_db
+from backend.src.database import get_db, SessionLocal
+from backend.src.services.message_service import MessageService
+from backend.src.services.session_service import SessionService
+from backend.src.utils.serialization import dumps
+from backend.src.middleware.compression import CompressionMiddleware, compression_metrics
+from backend.src.services.audit_writer import audit_writer
 
 # Create FastAPI application
 app = FastAPI(
@@ -28,12 +36,40 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Add response compression middleware
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        content_types=settings.compression_content_types_list,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        zstd_level=settings.COMPRESSION_ZSTD_LEVEL,
+    )
+
 # Register API routes
 app.include_router(auth.router, prefix="/api")
 app.include_router(project.router, prefix="/api")
 app.include_router(session.router, prefix="/api")
 app.include_router(message.router, prefix="/api")
 app.include_router(profile.router, prefix="/api")
+app.include_router(search.router, prefix="/api")
+app.include_router(export.router, prefix="/api")
+app.include_router(history_import.router, prefix="/api")
+app.include_router(dashboard.router, prefix="/api")
+
+
+@app.on_event("startup")
+def start_audit_writer():
+    """Start the background audit log writer."""
+    audit_writer.start()
+
+
+@app.on_event("shutdown")
+def stop_audit_writer():
+    """Flush queued audit events before exiting."""
+    audit_writer.stop()
+
 
 # WebSocket connection manager
 class ConnectionManager:
@@ -86,6 +122,51 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
+def parse_after_seq(value) -> Optional[int]:
+    """Validate the ``after_seq`` of a sync command.
+
+    Args:
+        value: Value sent by the client (missing means 0)
+
+    Returns:
+        Non-negative sequence number, or None if the value is invalid
+    """
+    if value is None:
+        return 0
+    if isinstance(value, bool):
+        return None
+    try:
+        after_seq = int(value)
+    except (TypeError, ValueError):
+        return None
+    return after_seq if after_seq >= 0 else None
+
+
+def sync_session_messages(session_id: str, user_id: str, after_seq: int) -> dict:
+    """Load messages a reconnecting WebSocket client has missed.
+
+    Args:
+        session_id: Session ID
+        user_id: Authenticated user ID
+        after_seq: Last sequence number the client has seen
+
+    Returns:
+        Sync payload, or an error payload if not authorized
+    """
+    db = SessionLocal()
+    try:
+        session = SessionService(db).get_session_by_id(session_id)
+        if not session or str(session.owner_id) != user_id:
+            return {"type": "error", "message": "Session not found"}
+
+        data = MessageService(db, settings.ANTHROPIC_API_KEY).get_messages_since(
+            session_id, after_seq=after_seq
+        )
+        return {"type": "sync", "data": data}
+    finally:
+        db.close()
+
+
 # WebSocket endpoint
 @app.websocket("/ws/sessions/{session_id}")
 async def websocket_endpoint(websocket: WebSocket, session_id: str):
@@ -132,6 +213,17 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                     "timestamp": message.get("timestamp")
                 })
 
+            elif message.get("type") == "sync":
+                # Catch up on messages missed while disconnected
+                after_seq = parse_after_seq(message.get("after_seq"))
+                if after_seq is None:
+                    payload = {"type": "error", "message": "after_seq must be a non-negative integer"}
+                else:
+                    payload = await run_in_threadpool(
+                        sync_session_messages, session_id, user_id, after_seq
+                    )
+                await websocket.send_text(dumps(payload).decode("utf-8"))
+
     except WebSocketDisconnect:
         manager.disconnect(websocket, session_id)
         await manager.broadcast(session_id, {
@@ -162,7 +254,8 @@ async def api_status():
         "database": "connected",
         "version": "8.0.0",
         "environment": settings.ENVIRONMENT,
-        "websocket": "enabled"
+        "websocket": "enabled",
+        "compression": compression_metrics.snapshot()
     }
 
 
@@ -0,0 +1,359 @@
+"""Response compression middleware (gzip, brotli, zstd)."""
+
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+    zstandard = None
+
+
+class CompressionMetrics:
+    """Thread-safe counters for compressed responses."""
+
+    def __init__(self):
+        """Initialize metrics."""
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def record(self, encoding: str, bytes_in: int, bytes_out: int, cpu_seconds: float) -> None:
+        """Record one compressed response (or stream chunk).
+
+        Args:
+            encoding: Content encoding used
+            bytes_in: Uncompressed bytes
+            bytes_out: Compressed bytes
+            cpu_seconds: CPU time spent compressing
+        """
+        with self._lock:
+            stats = self._stats.setdefault(encoding, {
+                "responses": 0,
+                "bytes_in": 0,
+                "bytes_out": 0,
+                "cpu_seconds": 0.0,
+            })
+            stats["bytes_in"] += bytes_in
+            stats["bytes_out"] += bytes_out
+            stats["cpu_seconds"] += cpu_seconds
+
+    def record_response(self, encoding: str) -> None:
+        """Count a response that was compressed with the given encoding."""
+        with self._lock:
+            stats = self._stats.setdefault(encoding, {
+                "responses": 0,
+                "bytes_in": 0,
+                "bytes_out": 0,
+                "cpu_seconds": 0.0,
+            })
+            stats["responses"] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Get a copy of the counters with bytes saved per encoding.
+
+        Returns:
+            Dict of encoding -> counters
+        """
+        with self._lock:
+            result = {}
+            for encoding, stats in self._stats.items():
+                result[encoding] = dict(
+                    stats,
+                    bytes_saved=stats["bytes_in"] - stats["bytes_out"],
+                )
+            return result
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._stats.clear()
+
+
+compression_metrics = CompressionMetrics()
+
+
+class _GzipEncoder:
+    """Incremental gzip encoder."""
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        out = self._compressor.compress(data)
+        if flush:
+            out += self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return out
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    """Incremental brotli encoder."""
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        out = self._compressor.process(data)
+        if flush:
+            out += self._compressor.flush()
+        return out
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdEncoder:
+    """Incremental zstd encoder."""
+
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        out = self._compressor.compress(data)
+        if flush:
+            out += self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return out
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def create_encoder(encoding: str, level: int):
+    """Create an incremental encoder.
+
+    Args:
+        encoding: ``gzip``, ``br`` or ``zstd``
+        level: Compression level or quality for the encoding
+
+    Returns:
+        Encoder with ``compress(data, flush=False)`` and ``finish()``
+
+    Raises:
+        ValueError: If the encoding is unknown or its library is not installed
+    """
+    if encoding == "gzip":
+        return _GzipEncoder(level)
+    if encoding == "zstd" and zstandard is not None:
+        return _ZstdEncoder(level)
+    if encoding == "br" and brotli is not None:
+        return _BrotliEncoder(level)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def available_encodings() -> List[str]:
+    """Get supported encodings in server preference order.
+
+    Returns:
+        List of encoding names
+    """
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return encodings
+
+
+def _parse_accept_encoding(value: str) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into {encoding: q}."""
+    accepted = {}
+    for part in value.split(","):
+        pieces = part.strip().split(";")
+        name = pieces[0].strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in pieces[1:]:
+            key, _, raw = param.strip().partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(raw)
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing eligible responses.
+
+    Responses are compressed when the client accepts a supported encoding,
+    the content type is allowlisted, and the body is at least ``minimum_size``
+    bytes. Streaming responses are compressed incrementally; ``text/event-stream``
+    chunks are flushed immediately so server-sent events are not held back.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        content_types: Optional[List[str]] = None,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+        metrics: CompressionMetrics = compression_metrics,
+    ):
+        """Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            minimum_size: Smallest body (bytes) worth compressing
+            content_types: Allowlisted media types
+            gzip_level: zlib level (1-9)
+            brotli_quality: Brotli quality (0-11)
+            zstd_level: zstd level (1-22)
+            metrics: Metrics sink
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = {
+            content_type.strip().lower()
+            for content_type in (content_types or ["application/json"])
+        }
+        self.levels = {"gzip": gzip_level, "br": brotli_quality, "zstd": zstd_level}
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._select_encoding(Headers(scope=scope))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def _select_encoding(self, headers: Headers) -> Optional[str]:
+        """Pick the preferred encoding accepted by the client."""
+        accepted = _parse_accept_encoding(headers.get("accept-encoding", ""))
+        for encoding in available_encodings():
+            if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+                return encoding
+        return None
+
+    def create_encoder(self, encoding: str):
+        """Create an incremental encoder for an encoding."""
+        return create_encoder(encoding, self.levels[encoding])
+
+    def is_compressible(self, headers: Headers, status: int) -> bool:
+        """Check whether a response may be compressed."""
+        if status < 200 or status in (204, 206, 304):
+            return False
+        if "content-encoding" in headers or "content-range" in headers:
+            return False
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return media_type in self.content_types
+
+
+class _CompressionResponder:
+    """Per-request send wrapper that compresses the body."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send_downstream = send
+        self.start_message: Optional[Message] = None
+        self.encoder = None
+        self.flush_each_chunk = False
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            if not self.middleware.is_compressible(headers, message["status"]):
+                self.passthrough = True
+                await self.send_downstream(message)
+            else:
+                media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+                self.flush_each_chunk = media_type == "text/event-stream"
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            await self.send_downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.encoder is None:
+            if not more_body:
+                await self._send_single(body)
+                return
+            await self._start_stream()
+
+        out, cpu = self._compress(body, flush=self.flush_each_chunk)
+        if not more_body:
+            finish, finish_cpu = self._finish()
+            out += finish
+            cpu += finish_cpu
+        self.middleware.metrics.record(self.encoding, len(body), len(out), cpu)
+        await self.send_downstream({
+            "type": "http.response.body",
+            "body": out,
+            "more_body": more_body,
+        })
+
+    async def _send_single(self, body: bytes) -> None:
+        """Send a complete (non-streaming) body."""
+        if len(body) < self.middleware.minimum_size:
+            await self.send_downstream(self.start_message)
+            await self.send_downstream({"type": "http.response.body", "body": body})
+            return
+
+        self.encoder = self.middleware.create_encoder(self.encoding)
+        out, cpu = self._compress(body)
+        finish, finish_cpu = self._finish()
+        out += finish
+        cpu += finish_cpu
+
+        headers = self._compressed_headers()
+        headers["Content-Length"] = str(len(out))
+        self.middleware.metrics.record(self.encoding, len(body), len(out), cpu)
+        self.middleware.metrics.record_response(self.encoding)
+        await self.send_downstream(self.start_message)
+        await self.send_downstream({"type": "http.response.body", "body": out})
+
+    async def _start_stream(self) -> None:
+        """Send headers for a streaming compressed response."""
+        self.encoder = self.middleware.create_encoder(self.encoding)
+        headers = self._compressed_headers()
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        self.middleware.metrics.record_response(self.encoding)
+        await self.send_downstream(self.start_message)
+
+    def _compressed_headers(self) -> MutableHeaders:
+        """Mark the held start message as encoded."""
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        return headers
+
+    def _compress(self, data: bytes, flush: bool = False) -> Tuple[bytes, float]:
+        start = time.thread_time()
+        out = self.encoder.compress(data, flush=flush)
+        return out, time.thread_time() - start
+
+    def _finish(self) -> Tuple[bytes, float]:
+        start = time.thread_time()
+        out = self.encoder.finish()
+        return out, time.thread_time() - start
@@ -8,6 +8,9 @@ from backend.src.models.message import Message
 from backend.src.models.preference import UserPreference
 from backend.src.models.document import Document
 from backend.src.models.audit_log import AuditLog
+from backend.src.models.message_archive import MessageArchive
+from backend.src.models.session_transcript import SessionTranscript
+from backend.src.models import message_search  # noqa: F401  (registers search index DDL)
 
 __all__ = [
     "Base",
@@ -18,4 +21,6 @@ __all__ = [
     "UserPreference",
     "Document",
     "AuditLog",
+    "MessageArchive",
+    "SessionTranscript",
 ]
@@ -1,26 +1,35 @@
 """Audit log model for change tracking."""
 
-import uuid
-from sqlalchemy import Column, String, DateTime, func, ForeignKey, JSON
+from sqlalchemy import Column, String, DateTime, func, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from backend.src.models.base import Base
+from backend.src.models.guid import GUID
+from backend.src.models.jsonb import JSONVariant
+from backend.src.utils.ids import uuid7
 
 
 class AuditLog(Base):
     """Audit log model for tracking changes."""
 
     __tablename__ = "audit_log"
+    __table_args__ = (
+        # Keyset pagination: equality filter, then newest-first range scan
+        # ordered by (created_at, id)
+        Index("idx_audit_user_created", "user_id", "created_at", "id"),
+        Index("idx_audit_entity_created", "entity_type", "entity_id", "created_at", "id"),
+        Index("idx_audit_action_created", "action", "created_at", "id"),
+        Index("idx_audit_created", "created_at", "id"),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="SET NULL"),
-                    index=True)
+    id = Column(GUID, primary_key=True, default=uuid7)  # Time-ordered (UUIDv7)
+    user_id = Column(GUID, ForeignKey("users.id", ondelete="SET NULL"))
     entity_type = Column(String(100))
-    entity_id = Column(String(36))
+    entity_id = Column(GUID)
     action = Column(String(50))  # CREATE, UPDATE, DELETE
-    old_value = Column(JSON)
-    new_value = Column(JSON)
-    created_at = Column(DateTime, default=func.now(), index=True)
+    old_value = Column(JSONVariant)
+    new_value = Column(JSONVariant)
+    created_at = Column(DateTime, default=func.now())
 
     def __repr__(self):
         return f"<AuditLog {self.action} {self.entity_type}>"
@@ -0,0 +1,185 @@
+"""Transparently compressed text column type.
+
+``CompressedText`` stores values at or above
+``MESSAGE_COMPRESSION_MIN_BYTES`` as compressed bytes and smaller values
+as plain text; reads return ``str`` either way. Compressed values start
+with a one-byte codec header so codecs can change without rewriting rows:
+
+* ``0x01`` zlib
+* ``0x02`` zstd
+* ``0x03`` zstd with the trained dictionary at ``MESSAGE_ZSTD_DICT_PATH``
+
+zstd is used when the optional ``zstandard`` package is installed, zlib
+otherwise. Short conversational messages share most of their vocabulary,
+so a dictionary trained on existing messages (``scripts/
+train_message_dictionary.py``) compresses them far better than zstd alone.
+
+Only SQLite stores compressed values. On PostgreSQL the type does nothing
+and values are written as plain text, because the full-text search index
+and ``ts_headline`` evaluate ``content`` in SQL. Large PostgreSQL values
+are compressed only by TOAST (lz4 since migration 009).
+
+On SQLite the FTS5 index keeps its own plain-text copy, filled by
+``models.message_search``. ``text_content()``, registered below on every
+connection, decodes stored values in ad hoc SQL; the schema does not
+depend on it.
+"""
+
+import sqlite3
+import zlib
+from functools import lru_cache
+from typing import Dict, Optional, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.types import Text, TypeDecorator
+
+from backend.src.config import settings
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+    zstandard = None
+
+ZLIB = 0x01
+ZSTD = 0x02
+ZSTD_DICT = 0x03
+
+ZLIB_LEVEL = 6
+
+
+class ZlibCodec:
+    """zlib codec, always available."""
+
+    header = ZLIB
+
+    def __init__(self, level: int = ZLIB_LEVEL):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class ZstdCodec:
+    """zstd codec, optionally with a trained dictionary."""
+
+    def __init__(self, level: int = 3, dictionary: bytes = None):
+        if zstandard is None:
+            raise RuntimeError("zstandard is not installed")
+        zdict = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+        self.header = ZSTD_DICT if zdict else ZSTD
+        self._compressor = zstandard.ZstdCompressor(level=level, dict_data=zdict)
+        self._decompressor = zstandard.ZstdDecompressor(dict_data=zdict)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+
+@lru_cache(maxsize=None)
+def _load_dictionary(path: str) -> bytes:
+    """Read a trained zstd dictionary once."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def _codecs(level: int, dict_path: str) -> Dict[int, object]:
+    """Codecs by header byte for the given settings."""
+    codecs = {ZLIB: ZlibCodec()}
+    if zstandard is not None:
+        codecs[ZSTD] = ZstdCodec(level)
+        if dict_path:
+            codecs[ZSTD_DICT] = ZstdCodec(level, _load_dictionary(dict_path))
+    return codecs
+
+
+def get_codecs() -> Dict[int, object]:
+    """Get the codecs for the current settings, keyed by header byte."""
+    return _codecs(settings.MESSAGE_ZSTD_LEVEL, settings.MESSAGE_ZSTD_DICT_PATH)
+
+
+def default_codec():
+    """Get the codec new values are written with (best available)."""
+    codecs = get_codecs()
+    return codecs.get(ZSTD_DICT) or codecs.get(ZSTD) or codecs[ZLIB]
+
+
+def compress_text(value: str, min_bytes: int, codec=None) -> Union[str, bytes]:
+    """Compress text at or above ``min_bytes`` UTF-8 bytes.
+
+    Args:
+        value: Text to store
+        min_bytes: Smallest value worth compressing
+        codec: Codec to use (defaults to ``default_codec()``)
+
+    Returns:
+        Header-prefixed compressed bytes, or ``value`` itself if it is too
+        small or does not shrink
+    """
+    raw = value.encode("utf-8")
+    if len(raw) < min_bytes:
+        return value
+    codec = codec or default_codec()
+    packed = bytes([codec.header]) + codec.compress(raw)
+    return packed if len(packed) < len(raw) else value
+
+
+def decompress_text(value: Union[str, bytes, None]) -> Optional[str]:
+    """Decode a value written by ``compress_text``.
+
+    Args:
+        value: Stored text or compressed bytes
+
+    Returns:
+        Original text
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable
+    """
+    if value is None or isinstance(value, str):
+        return value
+    value = bytes(value)
+    codec = get_codecs().get(value[0])
+    if codec is None:
+        raise ValueError(
+            f"Cannot decode compressed text with codec {value[0]:#04x}; "
+            f"install zstandard and configure MESSAGE_ZSTD_DICT_PATH"
+        )
+    return codec.decompress(value[1:]).decode("utf-8")
+
+
+class CompressedText(TypeDecorator):
+    """Text column that compresses large values at rest on SQLite.
+
+    A no-op on PostgreSQL, where values are stored as plain text.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if (
+            value is None
+            or dialect.name == "postgresql"
+            or not settings.MESSAGE_COMPRESSION_ENABLED
+        ):
+            return value
+        return compress_text(value, settings.MESSAGE_COMPRESSION_MIN_BYTES)
+
+    def process_result_value(self, value, dialect):
+        return decompress_text(value)
+
+
+@event.listens_for(Engine, "connect")
+def _register_sqlite_functions(dbapi_connection, connection_record):
+    """Expose decompression to ad hoc SQL as ``text_content(content)``."""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.create_function(
+            "text_content", 1, decompress_text, deterministic=True
+        )
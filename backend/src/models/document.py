@@ -5,6 +5,7 @@ from sqlalchemy import Column, String, DateTime, Text, ForeignKey, func
 from sqlalchemy.orm import relationship
 
 from backend.src.models.base import Base
+from backend.src.models.guid import GUID
 
 
 class Document(Base):
@@ -12,10 +13,10 @@ class Document(Base):
 
     __tablename__ = "documents"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    owner_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"),
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    owner_id = Column(GUID, ForeignKey("users.id", ondelete="CASCADE"),
                      nullable=False, index=True)
-    project_id = Column(String(36), ForeignKey("projects.id", ondelete="SET NULL"),
+    project_id = Column(GUID, ForeignKey("projects.id", ondelete="SET NULL"),
                        index=True)
     filename = Column(String(500), nullable=False)
     file_path = Column(String(500), nullable=False)
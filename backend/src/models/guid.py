@@ -1,33 +1,70 @@
 """GUID type for cross-database compatibility."""
 
 import uuid
-from sqlalchemy.types import TypeDecorator, CHAR
+from typing import Any, Optional
+
+from sqlalchemy.types import TypeDecorator, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID as pg_UUID
 
 
 class GUID(TypeDecorator):
-    """Platform-independent GUID type that uses CHAR(32), storing as stringified hex values."""
+    """Platform-independent 16-byte GUID type.
+
+    Uses the native ``uuid`` type on PostgreSQL and a 16-byte ``BLOB``
+    elsewhere, so primary keys, foreign keys and their indexes hold the raw
+    128-bit value instead of 36 characters of text. Bound values may be
+    ``uuid.UUID`` instances or any string ``uuid.UUID`` accepts; results
+    are always ``uuid.UUID``.
+    """
 
-    impl = CHAR
+    impl = LargeBinary(16)
     cache_ok = True
 
     def load_dialect_impl(self, dialect):
         if dialect.name == 'postgresql':
-            return dialect.type_descriptor(pg_UUID())
-        return dialect.type_descriptor(CHAR(32))
+            return dialect.type_descriptor(pg_UUID(as_uuid=True))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    @staticmethod
+    def coerce(value: Any) -> Optional[uuid.UUID]:
+        """Convert a bound value to ``uuid.UUID``.
+
+        Args:
+            value: UUID, UUID string or 16 raw bytes
+
+        Returns:
+            UUID, or None for None
+
+        Raises:
+            ValueError: If the value is not a valid UUID
+        """
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        if isinstance(value, bytes):
+            return uuid.UUID(bytes=value)
+        return uuid.UUID(str(value))
 
     def process_bind_param(self, value, dialect):
-        if value is None:
+        value = self.coerce(value)
+        if value is None or dialect.name == 'postgresql':
             return value
-        if dialect.name == 'postgresql':
-            return str(value)
-        if not isinstance(value, uuid.UUID):
-            return "%.32x" % uuid.UUID(value).int
-        return "%.32x" % value.int
+        return value.bytes
 
     def process_result_value(self, value, dialect):
-        if value is None:
+        if value is None or isinstance(value, uuid.UUID):
             return value
-        if not isinstance(value, uuid.UUID):
-            value = uuid.UUID(value)
-        return value
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return uuid.UUID(bytes=bytes(value))
+        return uuid.UUID(value)
+
+    def process_literal_param(self, value, dialect):
+        value = self.coerce(value)
+        if value is None:
+            return "NULL"
+        if dialect.name == 'postgresql':
+            return f"'{value}'::uuid"
+        return f"X'{value.hex}'"
+
+    @property
+    def python_type(self):
+        return uuid.UUID
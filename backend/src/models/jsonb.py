@@ -0,0 +1,65 @@
+"""JSON column type and filters backed by JSONB on PostgreSQL.
+
+``JSONVariant`` stores documents as binary JSONB on PostgreSQL (parsed
+once on write, indexable with GIN) and as plain JSON text elsewhere.
+
+``json_contains`` and ``json_has_key`` compile to the JSONB operators a
+GIN index serves (``@>`` and ``?``) on PostgreSQL, and to SQLite JSON1
+functions otherwise, so repositories can filter on JSON without
+branching on the dialect.
+"""
+
+from sqlalchemy import JSON, Boolean
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
+
+class json_contains(FunctionElement):
+    """True if the JSON array ``column`` contains the string ``value``.
+
+    Example:
+        ``json_contains(Project.technology_stack, "Python")``
+    """
+
+    type = Boolean()
+    name = "json_contains"
+    inherit_cache = True
+
+
+class json_has_key(FunctionElement):
+    """True if the JSON object ``column`` has the top-level ``key``.
+
+    Example:
+        ``json_has_key(Message.meta, "code_language")``
+    """
+
+    type = Boolean()
+    name = "json_has_key"
+    inherit_cache = True
+
+
+@compiles(json_contains, "postgresql")
+def _json_contains_postgresql(element, compiler, **kw):
+    column, value = (compiler.process(arg, **kw) for arg in element.clauses)
+    return f"({column} @> jsonb_build_array(CAST({value} AS TEXT)))"
+
+
+@compiles(json_contains)
+def _json_contains_default(element, compiler, **kw):
+    column, value = (compiler.process(arg, **kw) for arg in element.clauses)
+    return f"EXISTS (SELECT 1 FROM json_each({column}) WHERE json_each.value = {value})"
+
+
+@compiles(json_has_key, "postgresql")
+def _json_has_key_postgresql(element, compiler, **kw):
+    column, key = (compiler.process(arg, **kw) for arg in element.clauses)
+    return f"({column} ? {key})"
+
+
+@compiles(json_has_key)
+def _json_has_key_default(element, compiler, **kw):
+    column, key = (compiler.process(arg, **kw) for arg in element.clauses)
+    return f"(json_type({column}, '$.\"' || {key} || '\"') IS NOT NULL)"
@@ -1,26 +1,35 @@
 """Message model for conversation storage."""
 
-import uuid
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, func, JSON
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 
 from backend.src.models.base import Base
+from backend.src.models.compressed import CompressedText
+from backend.src.models.guid import GUID
+from backend.src.models.jsonb import JSONVariant
+from backend.src.utils.ids import uuid7
 
 
 class Message(Base):
     """Message model for user and assistant messages."""
 
     __tablename__ = "messages"
-
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    session_id = Column(String(36), ForeignKey("sessions.id", ondelete="CASCADE"),
+    __table_args__ = (
+        Index("idx_messages_session_seq", "session_id", "seq", unique=True),
+        # Serves json_has_key / json_contains filters on meta
+        Index("idx_messages_meta", "meta", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
+
+    id = Column(GUID, primary_key=True, default=uuid7)  # Time-ordered (UUIDv7)
+    session_id = Column(GUID, ForeignKey("sessions.id", ondelete="CASCADE"),
                        nullable=False, index=True)
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"),
+    user_id = Column(GUID, ForeignKey("users.id", ondelete="CASCADE"),
                     nullable=False, index=True)
+    seq = Column(Integer)  # Per-session, monotonically increasing
     role = Column(String(50), nullable=False, index=True)  # 'user' or 'assistant'
-    content = Column(Text, nullable=False)
+    content = Column(CompressedText, nullable=False)  # Compressed at rest above a size threshold (SQLite only)
     message_type = Column(String(50), default='text')
-    meta = Column(JSON, default=dict)
+    meta = Column(JSONVariant, default=dict)
     created_at = Column(DateTime, default=func.now(), index=True)
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
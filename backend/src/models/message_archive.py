@@ -0,0 +1,32 @@
+"""Offset index for messages moved to archive segment files."""
+
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, func
+from sqlalchemy.orm import relationship
+
+from backend.src.models.base import Base
+from backend.src.models.guid import GUID
+
+
+class MessageArchive(Base):
+    """Where an archived session's messages live on disk.
+
+    One row per archived session: the messages were removed from the hot
+    ``messages`` table and written as a single record of segment file
+    ``segment`` at byte ``offset``.
+    """
+
+    __tablename__ = "message_archives"
+
+    session_id = Column(GUID, ForeignKey("sessions.id", ondelete="CASCADE"), primary_key=True)
+    segment = Column(Integer, nullable=False)
+    offset = Column(BigInteger, nullable=False)
+    length = Column(Integer, nullable=False)  # Record size in bytes, header included
+    message_count = Column(Integer, nullable=False)
+    last_message_at = Column(DateTime)
+    archived_at = Column(DateTime, default=func.now())
+
+    # Relationships
+    session = relationship("Session")
+
+    def __repr__(self):
+        return f"<MessageArchive {self.session_id} @ {self.segment}:{self.offset}>"
@@ -0,0 +1,228 @@
+"""Full-text search index definitions for message content.
+
+PostgreSQL uses a GIN index over ``to_tsvector(content)``; SQLite uses an
+FTS5 table holding each message's id. Both are created with the
+``messages`` table by ``metadata.create_all`` and by migrations.
+
+On SQLite message content may be stored compressed (see
+``models.compressed``). The FTS5 table keeps its own plain-text copy:
+triggers index rows written as text, so other tools can write messages
+without any application SQL functions, and ``index_compressed_messages``
+indexes the rows the application compressed. ORM flushes are covered by an
+event hook; core INSERT and UPDATE paths call ``index_written_messages`` or
+``index_updated_messages`` themselves.
+"""
+
+from typing import Any, Iterable, Mapping, Optional
+
+from sqlalchemy import DDL, Index, bindparam, event, func, text
+from sqlalchemy.dialects import postgresql  # noqa: F401  (registers to_tsvector & co.)
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session as OrmSession, attributes
+
+from backend.src.config import settings
+from backend.src.models.compressed import decompress_text
+from backend.src.models.guid import GUID
+from backend.src.models.message import Message
+
+# Text search configuration; the query must use the same literal so the
+# planner can match the expression index
+TS_CONFIG = text("'english'")
+
+message_content_tsvector = func.to_tsvector(TS_CONFIG, Message.__table__.c.content)
+
+Index(
+    "idx_messages_content_fts",
+    message_content_tsvector,
+    postgresql_using="gin",
+).ddl_if(dialect="postgresql")
+
+# The FTS5 rows carry the message id and get their rowid from
+# messages_fts_keys, an INTEGER PRIMARY KEY that VACUUM keeps, instead of
+# the implicit messages.rowid, which VACUUM may renumber
+SQLITE_FTS_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS messages_fts_keys (
+        fts_rowid INTEGER PRIMARY KEY,
+        message_id BLOB NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+        content,
+        message_id UNINDEXED,
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages
+    WHEN typeof(new.content) = 'text' BEGIN
+        INSERT INTO messages_fts_keys(message_id) VALUES (new.id);
+        INSERT INTO messages_fts(rowid, content, message_id)
+        SELECT fts_rowid, new.content, new.id FROM messages_fts_keys WHERE message_id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN
+        DELETE FROM messages_fts
+        WHERE rowid = (SELECT fts_rowid FROM messages_fts_keys WHERE message_id = old.id);
+        DELETE FROM messages_fts_keys WHERE message_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE OF content ON messages BEGIN
+        DELETE FROM messages_fts
+        WHERE rowid = (SELECT fts_rowid FROM messages_fts_keys WHERE message_id = old.id);
+        DELETE FROM messages_fts_keys WHERE message_id = old.id;
+        INSERT INTO messages_fts_keys(message_id)
+        SELECT new.id WHERE typeof(new.content) = 'text';
+        INSERT INTO messages_fts(rowid, content, message_id)
+        SELECT fts_rowid, new.content, new.id FROM messages_fts_keys
+        WHERE message_id = new.id AND typeof(new.content) = 'text';
+    END
+    """,
+]
+
+SQLITE_FTS_DROP_STATEMENTS = [
+    "DROP TRIGGER IF EXISTS messages_fts_au",
+    "DROP TRIGGER IF EXISTS messages_fts_ad",
+    "DROP TRIGGER IF EXISTS messages_fts_ai",
+    "DROP TABLE IF EXISTS messages_fts",
+    "DROP TABLE IF EXISTS messages_fts_keys",
+]
+
+for statement in SQLITE_FTS_STATEMENTS:
+    event.listen(
+        Message.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="sqlite"),
+    )
+
+for statement in SQLITE_FTS_DROP_STATEMENTS:
+    event.listen(
+        Message.__table__,
+        "before_drop",
+        DDL(statement).execute_if(dialect="sqlite"),
+    )
+
+# Compressed rows that are not indexed yet
+_UNINDEXED_COMPRESSED = """
+    SELECT id, content FROM messages
+    WHERE typeof(content) = 'blob'
+      AND NOT EXISTS (SELECT 1 FROM messages_fts_keys WHERE message_id = messages.id)
+"""
+
+_INSERT_KEY = "INSERT INTO messages_fts_keys(message_id) VALUES (:id)"
+_INSERT_ENTRY = """
+    INSERT INTO messages_fts(rowid, content, message_id)
+    SELECT fts_rowid, :content, message_id FROM messages_fts_keys WHERE message_id = :id
+"""
+
+
+def index_compressed_messages(
+    connection: Connection,
+    session_ids: Optional[Iterable] = None,
+    message_ids: Optional[Iterable] = None
+) -> int:
+    """Add compressed messages to the SQLite FTS5 index.
+
+    The triggers index plain-text rows only, so they work for any writer.
+    Rows the application stored compressed are indexed here, after they
+    are written. No-op on other databases.
+
+    Args:
+        connection: Connection the messages were written on
+        session_ids: Sessions to index (all sessions when None)
+        message_ids: Messages to index (all messages when None)
+
+    Returns:
+        Number of messages indexed
+    """
+    if connection.dialect.name != "sqlite":
+        return 0
+
+    sql, params = _UNINDEXED_COMPRESSED, {}
+    for column, ids in (("session_id", session_ids), ("id", message_ids)):
+        if ids is None:
+            continue
+        params[column] = list(ids)
+        if not params[column]:
+            return 0
+        sql += f" AND {column} IN :{column}"
+    statement = text(sql).bindparams(
+        *(bindparam(column, expanding=True, type_=GUID()) for column in params)
+    )
+
+    rows = [
+        {"id": message_id, "content": decompress_text(content)}
+        for message_id, content in connection.execute(statement, params)
+    ]
+    if rows:
+        connection.execute(text(_INSERT_KEY), rows)
+        connection.execute(text(_INSERT_ENTRY), rows)
+    return len(rows)
+
+
+def index_written_messages(connection: Connection, rows: Iterable[Mapping[str, Any]]) -> int:
+    """Index messages just inserted without the ORM (executemany paths).
+
+    Only sessions with a message large enough to have been compressed are
+    checked, so small writes cost no extra query.
+
+    Args:
+        connection: Connection the messages were written on
+        rows: Inserted column values, with ``session_id`` and ``content``
+
+    Returns:
+        Number of messages indexed
+    """
+    session_ids = {row["session_id"] for row in rows if _maybe_compressed(row.get("content"))}
+    if not session_ids:
+        return 0
+    return index_compressed_messages(connection, session_ids)
+
+
+def index_updated_messages(
+    connection: Connection,
+    message_ids: Iterable,
+    values: Mapping[str, Any]
+) -> int:
+    """Re-index messages whose content was set by a core UPDATE.
+
+    The update trigger drops the old index entry; a new value stored
+    compressed is indexed here. Updates that leave ``content`` alone, or
+    set it too short to compress, cost no extra query.
+
+    Args:
+        connection: Connection the messages were updated on
+        message_ids: Updated message IDs
+        values: Column values the UPDATE set
+
+    Returns:
+        Number of messages indexed
+    """
+    if not _maybe_compressed(values.get("content")):
+        return 0
+    return index_compressed_messages(connection, message_ids=message_ids)
+
+
+def _maybe_compressed(value: Optional[str]) -> bool:
+    """Whether ``CompressedText`` may have stored this value compressed."""
+    return (
+        settings.MESSAGE_COMPRESSION_ENABLED
+        and isinstance(value, str)
+        and len(value.encode("utf-8")) >= settings.MESSAGE_COMPRESSION_MIN_BYTES
+    )
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _index_flushed_messages(session: OrmSession, flush_context) -> None:
+    """Index messages written compressed through the ORM."""
+    session_ids = {
+        obj.session_id
+        for obj in list(session.new) + list(session.dirty)
+        if isinstance(obj, Message)
+        and any(map(_maybe_compressed, attributes.get_history(obj, "content").added))
+    }
+    if session_ids:
+        index_compressed_messages(session.connection(), session_ids)
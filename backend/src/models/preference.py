@@ -5,6 +5,7 @@ from sqlalchemy import Column, String, DateTime, Float, Integer, Boolean, Foreig
 from sqlalchemy.orm import relationship
 
 from backend.src.models.base import Base
+from backend.src.models.guid import GUID
 
 
 class UserPreference(Base):
@@ -12,8 +13,8 @@ class UserPreference(Base):
 
     __tablename__ = "user_preferences"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"),
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    user_id = Column(GUID, ForeignKey("users.id", ondelete="CASCADE"),
                     nullable=False, unique=True, index=True)
     theme = Column(String(50), default='dark')
     llm_model = Column(String(255), default='claude-3-sonnet')
@@ -1,31 +1,41 @@
 """Project model for project management."""
 
 import uuid
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, func, JSON
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 
 from backend.src.models.base import Base
+from backend.src.models.guid import GUID
+from backend.src.models.jsonb import JSONVariant
 
 
 class Project(Base):
     """Project model."""
 
     __tablename__ = "projects"
-
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    owner_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"),
+    __table_args__ = (
+        # Serves json_contains(technology_stack, ...); path_ops only supports @>
+        Index("idx_projects_technology_stack", "technology_stack", postgresql_using="gin",
+              postgresql_ops={"technology_stack": "jsonb_path_ops"}).ddl_if(dialect="postgresql"),
+    )
+
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    owner_id = Column(GUID, ForeignKey("users.id", ondelete="CASCADE"),
                      nullable=False, index=True)
     name = Column(String(255), nullable=False)
     description = Column(Text)
     status = Column(String(50), default='PLANNING', index=True)
-    technology_stack = Column(JSON, default=list)
+    technology_stack = Column(JSONVariant, default=list)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    deleted_at = Column(DateTime, index=True)  # Set while the purger removes the project
 
     # Relationships
     owner = relationship("User", back_populates="projects")
-    sessions = relationship("Session", back_populates="project", cascade="all, delete-orphan")
-    documents = relationship("Document", back_populates="project")
+    # ON DELETE CASCADE / SET NULL handle children without loading them
+    sessions = relationship("Session", back_populates="project", cascade="all, delete-orphan",
+                            passive_deletes=True)
+    documents = relationship("Document", back_populates="project", passive_deletes=True)
 
     def __repr__(self):
         return f"<Project {self.name}>"
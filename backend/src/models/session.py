@@ -1,34 +1,43 @@
 """Session model for chat session management."""
 
 import uuid
-from sqlalchemy import Column, String, DateTime, ForeignKey, func
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 
 from backend.src.models.base import Base
+from backend.src.models.guid import GUID
 
 
 class Session(Base):
     """Session model for Socratic questioning sessions."""
 
     __tablename__ = "sessions"
-
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    owner_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"),
-                     nullable=False, index=True)
-    project_id = Column(String(36), ForeignKey("projects.id", ondelete="SET NULL"),
+    __table_args__ = (
+        # Session lists: owner filter, then newest-first range scan
+        Index("idx_sessions_owner_created", "owner_id", "created_at"),
+    )
+
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    owner_id = Column(GUID, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(GUID, ForeignKey("projects.id", ondelete="CASCADE"),
                        index=True)
     name = Column(String(255))
     status = Column(String(50), default='ACTIVE', index=True)
     mode = Column(String(50), default='chat')
     role = Column(String(100))
+    message_seq = Column(Integer, default=0, nullable=False)  # Last allocated Message.seq; bumped on delete
+    message_count = Column(Integer, default=0, nullable=False)  # Includes archived messages
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     archived_at = Column(DateTime)
+    deleted_at = Column(DateTime, index=True)  # Set while the purger removes the session
 
     # Relationships
     owner = relationship("User", back_populates="sessions")
     project = relationship("Project", back_populates="sessions")
-    messages = relationship("Message", back_populates="session", cascade="all, delete-orphan")
+    # Messages are removed by ON DELETE CASCADE rather than loaded and deleted one by one
+    messages = relationship("Message", back_populates="session", cascade="all, delete-orphan",
+                            passive_deletes=True)
 
     def __repr__(self):
         return f"<Session {self.id}>"
@@ -0,0 +1,31 @@
+"""Materialized session transcript model."""
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, LargeBinary, func
+from sqlalchemy.orm import relationship
+
+from backend.src.models.base import Base
+from backend.src.models.guid import GUID
+
+
+class SessionTranscript(Base):
+    """A session's full message history, serialized and compressed.
+
+    ``data`` holds one NDJSON line per message (the ``MessageResponse``
+    fields) as a series of concatenated gzip members, one per append. The
+    transcript is current while ``last_seq`` equals ``sessions.message_seq``.
+    """
+
+    __tablename__ = "session_transcripts"
+
+    session_id = Column(GUID, ForeignKey("sessions.id", ondelete="CASCADE"), primary_key=True)
+    data = Column(LargeBinary, nullable=False)
+    message_count = Column(Integer, nullable=False, default=0)
+    last_seq = Column(Integer, nullable=False)
+    chunks = Column(Integer, nullable=False, default=1)  # gzip members in data
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    # Relationships
+    session = relationship("Session")
+
+    def __repr__(self):
+        return f"<SessionTranscript {self.session_id} @ {self.last_seq}>"
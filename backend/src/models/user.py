@@ -5,6 +5,7 @@ from sqlalchemy import Column, String, DateTime, Text, func
 from sqlalchemy.orm import relationship
 
 from backend.src.models.base import Base
+from backend.src.models.guid import GUID
 
 
 class User(Base):
@@ -12,7 +13,7 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
     username = Column(String(255), unique=True, nullable=False, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
@@ -24,11 +25,16 @@ class User(Base):
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     last_login = Column(DateTime)
+    deleted_at = Column(DateTime, index=True)  # Set while the purger removes the account
 
     # Relationships
-    projects = relationship("Project", back_populates="owner", cascade="all, delete-orphan")
-    sessions = relationship("Session", back_populates="owner", cascade="all, delete-orphan")
-    messages = relationship("Message", back_populates="user", cascade="all, delete-orphan")
+    # Children are removed by ON DELETE CASCADE rather than loaded and deleted one by one
+    projects = relationship("Project", back_populates="owner", cascade="all, delete-orphan",
+                            passive_deletes=True)
+    sessions = relationship("Session", back_populates="owner", cascade="all, delete-orphan",
+                            passive_deletes=True)
+    messages = relationship("Message", back_populates="user", cascade="all, delete-orphan",
+                            passive_deletes=True)
 
     def __repr__(self):
         return f"<User {self.username}>"
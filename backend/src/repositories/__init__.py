@@ -5,9 +5,12 @@ from backend.src.repositories.user_repository import UserRepository
 from backend.src.repositories.project_repository import ProjectRepository
 from backend.src.repositories.session_repository import SessionRepository
 from backend.src.repositories.message_repository import MessageRepository
+from backend.src.repositories.message_archive_repository import MessageArchiveRepository
 from backend.src.repositories.preference_repository import PreferenceRepository
 from backend.src.repositories.document_repository import DocumentRepository
 from backend.src.repositories.audit_log_repository import AuditLogRepository
+from backend.src.repositories.search_repository import MessageSearchRepository
+from backend.src.repositories.transcript_repository import TranscriptRepository
 
 __all__ = [
     "BaseRepository",
@@ -15,7 +18,10 @@ __all__ = [
     "ProjectRepository",
     "SessionRepository",
     "MessageRepository",
+    "MessageArchiveRepository",
     "PreferenceRepository",
     "DocumentRepository",
     "AuditLogRepository",
+    "MessageSearchRepository",
+    "TranscriptRepository",
 ]
@@ -1,11 +1,22 @@
 """Audit log repository for audit trail data access."""
 
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Query, Session
 
 from backend.src.models import AuditLog
 from backend.src.repositories.base_repository import BaseRepository
+from backend.src.utils.pagination import keyset_page
+
+# Default look-back for paginated audit history; keeps scans inside the most
+# recent monthly partitions
+RECENT_WINDOW = timedelta(days=90)
+
+# Rows fetched per round trip when streaming
+STREAM_BATCH_SIZE = 1000
 
 
 class AuditLogRepository(BaseRepository[AuditLog]):
@@ -15,79 +26,234 @@ class AuditLogRepository(BaseRepository[AuditLog]):
         """Initialize audit log repository."""
         super().__init__(db, AuditLog)
 
-    def get_by_user(self, user_id: UUID) -> List[AuditLog]:
-        """Get all audit logs by user.
+    def insert_many(self, rows: List[Dict[str, Any]], skip_existing: bool = False) -> None:
+        """Insert audit rows in one statement.
+
+        Uses a Core executemany, which PostgreSQL drivers send as multi-row
+        ``INSERT ... VALUES`` batches instead of one round trip per row.
+
+        Args:
+            rows: Column values for each row
+            skip_existing: Ignore rows whose ID is already stored
+                (``ON CONFLICT DO NOTHING``), so replays are idempotent
+        """
+        if not rows:
+            return
+        statement = insert(AuditLog)
+        if skip_existing:
+            dialect = self.db.get_bind().dialect.name
+            if dialect == "postgresql":
+                statement = postgresql.insert(AuditLog).on_conflict_do_nothing()
+            elif dialect == "sqlite":
+                statement = sqlite.insert(AuditLog).on_conflict_do_nothing()
+        self.db.execute(statement, rows)
+
+    def _by_user(self, user_id: UUID) -> Query:
+        """Query audit logs by user."""
+        return self.db.query(AuditLog).filter(AuditLog.user_id == user_id)
+
+    def _by_entity(self, entity_type: str, entity_id: UUID) -> Query:
+        """Query audit logs for an entity."""
+        return self.db.query(AuditLog).filter(
+            AuditLog.entity_type == entity_type,
+            AuditLog.entity_id == entity_id
+        )
+
+    def _by_action(self, action: str) -> Query:
+        """Query audit logs by action."""
+        return self.db.query(AuditLog).filter(AuditLog.action == action)
+
+    def _stream(self, query: Query, batch_size: int) -> Iterator[AuditLog]:
+        """Iterate a query newest-first using a server-side cursor."""
+        ordered = query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+        yield from ordered.yield_per(batch_size)
+
+    def get_by_user(
+        self,
+        user_id: UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[AuditLog], Optional[str]]:
+        """Get a page of audit logs by user, newest first.
 
         Args:
             user_id: User ID
+            limit: Page size
+            cursor: Cursor from the previous page
 
         Returns:
-            List of audit logs
+            Tuple of (audit logs, next cursor or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        return self.filter_by(user_id=user_id)
+        return keyset_page(self._by_user(user_id), AuditLog, limit, cursor)
 
-    def get_by_entity(self, entity_type: str, entity_id: UUID) -> List[AuditLog]:
-        """Get audit logs for specific entity.
+    def get_by_entity(
+        self,
+        entity_type: str,
+        entity_id: UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[AuditLog], Optional[str]]:
+        """Get a page of audit logs for specific entity, newest first.
 
         Args:
             entity_type: Entity type (e.g., 'User', 'Project')
             entity_id: Entity ID
+            limit: Page size
+            cursor: Cursor from the previous page
 
         Returns:
-            List of audit logs
+            Tuple of (audit logs, next cursor or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        return self.db.query(AuditLog).filter(
-            AuditLog.entity_type == entity_type,
-            AuditLog.entity_id == entity_id
-        ).all()
+        return keyset_page(self._by_entity(entity_type, entity_id), AuditLog, limit, cursor)
 
-    def get_by_action(self, action: str) -> List[AuditLog]:
-        """Get audit logs by action.
+    def get_by_action(
+        self,
+        action: str,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[AuditLog], Optional[str]]:
+        """Get a page of audit logs by action, newest first.
 
         Args:
             action: Action type (CREATE, UPDATE, DELETE)
+            limit: Page size
+            cursor: Cursor from the previous page
 
         Returns:
-            List of audit logs
+            Tuple of (audit logs, next cursor or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        return self.filter_by(action=action)
+        return keyset_page(self._by_action(action), AuditLog, limit, cursor)
 
     def get_by_user_and_entity(
         self,
         user_id: UUID,
         entity_type: str,
-        entity_id: UUID
-    ) -> List[AuditLog]:
-        """Get audit logs by user and entity.
+        entity_id: UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[AuditLog], Optional[str]]:
+        """Get a page of audit logs by user and entity, newest first.
 
         Args:
             user_id: User ID
             entity_type: Entity type
             entity_id: Entity ID
+            limit: Page size
+            cursor: Cursor from the previous page
 
         Returns:
-            List of audit logs
+            Tuple of (audit logs, next cursor or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        return self.db.query(AuditLog).filter(
-            AuditLog.user_id == user_id,
-            AuditLog.entity_type == entity_type,
-            AuditLog.entity_id == entity_id
-        ).all()
+        query = self._by_entity(entity_type, entity_id).filter(AuditLog.user_id == user_id)
+        return keyset_page(query, AuditLog, limit, cursor)
+
+    def get_recent(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[AuditLog], Optional[str]]:
+        """Get a page of all audit logs, newest first.
+
+        Ordered by ``(created_at, id)`` rather than by ID alone: logs written
+        before migration 007 keep their random uuid4 IDs.
+
+        Args:
+            limit: Page size
+            cursor: Cursor from the previous page
+
+        Returns:
+            Tuple of (audit logs, next cursor or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return keyset_page(self.db.query(AuditLog), AuditLog, limit, cursor)
+
+    def iter_by_user(self, user_id: UUID, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[AuditLog]:
+        """Stream all audit logs by user, newest first.
+
+        Rows are fetched ``batch_size`` at a time, so memory stays flat
+        regardless of history size.
+
+        Args:
+            user_id: User ID
+            batch_size: Rows per fetch
+
+        Yields:
+            Audit logs
+        """
+        return self._stream(self._by_user(user_id), batch_size)
+
+    def iter_by_entity(
+        self,
+        entity_type: str,
+        entity_id: UUID,
+        batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[AuditLog]:
+        """Stream all audit logs for an entity, newest first.
+
+        Args:
+            entity_type: Entity type
+            entity_id: Entity ID
+            batch_size: Rows per fetch
+
+        Yields:
+            Audit logs
+        """
+        return self._stream(self._by_entity(entity_type, entity_id), batch_size)
+
+    def iter_by_action(self, action: str, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[AuditLog]:
+        """Stream all audit logs by action, newest first.
+
+        Args:
+            action: Action type (CREATE, UPDATE, DELETE)
+            batch_size: Rows per fetch
+
+        Yields:
+            Audit logs
+        """
+        return self._stream(self._by_action(action), batch_size)
 
     def get_user_paginated(
         self,
         user_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        since: Optional[datetime] = None
     ) -> tuple[List[AuditLog], int]:
-        """Get audit logs by user with pagination.
+        """Get recent audit logs by user with pagination, newest first.
+
+        The ``created_at`` lower bound lets PostgreSQL prune partitions older
+        than the window instead of scanning the whole history.
 
         Args:
             user_id: User ID
             skip: Number to skip
             limit: Limit
+            since: Oldest entry to include (defaults to the last 90 days)
 
         Returns:
             Tuple of (audit logs, total count)
         """
-        return self.filter_by_paginated(skip=skip, limit=limit, user_id=user_id)
+        if since is None:
+            since = datetime.utcnow() - RECENT_WINDOW
+
+        query = self.db.query(AuditLog).filter(
+            AuditLog.user_id == user_id,
+            AuditLog.created_at >= since
+        )
+        total = query.count()
+        records = query.order_by(AuditLog.created_at.desc()).offset(skip).limit(limit).all()
+        return records, total
@@ -1,11 +1,20 @@
 """Base repository with common CRUD operations."""
 
-from typing import Generic, TypeVar, Optional, List, Dict, Any
+from typing import Generic, TypeVar, Optional, List, Dict, Any, Iterable
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc
+from sqlalchemy import desc, asc, delete, insert, update
 
 T = TypeVar('T')
 
+# Maximum IDs bound into a single IN (...) list
+IN_CLAUSE_CHUNK_SIZE = 1000
+
+
+def _chunks(values: List[Any], size: int = IN_CLAUSE_CHUNK_SIZE) -> Iterable[List[Any]]:
+    """Split a list into chunks of at most ``size`` items."""
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
 
 class BaseRepository(Generic[T]):
     """Base repository with common CRUD operations."""
@@ -20,6 +29,17 @@ class BaseRepository(Generic[T]):
         self.db = db
         self.model = model
 
+    def _query(self, columns: tuple = None):
+        """Query over live records, hiding soft-deleted ones awaiting purge.
+
+        Args:
+            columns: Optional columns to select instead of full entities
+        """
+        query = self.db.query(*columns) if columns else self.db.query(self.model)
+        if hasattr(self.model, "deleted_at"):
+            query = query.filter(self.model.deleted_at.is_(None))
+        return query
+
     def create(self, obj_in: Dict[str, Any]) -> T:
         """Create a new record.
 
@@ -34,6 +54,26 @@ class BaseRepository(Generic[T]):
         self.db.flush()
         return db_obj
 
+    def create_many(self, objs_in: List[Dict[str, Any]]) -> List[Any]:
+        """Insert many records without building ORM objects.
+
+        Rows are sent as one executemany (multi-row ``INSERT`` batches on
+        PostgreSQL); Python-side column defaults such as generated IDs and
+        timestamps still apply.
+
+        Args:
+            objs_in: Dictionaries with object data
+
+        Returns:
+            IDs of the created records, in input order
+        """
+        if not objs_in:
+            return []
+        return list(self.db.scalars(
+            insert(self.model).returning(self.model.id, sort_by_parameter_order=True),
+            objs_in
+        ))
+
     def get_by_id(self, obj_id: Any) -> Optional[T]:
         """Get record by ID.
 
@@ -43,7 +83,22 @@ class BaseRepository(Generic[T]):
         Returns:
             Object or None
         """
-        return self.db.query(self.model).filter(self.model.id == obj_id).first()
+        return self._query().filter(self.model.id == obj_id).first()
+
+    def get_many(self, obj_ids: Iterable[Any]) -> Dict[Any, T]:
+        """Get records by ID with one ``IN`` query per 1000 IDs.
+
+        Args:
+            obj_ids: Object IDs
+
+        Returns:
+            Dict of ID -> object; missing IDs are absent
+        """
+        found = {}
+        for chunk in _chunks(list(dict.fromkeys(obj_ids))):
+            for obj in self._query().filter(self.model.id.in_(chunk)):
+                found[obj.id] = obj
+        return found
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
         """Get all records with pagination.
@@ -55,7 +110,7 @@ class BaseRepository(Generic[T]):
         Returns:
             List of objects
         """
-        return self.db.query(self.model).offset(skip).limit(limit).all()
+        return self._query().offset(skip).limit(limit).all()
 
     def get_all_sorted(
         self,
@@ -75,7 +130,7 @@ class BaseRepository(Generic[T]):
         Returns:
             List of sorted objects
         """
-        query = self.db.query(self.model)
+        query = self._query()
 
         if hasattr(self.model, sort_by):
             sort_field = getattr(self.model, sort_by)
@@ -96,15 +151,36 @@ class BaseRepository(Generic[T]):
         Returns:
             Updated object or None
         """
-        db_obj = self.get_by_id(obj_id)
-        if not db_obj:
-            return None
+        return self.partial_update(obj_id, obj_in)
 
-        for key, value in obj_in.items():
-            setattr(db_obj, key, value)
+    def partial_update(self, obj_id: Any, obj_in: Dict[str, Any], **conditions) -> Optional[T]:
+        """Update columns of one record with a single ``UPDATE ... RETURNING``.
 
-        self.db.flush()
-        return db_obj
+        No SELECT is issued first; the returned row refreshes any instance
+        already in the session. Extra ``conditions`` are added to the WHERE
+        clause, so ownership can be checked in the same statement.
+
+        Args:
+            obj_id: Object ID
+            obj_in: Column values to set
+            **conditions: Additional equality filters (e.g. ``owner_id``)
+
+        Returns:
+            Updated object, or None if no row matched
+        """
+        if not obj_in:
+            return self._query().filter_by(id=obj_id, **conditions).first()
+
+        statement = update(self.model).where(self.model.id == obj_id)
+        if hasattr(self.model, "deleted_at"):
+            statement = statement.where(self.model.deleted_at.is_(None))
+        for key, value in conditions.items():
+            statement = statement.where(getattr(self.model, key) == value)
+
+        return self.db.execute(
+            statement.values(**obj_in).returning(self.model),
+            execution_options={"populate_existing": True},
+        ).scalar_one_or_none()
 
     def delete(self, obj_id: Any) -> bool:
         """Delete a record.
@@ -123,13 +199,52 @@ class BaseRepository(Generic[T]):
         self.db.flush()
         return True
 
+    def update_many(self, obj_ids: Iterable[Any], obj_in: Dict[str, Any]) -> int:
+        """Set the same values on many records with set-based UPDATEs.
+
+        Objects already loaded in the session are kept in sync; nothing is
+        loaded from the database.
+
+        Args:
+            obj_ids: Object IDs
+            obj_in: Dictionary with updated data
+
+        Returns:
+            Number of updated records
+        """
+        updated = 0
+        for chunk in _chunks(list(obj_ids)):
+            result = self.db.execute(
+                update(self.model).where(self.model.id.in_(chunk)).values(**obj_in)
+            )
+            updated += result.rowcount
+        return updated
+
+    def delete_many(self, obj_ids: Iterable[Any]) -> int:
+        """Delete many records with set-based DELETEs.
+
+        Related rows are removed by the database's ``ON DELETE`` rules,
+        not by ORM relationship cascades.
+
+        Args:
+            obj_ids: Object IDs
+
+        Returns:
+            Number of deleted records
+        """
+        deleted = 0
+        for chunk in _chunks(list(obj_ids)):
+            result = self.db.execute(delete(self.model).where(self.model.id.in_(chunk)))
+            deleted += result.rowcount
+        return deleted
+
     def count(self) -> int:
         """Count total records.
 
         Returns:
             Total count
         """
-        return self.db.query(self.model).count()
+        return self._query().count()
 
     def filter_by(self, **kwargs) -> List[T]:
         """Filter records by attributes.
@@ -140,7 +255,7 @@ class BaseRepository(Generic[T]):
         Returns:
             List of matching objects
         """
-        query = self.db.query(self.model)
+        query = self._query()
         for key, value in kwargs.items():
             if hasattr(self.model, key):
                 query = query.filter(getattr(self.model, key) == value)
@@ -162,7 +277,7 @@ class BaseRepository(Generic[T]):
         Returns:
             Tuple of (list of objects, total count)
         """
-        query = self.db.query(self.model)
+        query = self._query()
         for key, value in kwargs.items():
             if hasattr(self.model, key):
                 query = query.filter(getattr(self.model, key) == value)
@@ -180,14 +295,14 @@ class BaseRepository(Generic[T]):
         Returns:
             True if record exists
         """
-        query = self.db.query(self.model)
+        query = self._query()
         for key, value in kwargs.items():
             if hasattr(self.model, key):
                 query = query.filter(getattr(self.model, key) == value)
         return query.first() is not None
 
     def delete_all(self, **kwargs) -> int:
-        """Delete all records matching conditions.
+        """Delete all records matching conditions in one statement.
 
         Args:
             **kwargs: Filter conditions
@@ -200,7 +315,5 @@ class BaseRepository(Generic[T]):
             if hasattr(self.model, key):
                 query = query.filter(getattr(self.model, key) == value)
 
-        count = query.count()
-        query.delete()
-        self.db.flush()
-        return count
+        # "fetch" uses DELETE ... RETURNING to evict deleted rows from the session
+        return query.delete(synchronize_session="fetch")
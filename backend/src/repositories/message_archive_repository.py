@@ -0,0 +1,180 @@
+"""Repository for messages archived to segment files."""
+
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from backend.src.config import settings
+from backend.src.models import Message, MessageArchive
+from backend.src.models.compressed import default_codec, get_codecs
+from backend.src.repositories.base_repository import BaseRepository
+from backend.src.utils.segments import SegmentStore
+from backend.src.utils.serialization import dumps, loads
+
+# Message columns written to the archive
+ARCHIVED_COLUMNS = tuple(column.key for column in Message.__table__.columns)
+
+_UUID_FIELDS = ("id", "session_id", "user_id")
+_DATETIME_FIELDS = ("created_at", "updated_at")
+
+
+def encode_messages(messages: List[Dict[str, Any]]) -> bytes:
+    """Serialize and compress a session's messages into one record payload.
+
+    The payload starts with the codec header byte used by ``CompressedText``.
+
+    Args:
+        messages: Message dicts keyed by column name
+
+    Returns:
+        Record payload
+    """
+    codec = default_codec()
+    return bytes([codec.header]) + codec.compress(dumps(messages))
+
+
+def decode_messages(payload: bytes) -> List[Dict[str, Any]]:
+    """Decode a payload written by ``encode_messages``.
+
+    Args:
+        payload: Record payload
+
+    Returns:
+        Message dicts with UUID and datetime values restored
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable
+    """
+    codec = get_codecs().get(payload[0])
+    if codec is None:
+        raise ValueError(f"Cannot decode archive record with codec {payload[0]:#04x}")
+
+    messages = loads(codec.decompress(payload[1:]))
+    for message in messages:
+        for field in _UUID_FIELDS:
+            if message.get(field) is not None:
+                message[field] = uuid.UUID(message[field])
+        for field in _DATETIME_FIELDS:
+            if message.get(field) is not None:
+                message[field] = datetime.fromisoformat(message[field])
+    return messages
+
+
+class MessageArchiveRepository(BaseRepository[MessageArchive]):
+    """Repository for the archive index and its segment files."""
+
+    def __init__(self, db: Session, store: SegmentStore = None):
+        """Initialize message archive repository.
+
+        Args:
+            db: SQLAlchemy session
+            store: Segment store (defaults to ARCHIVE_DIR)
+        """
+        super().__init__(db, MessageArchive)
+        self.store = store or SegmentStore(
+            settings.ARCHIVE_DIR, settings.ARCHIVE_SEGMENT_MAX_BYTES
+        )
+
+    def get(self, session_id: UUID) -> Optional[MessageArchive]:
+        """Get a session's archive entry.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Archive entry or None if the session is not archived
+        """
+        return self.db.get(MessageArchive, session_id)
+
+    def write(self, session_id: UUID, messages: List[Dict[str, Any]]) -> MessageArchive:
+        """Append a session's messages to the current segment and index them.
+
+        The segment write is durable before the index row is flushed; if the
+        transaction is rolled back the record is left unreferenced.
+
+        Args:
+            session_id: Session ID
+            messages: Message dicts keyed by column name, in seq order
+
+        Returns:
+            Archive entry
+        """
+        segment, offset, length = self.store.append(encode_messages(messages))
+        entry = MessageArchive(
+            session_id=session_id,
+            segment=segment,
+            offset=offset,
+            length=length,
+            message_count=len(messages),
+            last_message_at=max((m["created_at"] for m in messages if m["created_at"]), default=None),
+        )
+        self.db.add(entry)
+        self.db.flush()
+        return entry
+
+    def load(self, session_id: UUID) -> Optional[List[Dict[str, Any]]]:
+        """Read a session's archived messages back from its segment.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Message dicts in seq order, or None if the session is not archived
+
+        Raises:
+            ValueError: If the record cannot be read or decoded
+        """
+        entry = self.get(session_id)
+        if entry is None:
+            return None
+        return self.read(entry)
+
+    def live_bytes(self) -> Dict[int, int]:
+        """Get the bytes of referenced records per segment.
+
+        Returns:
+            Dict of segment -> total length of its indexed records
+        """
+        return dict(self.db.execute(
+            select(MessageArchive.segment, func.sum(MessageArchive.length))
+            .group_by(MessageArchive.segment)
+        ).all())
+
+    def relocate(self, segment: int) -> int:
+        """Copy a segment's indexed records to the newest segment.
+
+        The index rows are locked, so concurrent compactions of the same
+        segment move each record once. The caller commits, then removes the
+        old segment.
+
+        Args:
+            segment: Segment number
+
+        Returns:
+            Number of records moved
+        """
+        entries = self.db.scalars(
+            select(MessageArchive).where(MessageArchive.segment == segment).with_for_update()
+        ).all()
+        for entry in entries:
+            payload = self.store.read(entry.segment, entry.offset, entry.length)
+            entry.segment, entry.offset, entry.length = self.store.append(payload)
+        self.db.flush()
+        return len(entries)
+
+    def read(self, entry: MessageArchive) -> List[Dict[str, Any]]:
+        """Read the messages of an archive entry.
+
+        Args:
+            entry: Archive entry
+
+        Returns:
+            Message dicts in seq order
+
+        Raises:
+            ValueError: If the record cannot be read or decoded
+        """
+        return decode_messages(self.store.read(entry.segment, entry.offset, entry.length))
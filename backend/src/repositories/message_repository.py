@@ -1,19 +1,218 @@
 """Message repository for message data access."""
 
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import update
+from sqlalchemy.engine.result import result_tuple
+from sqlalchemy.orm import Session, load_only
 
-from backend.src.models import Message
-from backend.src.repositories.base_repository import BaseRepository
+from backend.src.models import Message, Session as SessionModel
+from backend.src.models.jsonb import json_has_key
+from backend.src.models.message_search import index_updated_messages, index_written_messages
+from backend.src.repositories.base_repository import BaseRepository, _chunks
+from backend.src.repositories.message_archive_repository import MessageArchiveRepository
 
 
 class MessageRepository(BaseRepository[Message]):
-    """Repository for Message model."""
+    """Repository for Message model.
+
+    Messages of archived sessions are moved out of the ``messages`` table
+    into segment files (see ``ArchiveService``). Session-scoped reads that
+    find no rows for an ``ARCHIVED`` session fall back to the archive and
+    rehydrate the session's messages as transient ``Message`` objects, or as rows of ``columns``,
+    so callers see the same results either way.
+    """
 
     def __init__(self, db: Session):
         """Initialize message repository."""
         super().__init__(db, Message)
+        self.archive = MessageArchiveRepository(db)
+        self._entries: Dict[UUID, Any] = {}
+        self._rehydrated: Dict[UUID, Optional[List[Message]]] = {}
+
+    def _archived(self, session_id: UUID) -> Optional[List[Message]]:
+        """Get an archived session's messages in seq order (None if not archived).
+
+        Each session's archive record is read at most once per repository.
+        """
+        if session_id not in self._rehydrated:
+            entry = self._archive_entry(session_id)
+            self._rehydrated[session_id] = None if entry is None else [
+                Message(**message) for message in self.archive.read(entry)
+            ]
+        return self._rehydrated[session_id]
+
+    def _archive_entry(self, session_id: UUID):
+        """Get a session's archive entry, looked up at most once per repository.
+
+        Only ``ARCHIVED`` sessions are moved to the archive, so other empty
+        sessions skip the lookup. The session is usually already in the
+        identity map, loaded by the caller's ownership check.
+        """
+        if session_id not in self._entries:
+            session = self.db.get(SessionModel, session_id)
+            archived = session is not None and session.status == "ARCHIVED"
+            self._entries[session_id] = self.archive.get(session_id) if archived else None
+        return self._entries[session_id]
+
+    @staticmethod
+    def _project(messages: List[Message], columns: tuple = None) -> list:
+        """Shape rehydrated messages like the equivalent query result."""
+        if not columns:
+            return messages
+        make_row = result_tuple([column.key for column in columns])
+        return [
+            make_row(tuple(getattr(message, column.key) for column in columns))
+            for message in messages
+        ]
+
+    def allocate_seq(self, session_id: UUID, count: int = 1) -> int:
+        """Reserve the next sequence numbers for a session's messages.
+
+        Increments ``sessions.message_seq`` and ``sessions.message_count`` in
+        a single ``UPDATE ... RETURNING``: every reserved number is for a
+        message about to be inserted. The row lock taken by the update
+        serializes concurrent writers of the same session until commit, so
+        numbers are never handed out twice.
+
+        Args:
+            session_id: Session ID
+            count: How many consecutive numbers to reserve
+
+        Returns:
+            First reserved sequence number
+        """
+        last_seq = self.db.execute(
+            update(SessionModel)
+            .where(SessionModel.id == session_id)
+            .values(
+                message_seq=SessionModel.message_seq + count,
+                message_count=SessionModel.message_count + count,
+                updated_at=SessionModel.updated_at,
+            )
+            .returning(SessionModel.message_seq)
+        ).scalar_one()
+        return last_seq - count + 1
+
+    def record_inserted(self, session_id: UUID, count: int = 1) -> None:
+        """Count messages inserted with explicit seq numbers.
+
+        Args:
+            session_id: Session ID
+            count: Number of messages inserted
+        """
+        self.db.execute(
+            update(SessionModel)
+            .where(SessionModel.id == session_id)
+            .values(
+                message_count=SessionModel.message_count + count,
+                updated_at=SessionModel.updated_at,
+            ),
+            execution_options={"synchronize_session": False},
+        )
+
+    def record_deleted(self, session_id: UUID, count: int = 1) -> None:
+        """Uncount deleted messages and bump the session's message version.
+
+        ``sessions.message_seq`` also advances, so versions derived from it
+        (ETags, cached transcripts) change even though no message was added.
+
+        Args:
+            session_id: Session ID
+            count: Number of messages deleted
+        """
+        self.db.execute(
+            update(SessionModel)
+            .where(SessionModel.id == session_id)
+            .values(
+                message_seq=SessionModel.message_seq + 1,
+                message_count=SessionModel.message_count - count,
+                updated_at=SessionModel.updated_at,
+            ),
+            execution_options={"synchronize_session": False},
+        )
+
+    def create(self, obj_in: Dict[str, Any]) -> Message:
+        """Create a message, assigning the next session sequence number.
+
+        Args:
+            obj_in: Dictionary with message data
+
+        Returns:
+            Created message
+        """
+        if obj_in.get("seq") is None:
+            obj_in = dict(obj_in, seq=self.allocate_seq(obj_in["session_id"]))
+        else:
+            self.record_inserted(obj_in["session_id"])
+        return super().create(obj_in)
+
+    def create_many(self, objs_in: List[Dict[str, Any]]) -> List[Any]:
+        """Insert many messages, reserving seq numbers once per session.
+
+        Session message counters are updated with one statement per session.
+
+        Args:
+            objs_in: Dictionaries with message data
+
+        Returns:
+            IDs of the created messages, in input order
+        """
+        needed: Dict[Any, int] = {}
+        numbered: Dict[Any, int] = {}
+        for obj_in in objs_in:
+            counts = needed if obj_in.get("seq") is None else numbered
+            counts[obj_in["session_id"]] = counts.get(obj_in["session_id"], 0) + 1
+
+        next_seq = {
+            session_id: self.allocate_seq(session_id, count)
+            for session_id, count in needed.items()
+        }
+        for session_id, count in numbered.items():
+            self.record_inserted(session_id, count)
+        rows = []
+        for obj_in in objs_in:
+            if obj_in.get("seq") is None:
+                session_id = obj_in["session_id"]
+                obj_in = dict(obj_in, seq=next_seq[session_id])
+                next_seq[session_id] += 1
+            rows.append(obj_in)
+        ids = super().create_many(rows)
+        index_written_messages(self.db.connection(), rows)
+        return ids
+
+    def partial_update(self, obj_id: Any, obj_in: Dict[str, Any], **conditions) -> Optional[Message]:
+        """Update columns of one message, keeping the search index current.
+
+        Args:
+            obj_id: Message ID
+            obj_in: Column values to set
+            **conditions: Additional equality filters
+
+        Returns:
+            Updated message, or None if no row matched
+        """
+        message = super().partial_update(obj_id, obj_in, **conditions)
+        if message is not None:
+            index_updated_messages(self.db.connection(), [message.id], obj_in)
+        return message
+
+    def update_many(self, obj_ids: Iterable[Any], obj_in: Dict[str, Any]) -> int:
+        """Set the same values on many messages, keeping the search index current.
+
+        Args:
+            obj_ids: Message IDs
+            obj_in: Dictionary with updated data
+
+        Returns:
+            Number of updated messages
+        """
+        obj_ids = list(obj_ids)
+        updated = super().update_many(obj_ids, obj_in)
+        if updated:
+            for chunk in _chunks(obj_ids):
+                index_updated_messages(self.db.connection(), chunk, obj_in)
+        return updated
 
     def get_by_session(
         self,
@@ -31,17 +230,23 @@ class MessageRepository(BaseRepository[Message]):
         Returns:
             List of messages
         """
-        return self.db.query(Message).filter(
+        messages = self.db.query(Message).filter(
             Message.session_id == session_id
         ).offset(skip).limit(limit).all()
+        if not messages:
+            archived = self._archived(session_id)
+            if archived is not None:
+                return archived[skip:skip + limit]
+        return messages
 
     def get_by_session_sorted(
         self,
         session_id: UUID,
         skip: int = 0,
         limit: int = 50,
-        sort_order: str = "asc"
-    ) -> List[Message]:
+        sort_order: str = "asc",
+        columns: tuple = None
+    ) -> list:
         """Get messages by session sorted.
 
         Args:
@@ -49,19 +254,56 @@ class MessageRepository(BaseRepository[Message]):
             skip: Number to skip
             limit: Limit
             sort_order: 'asc' or 'desc'
+            columns: Optional columns to select instead of full entities
 
         Returns:
-            List of messages sorted
+            List of messages sorted, or rows of ``columns`` if given
         """
         from sqlalchemy import asc, desc
-        query = self.db.query(Message).filter(Message.session_id == session_id)
+        query = self.db.query(*columns) if columns else self.db.query(Message)
+        query = query.filter(Message.session_id == session_id)
 
         if sort_order.lower() == "desc":
             query = query.order_by(desc(Message.created_at))
         else:
             query = query.order_by(asc(Message.created_at))
 
-        return query.offset(skip).limit(limit).all()
+        messages = query.offset(skip).limit(limit).all()
+        if not messages:
+            archived = self._archived(session_id)
+            if archived is not None:
+                archived = sorted(
+                    archived,
+                    key=lambda message: message.created_at,
+                    reverse=sort_order.lower() == "desc"
+                )
+                return self._project(archived[skip:skip + limit], columns)
+        return messages
+
+    def get_context_window(self, session_id: UUID, limit: int = 10) -> List[Message]:
+        """Get a session's latest messages, oldest first, for LLM context.
+
+        Loads only ``role`` and ``content``; other attributes are deferred.
+        Messages still waiting for a seq (the one being answered) are skipped.
+
+        Args:
+            session_id: Session ID
+            limit: Number of most recent messages
+
+        Returns:
+            List of messages in conversation order
+        """
+        recent = self.db.query(Message).options(
+            load_only(Message.role, Message.content, Message.seq)
+        ).filter(
+            Message.session_id == session_id,
+            Message.seq.isnot(None)
+        ).order_by(Message.seq.desc()).limit(limit).all()
+        if not recent:
+            archived = self._archived(session_id)
+            if archived is not None:
+                return archived[-limit:] if limit else []
+        return recent[::-1]
 
     def get_by_session_count(self, session_id: UUID) -> int:
         """Get message count for session.
@@ -72,9 +314,14 @@ class MessageRepository(BaseRepository[Message]):
         Returns:
             Message count
         """
-        return self.db.query(Message).filter(
+        count = self.db.query(Message).filter(
             Message.session_id == session_id
         ).count()
+        if not count:
+            entry = self._archive_entry(session_id)
+            if entry is not None:
+                return entry.message_count
+        return count
 
     def get_by_user_and_session(
         self,
@@ -90,10 +337,15 @@ class MessageRepository(BaseRepository[Message]):
         Returns:
             List of messages
         """
-        return self.db.query(Message).filter(
+        messages = self.db.query(Message).filter(
             Message.session_id == session_id,
             Message.user_id == user_id
         ).all()
+        if not messages:
+            archived = self._archived(session_id)
+            if archived is not None:
+                return [message for message in archived if message.user_id == user_id]
+        return messages
 
     def get_by_role(self, session_id: UUID, role: str) -> List[Message]:
         """Get messages by session and role.
@@ -105,7 +357,75 @@ class MessageRepository(BaseRepository[Message]):
         Returns:
             List of messages
         """
-        return self.db.query(Message).filter(
+        messages = self.db.query(Message).filter(
             Message.session_id == session_id,
             Message.role == role
         ).all()
+        if not messages:
+            archived = self._archived(session_id)
+            if archived is not None:
+                return [message for message in archived if message.role == role]
+        return messages
+
+    def get_by_meta_key(
+        self,
+        session_id: UUID,
+        key: str,
+        columns: tuple = None
+    ) -> list:
+        """Get a session's messages whose metadata has a key, in order.
+
+        Uses the GIN index on ``meta`` on PostgreSQL.
+
+        Args:
+            session_id: Session ID
+            key: Top-level metadata key
+            columns: Optional columns to select instead of full entities
+
+        Returns:
+            List of messages, or rows of ``columns`` if given
+        """
+        messages = self._query(columns).filter(
+            Message.session_id == session_id,
+            json_has_key(Message.meta, key)
+        ).order_by(Message.seq).all()
+        if not messages:
+            archived = self._archived(session_id)
+            if archived is not None:
+                return self._project(
+                    [message for message in archived if key in (message.meta or {})], columns
+                )
+        return messages
+
+    def get_after_seq(
+        self,
+        session_id: UUID,
+        after_seq: int,
+        limit: int,
+        columns: tuple = None
+    ) -> list:
+        """Get messages added after a sequence number, oldest first.
+
+        Served by the (session_id, seq) index, so the cost is proportional
+        to the number of returned messages rather than the session length.
+
+        Args:
+            session_id: Session ID
+            after_seq: Last sequence number the client has seen
+            limit: Limit
+            columns: Optional columns to select instead of full entities
+
+        Returns:
+            List of messages, or rows of ``columns`` if given
+        """
+        query = self.db.query(*columns) if columns else self.db.query(Message)
+        messages = query.filter(
+            Message.session_id == session_id,
+            Message.seq > after_seq
+        ).order_by(Message.seq.asc()).limit(limit).all()
+        if not messages:
+            archived = self._archived(session_id)
+            if archived is not None:
+                newer = [m for m in archived if m.seq is not None and m.seq > after_seq]
+                return self._project(newer[:limit], columns)
+        return messages
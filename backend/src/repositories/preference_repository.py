@@ -15,18 +15,32 @@ class PreferenceRepository(BaseRepository[UserPreference]):
         """Initialize preference repository."""
         super().__init__(db, UserPreference)
 
-    def get_by_user_id(self, user_id: UUID) -> Optional[UserPreference]:
+    def get_by_user_id(self, user_id: UUID, columns: tuple = None):
         """Get preferences by user ID.
 
         Args:
             user_id: User ID
+            columns: Optional columns to select instead of the entity
 
         Returns:
-            UserPreference or None
+            UserPreference (or row of ``columns``) or None
         """
-        return self.db.query(UserPreference).filter(
-            UserPreference.user_id == user_id
-        ).first()
+        query = self.db.query(*columns) if columns else self.db.query(UserPreference)
+        return query.filter(UserPreference.user_id == user_id).first()
+
+    def get_version(self, user_id: UUID):
+        """Get the columns that identify a user's preferences version.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Row with id and updated_at, or None if no preferences exist
+        """
+        return self.db.query(
+            UserPreference.id,
+            UserPreference.updated_at,
+        ).filter(UserPreference.user_id == user_id).first()
 
     def create_for_user(self, user_id: UUID) -> UserPreference:
         """Create default preferences for user.
@@ -5,6 +5,7 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from backend.src.models import Project
+from backend.src.models.jsonb import json_contains
 from backend.src.repositories.base_repository import BaseRepository
 
 
@@ -36,7 +37,7 @@ class ProjectRepository(BaseRepository[Project]):
         Returns:
             List of projects
         """
-        return self.db.query(Project).filter(
+        return self._query().filter(
             Project.owner_id == owner_id,
             Project.status == status
         ).all()
@@ -52,6 +53,23 @@ class ProjectRepository(BaseRepository[Project]):
         """
         return self.filter_by(status=status)
 
+    def get_by_technology(self, owner_id: UUID, technology: str) -> List[Project]:
+        """Get an owner's projects whose technology stack includes an entry.
+
+        Uses the GIN index on ``technology_stack`` on PostgreSQL.
+
+        Args:
+            owner_id: Owner user ID
+            technology: Technology name, matched exactly
+
+        Returns:
+            List of projects
+        """
+        return self._query().filter(
+            Project.owner_id == owner_id,
+            json_contains(Project.technology_stack, technology)
+        ).all()
+
     def get_by_owner_paginated(
         self,
         owner_id: UUID,
@@ -69,3 +87,46 @@ class ProjectRepository(BaseRepository[Project]):
             Tuple of (projects, total count)
         """
         return self.filter_by_paginated(skip=skip, limit=limit, owner_id=owner_id)
+
+    def list_by_owner(
+        self,
+        owner_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        status: str = None,
+        columns: tuple = None,
+        technology: str = None
+    ) -> list:
+        """Get a page of an owner's projects, newest first.
+
+        Args:
+            owner_id: Owner user ID
+            skip: Number to skip
+            limit: Limit
+            status: Optional status filter
+            columns: Optional columns to select instead of full entities
+            technology: Optional entry the technology stack must contain
+
+        Returns:
+            List of projects, or rows of ``columns`` if given
+        """
+        query = self._query(columns).filter(Project.owner_id == owner_id)
+        if status:
+            query = query.filter(Project.status == status)
+        if technology:
+            query = query.filter(json_contains(Project.technology_stack, technology))
+        return query.order_by(Project.created_at.desc()).offset(skip).limit(limit).all()
+
+    def get_version(self, project_id: UUID):
+        """Get the columns that identify a project's current version.
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Row with owner_id and updated_at, or None if not found
+        """
+        return self.db.query(
+            Project.owner_id,
+            Project.updated_at,
+        ).filter(Project.id == project_id, Project.deleted_at.is_(None)).first()
@@ -0,0 +1,213 @@
+"""Full-text search repository for message history."""
+
+import html
+from typing import Any, Dict, List, Tuple
+from uuid import UUID
+from sqlalchemy import column, func, literal_column, select, table, text
+from sqlalchemy.orm import Session
+
+from backend.src.models import Message, Session as SessionModel
+from backend.src.models.message_search import (
+    TS_CONFIG,
+    index_compressed_messages,
+    message_content_tsvector,
+)
+from backend.src.repositories.base_repository import BaseRepository
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+SNIPPET_WORDS = 16
+
+# Private-use characters the database wraps matches in; the snippet is
+# HTML-escaped before they are replaced with HIGHLIGHT_START/STOP
+_MATCH_START = "\ue000"
+_MATCH_STOP = "\ue001"
+
+# Columns returned for every hit
+RESULT_COLUMNS = (
+    Message.id.label("message_id"),
+    Message.session_id,
+    SessionModel.project_id,
+    Message.seq,
+    Message.role,
+    Message.created_at,
+)
+
+
+def highlight(snippet: str) -> str:
+    """Turn a raw database snippet into safe HTML.
+
+    Message text is escaped, so markup users wrote is shown literally; only
+    the match markers become HIGHLIGHT_START/STOP tags.
+
+    Args:
+        snippet: Snippet with matches wrapped in the private-use markers
+
+    Returns:
+        HTML snippet
+    """
+    return (
+        html.escape(snippet or "", quote=False)
+        .replace(_MATCH_START, HIGHLIGHT_START)
+        .replace(_MATCH_STOP, HIGHLIGHT_STOP)
+    )
+
+
+class _PostgresSearch:
+    """tsvector / GIN backed search."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search(self, query: str, filters: list, skip: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        tsquery = func.plainto_tsquery(TS_CONFIG, query)
+        match = message_content_tsvector.op("@@")(tsquery)
+        rank = func.ts_rank_cd(message_content_tsvector, tsquery)
+
+        base = select(Message.id).join(
+            SessionModel, SessionModel.id == Message.session_id
+        ).where(match, *filters)
+
+        total = self.db.execute(
+            select(func.count()).select_from(base.subquery())
+        ).scalar_one()
+
+        # Rank and page first, then build headlines only for the page
+        page = base.add_columns(rank.label("rank")).order_by(
+            rank.desc(), Message.created_at.desc()
+        ).offset(skip).limit(limit).subquery()
+
+        snippet = func.ts_headline(
+            TS_CONFIG,
+            Message.content,
+            tsquery,
+            f"StartSel={_MATCH_START}, StopSel={_MATCH_STOP}, "
+            f"MaxWords={SNIPPET_WORDS}, MinWords=5, MaxFragments=2",
+        )
+        rows = self.db.execute(
+            select(*RESULT_COLUMNS, page.c.rank, snippet.label("snippet"))
+            .join(page, page.c.id == Message.id)
+            .join(SessionModel, SessionModel.id == Message.session_id)
+            .order_by(page.c.rank.desc(), Message.created_at.desc())
+        ).all()
+        return [dict(row._mapping) for row in rows], total
+
+    def rebuild(self) -> None:
+        """No-op: the GIN expression index is maintained by PostgreSQL."""
+
+
+class _SQLiteSearch:
+    """FTS5 backed search."""
+
+    fts = table("messages_fts", column("message_id"))
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def _match_expression(query: str) -> str:
+        """Quote each term so user input cannot use FTS5 query syntax."""
+        terms = [term.replace('"', '""') for term in query.split()]
+        return " ".join(f'"{term}"' for term in terms)
+
+    def search(self, query: str, filters: list, skip: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        fts_table = literal_column("messages_fts")
+        match = fts_table.op("MATCH")(self._match_expression(query))
+
+        base = select(Message.id).select_from(self.fts).join(
+            Message, Message.id == self.fts.c.message_id
+        ).join(
+            SessionModel, SessionModel.id == Message.session_id
+        ).where(match, *filters)
+
+        total = self.db.execute(
+            select(func.count()).select_from(base.subquery())
+        ).scalar_one()
+
+        # bm25() is lower-is-better; negate so both backends rank descending
+        rank = (-func.bm25(fts_table)).label("rank")
+        snippet = func.snippet(
+            fts_table, 0, _MATCH_START, _MATCH_STOP, "…", SNIPPET_WORDS
+        ).label("snippet")
+
+        rows = self.db.execute(
+            base.with_only_columns(*RESULT_COLUMNS, rank, snippet)
+            .order_by(rank.desc(), Message.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        ).all()
+        return [dict(row._mapping) for row in rows], total
+
+    def rebuild(self) -> None:
+        """Rebuild the FTS5 index from the messages table.
+
+        Entries are keyed on message ids, so ``VACUUM`` does not require
+        this; it recovers from messages written with the triggers missing.
+        """
+        self.db.execute(text("DELETE FROM messages_fts"))
+        self.db.execute(text("DELETE FROM messages_fts_keys"))
+        self.db.execute(text(
+            "INSERT INTO messages_fts_keys(message_id) "
+            "SELECT id FROM messages WHERE typeof(content) = 'text'"
+        ))
+        self.db.execute(text(
+            "INSERT INTO messages_fts(rowid, content, message_id) "
+            "SELECT messages_fts_keys.fts_rowid, messages.content, messages.id "
+            "FROM messages JOIN messages_fts_keys ON messages_fts_keys.message_id = messages.id"
+        ))
+        index_compressed_messages(self.db.connection())
+
+
+class MessageSearchRepository(BaseRepository[Message]):
+    """Repository for ranked full-text search over message content.
+
+    Dispatches to PostgreSQL (tsvector + GIN) or SQLite (FTS5) depending on
+    the bound engine; both return the same result shape.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize message search repository."""
+        super().__init__(db, Message)
+        if db.get_bind().dialect.name == "postgresql":
+            self.backend = _PostgresSearch(db)
+        else:
+            self.backend = _SQLiteSearch(db)
+
+    def search(
+        self,
+        owner_id: UUID,
+        query: str,
+        project_id: UUID = None,
+        session_id: UUID = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Search messages in sessions owned by a user.
+
+        Args:
+            owner_id: Owner user ID
+            query: Search text
+            project_id: Optional project scope
+            session_id: Optional session scope
+            skip: Number to skip
+            limit: Limit
+
+        Returns:
+            Tuple of (hits ordered by rank, total count). Each hit has
+            message_id, session_id, project_id, seq, role, created_at,
+            rank and an HTML-escaped snippet with matches in <mark> tags.
+        """
+        filters = [SessionModel.owner_id == owner_id, SessionModel.deleted_at.is_(None)]
+        if project_id:
+            filters.append(SessionModel.project_id == project_id)
+        if session_id:
+            filters.append(Message.session_id == session_id)
+
+        hits, total = self.backend.search(query, filters, skip, limit)
+        for hit in hits:
+            hit["snippet"] = highlight(hit["snippet"])
+        return hits, total
+
+    def rebuild_index(self) -> None:
+        """Rebuild the search index from the messages table."""
+        self.backend.rebuild()
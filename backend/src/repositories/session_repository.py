@@ -1,10 +1,12 @@
 """Session repository for session data access."""
 
+from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select, true, update
+from sqlalchemy.orm import Session, aliased
 
-from backend.src.models import Session as SessionModel
+from backend.src.models import Message, MessageArchive, Session as SessionModel
 from backend.src.repositories.base_repository import BaseRepository
 
 
@@ -47,7 +49,7 @@ class SessionRepository(BaseRepository[SessionModel]):
         Returns:
             List of sessions
         """
-        return self.db.query(SessionModel).filter(
+        return self._query().filter(
             SessionModel.owner_id == owner_id,
             SessionModel.status == status
         ).all()
@@ -80,3 +82,207 @@ class SessionRepository(BaseRepository[SessionModel]):
             Tuple of (sessions, total count)
         """
         return self.filter_by_paginated(skip=skip, limit=limit, owner_id=owner_id)
+
+    def list_by_owner(
+        self,
+        owner_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        project_id: UUID = None,
+        status: str = None,
+        columns: tuple = None
+    ) -> list:
+        """Get a page of an owner's sessions, newest first.
+
+        Args:
+            owner_id: Owner user ID
+            skip: Number to skip
+            limit: Limit
+            project_id: Optional project filter
+            status: Optional status filter
+            columns: Optional columns to select instead of full entities
+
+        Returns:
+            List of sessions, or rows of ``columns`` if given
+        """
+        return self._owner_page(owner_id, skip, limit, project_id, status, columns).all()
+
+    def list_by_owner_with_last_message(
+        self,
+        owner_id: UUID,
+        columns: tuple,
+        skip: int = 0,
+        limit: int = 100,
+        project_id: UUID = None,
+        status: str = None
+    ) -> list:
+        """Get a page of an owner's sessions with their last messages.
+
+        One query: the page of sessions is selected first, then joined to
+        each session's last message, found through
+        ``idx_messages_session_seq``. PostgreSQL uses a ``LATERAL`` subquery
+        (one index probe per session); SQLite ranks the page's message IDs
+        with ``row_number()`` and reads role, content and timestamp only for
+        the top-ranked one. Message counts are the maintained
+        ``sessions.message_count`` (select it in ``columns``). Sessions in
+        cold storage take their last activity from their archive entry and
+        have no last message.
+
+        Args:
+            owner_id: Owner user ID
+            columns: Session columns to select; must include id and created_at
+            skip: Number to skip
+            limit: Limit
+            project_id: Optional project filter
+            status: Optional status filter
+
+        Returns:
+            Rows of ``columns`` plus last_message_role, last_message_content
+            and last_message_at, newest first
+        """
+        page = self._owner_page(owner_id, skip, limit, project_id, status, columns).subquery("page")
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            last = (
+                select(Message.role, Message.content, Message.created_at)
+                .where(Message.session_id == page.c.id)
+                .order_by(Message.seq.desc())
+                .limit(1)
+                .lateral("last_message")
+            )
+            joined = page.outerjoin(last, true())
+            last = last.c
+        else:
+            ranked = (
+                select(
+                    Message.session_id,
+                    Message.id,
+                    func.row_number().over(
+                        partition_by=Message.session_id, order_by=Message.seq.desc()
+                    ).label("position"),
+                )
+                .where(Message.session_id.in_(select(page.c.id)))
+                .subquery("ranked")
+            )
+            last = aliased(Message, name="last_message")
+            joined = page.outerjoin(
+                ranked, and_(ranked.c.session_id == page.c.id, ranked.c.position == 1)
+            ).outerjoin(last, last.id == ranked.c.id)
+
+        statement = select(
+            page,
+            last.role.label("last_message_role"),
+            last.content.label("last_message_content"),
+            func.coalesce(last.created_at, MessageArchive.last_message_at).label("last_message_at"),
+        ).select_from(
+            joined.outerjoin(MessageArchive, MessageArchive.session_id == page.c.id)
+        ).order_by(page.c.created_at.desc())
+        return self.db.execute(statement).all()
+
+    def recount_messages(self, created_before: datetime) -> int:
+        """Recompute ``message_count`` after messages were removed in bulk.
+
+        Used after message retention, which drops rows without going
+        through the counters. Only sessions created before ``created_before``
+        can have lost messages. ``message_seq`` is bumped as for deletes.
+
+        Args:
+            created_before: Cutoff of the removed messages
+
+        Returns:
+            Number of sessions updated
+        """
+        hot_count = select(func.count(Message.id)).where(
+            Message.session_id == SessionModel.id
+        ).scalar_subquery()
+        archived_count = select(MessageArchive.message_count).where(
+            MessageArchive.session_id == SessionModel.id
+        ).scalar_subquery()
+        result = self.db.execute(
+            update(SessionModel)
+            .where(SessionModel.created_at < created_before)
+            .values(
+                message_count=hot_count + func.coalesce(archived_count, 0),
+                message_seq=SessionModel.message_seq + 1,
+                updated_at=SessionModel.updated_at,
+            ),
+            execution_options={"synchronize_session": False},
+        )
+        return result.rowcount
+
+    def _owner_page(
+        self,
+        owner_id: UUID,
+        skip: int,
+        limit: int,
+        project_id: UUID = None,
+        status: str = None,
+        columns: tuple = None
+    ):
+        """Build the query for a page of an owner's sessions, newest first."""
+        query = self._query(columns).filter(SessionModel.owner_id == owner_id)
+        if project_id:
+            query = query.filter(SessionModel.project_id == project_id)
+        if status:
+            query = query.filter(SessionModel.status == status)
+        return query.order_by(SessionModel.created_at.desc()).offset(skip).limit(limit)
+
+    def get_recent_with_last_message(self, owner_id: UUID, limit: int = 5) -> list:
+        """Get an owner's most recently updated sessions with their last message.
+
+        The last message is joined on ``(session_id, max(seq))``, so each
+        session costs one probe of ``idx_messages_session_seq``. Sessions
+        whose messages are in cold storage have no last message.
+
+        Args:
+            owner_id: Owner user ID
+            limit: Number of sessions
+
+        Returns:
+            Rows of id, name, status, mode, project_id, updated_at,
+            last_message_role, last_message_content and last_message_at
+        """
+        latest = aliased(Message)
+        last_seq = (
+            select(func.max(latest.seq))
+            .where(latest.session_id == SessionModel.id)
+            .correlate(SessionModel)
+            .scalar_subquery()
+        )
+        return self._query((
+            SessionModel.id,
+            SessionModel.name,
+            SessionModel.status,
+            SessionModel.mode,
+            SessionModel.project_id,
+            SessionModel.updated_at,
+            Message.role.label("last_message_role"),
+            Message.content.label("last_message_content"),
+            Message.created_at.label("last_message_at"),
+        )).outerjoin(
+            Message, and_(Message.session_id == SessionModel.id, Message.seq == last_seq)
+        ).filter(
+            SessionModel.owner_id == owner_id
+        ).order_by(SessionModel.updated_at.desc()).limit(limit).all()
+
+    def get_version(self, session_id: UUID):
+        """Get the columns that identify a session's current version.
+
+        Reads only the session row: ``message_seq`` advances on every
+        message added or deleted and ``message_count`` is maintained by
+        those writes, so conditional requests cost one primary-key lookup
+        however long the session is.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Row with owner_id, updated_at, message_seq and message_count,
+            or None if the session does not exist
+        """
+        return self.db.query(
+            SessionModel.owner_id,
+            SessionModel.updated_at,
+            SessionModel.message_seq,
+            SessionModel.message_count,
+        ).filter(SessionModel.id == session_id, SessionModel.deleted_at.is_(None)).first()
@@ -0,0 +1,167 @@
+"""Repository for materialized session transcripts."""
+
+import gzip
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from backend.src.config import settings
+from backend.src.models import Session as SessionModel, SessionTranscript
+from backend.src.repositories.base_repository import BaseRepository
+from backend.src.utils.serialization import dumps, loads
+
+GZIP_LEVEL = 6
+
+
+def encode_chunk(rows: List[Dict[str, Any]]) -> bytes:
+    """Serialize rows as NDJSON in a single gzip member.
+
+    Members can be concatenated; ``gzip.decompress`` reads them as one stream.
+
+    Args:
+        rows: Message dicts
+
+    Returns:
+        gzip member
+    """
+    lines = b"".join(dumps(row) + b"\n" for row in rows)
+    return gzip.compress(lines, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def decode_rows(data: bytes) -> List[Dict[str, Any]]:
+    """Decode a transcript blob into message dicts, in one JSON parse.
+
+    Args:
+        data: Concatenated gzip members written by ``encode_chunk``
+
+    Returns:
+        Message dicts (JSON values: ids and timestamps are strings)
+    """
+    lines = gzip.decompress(data).splitlines()
+    return loads(b"[" + b",".join(lines) + b"]")
+
+
+class TranscriptRepository(BaseRepository[SessionTranscript]):
+    """Repository for SessionTranscript model."""
+
+    def __init__(self, db: Session):
+        """Initialize transcript repository."""
+        super().__init__(db, SessionTranscript)
+
+    def get_current(self, session_id: UUID) -> Tuple[Optional[SessionTranscript], Optional[int]]:
+        """Get a session's transcript if it is up to date, in one query.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Tuple of (transcript or None if missing or stale, the session's
+            ``message_seq`` or None if the session does not exist)
+        """
+        row = self.db.execute(
+            select(SessionModel.message_seq, SessionTranscript)
+            .outerjoin(SessionTranscript, SessionTranscript.session_id == SessionModel.id)
+            .where(SessionModel.id == session_id)
+        ).first()
+        if row is None:
+            return None, None
+        message_seq, transcript = row
+        if transcript is not None and transcript.last_seq != message_seq:
+            transcript = None
+        return transcript, message_seq
+
+    def replace(
+        self,
+        session_id: UUID,
+        rows: List[Dict[str, Any]],
+        last_seq: int
+    ) -> Optional[SessionTranscript]:
+        """Write a session's transcript from scratch.
+
+        ``sessions.message_seq`` is re-read under the session row lock.
+        Sending and deleting messages both bump it, so if it moved since the
+        rows were read they may include a deleted message or miss a new one,
+        and nothing is written.
+
+        Args:
+            session_id: Session ID
+            rows: Message dicts in seq order
+            last_seq: ``sessions.message_seq`` the rows were read at
+
+        Returns:
+            Transcript, or None if the session changed since ``last_seq``
+        """
+        current_seq = self.db.scalar(
+            select(SessionModel.message_seq).where(SessionModel.id == session_id).with_for_update()
+        )
+        if current_seq != last_seq:
+            return None
+
+        transcript = self.db.get(SessionTranscript, session_id) or SessionTranscript(session_id=session_id)
+        transcript.data = encode_chunk(rows)
+        transcript.message_count = len(rows)
+        transcript.last_seq = last_seq
+        transcript.chunks = 1
+        self.db.add(transcript)
+        self.db.flush()
+        return transcript
+
+    def get_for_update(self, session_id: UUID) -> Optional[SessionTranscript]:
+        """Get and lock a session's transcript.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Transcript or None
+        """
+        return self.db.scalars(
+            select(SessionTranscript)
+            .where(SessionTranscript.session_id == session_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        ).first()
+
+    def append(self, transcript: SessionTranscript, rows: List[Dict[str, Any]], first_seq: int) -> bool:
+        """Append newly sent messages to a locked transcript.
+
+        The transcript is only extended if it ends right before
+        ``first_seq``; otherwise it is deleted and rebuilt on the next read.
+        After TRANSCRIPT_MAX_CHUNKS appends the blob is recompressed as a
+        single gzip member.
+
+        Args:
+            transcript: Transcript from ``get_for_update``
+            rows: Message dicts with consecutive seq numbers
+            first_seq: seq of the first row
+
+        Returns:
+            True if the transcript was extended, False if it was dropped
+        """
+        if transcript.last_seq != first_seq - 1:
+            self.db.delete(transcript)
+            self.db.flush()
+            return False
+
+        if transcript.chunks >= settings.TRANSCRIPT_MAX_CHUNKS:
+            transcript.data = encode_chunk(decode_rows(transcript.data) + rows)
+            transcript.chunks = 1
+        else:
+            transcript.data = transcript.data + encode_chunk(rows)
+            transcript.chunks += 1
+        transcript.message_count += len(rows)
+        transcript.last_seq = first_seq + len(rows) - 1
+        self.db.flush()
+        return True
+
+    def invalidate(self, session_id: UUID) -> None:
+        """Drop a session's transcript so it is rebuilt on the next read.
+
+        Args:
+            session_id: Session ID
+        """
+        self.db.execute(
+            delete(SessionTranscript).where(SessionTranscript.session_id == session_id),
+            execution_options={"synchronize_session": False},
+        )
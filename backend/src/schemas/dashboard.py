@@ -0,0 +1,51 @@
+"""Pydantic schemas for the dashboard endpoint."""
+
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+
+class ProjectTotals(BaseModel):
+    """Project counts."""
+
+    total: int
+    by_status: Dict[str, int]
+
+
+class SessionTotals(BaseModel):
+    """Session counts."""
+
+    total: int
+    active: int
+    archived: int
+    by_status: Dict[str, int]
+
+
+class MessageTotals(BaseModel):
+    """Message counts, including messages in cold storage."""
+
+    total: int
+
+
+class RecentSession(BaseModel):
+    """Recently updated session with a preview of its last message."""
+
+    id: UUID
+    name: Optional[str]
+    status: str
+    mode: str
+    project_id: Optional[UUID]
+    updated_at: datetime
+    last_message_role: Optional[str] = None
+    last_message_preview: Optional[str] = None
+    last_message_at: Optional[datetime] = None
+
+
+class DashboardResponse(BaseModel):
+    """Per-user aggregates for the dashboard."""
+
+    projects: ProjectTotals
+    sessions: SessionTotals
+    messages: MessageTotals
+    recent_sessions: List[RecentSession]
@@ -0,0 +1,61 @@
+"""Pydantic schemas for bulk history import."""
+
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Any, Dict, Optional, List
+
+
+class ImportProject(BaseModel):
+    """Project record in an import file."""
+
+    id: str
+    name: str = Field(..., min_length=1, max_length=255)
+    description: Optional[str] = None
+    status: str = Field("PLANNING", pattern="^(PLANNING|DESIGN|DEVELOPMENT|TESTING|COMPLETE)$")
+    technology_stack: List[str] = Field(default_factory=list)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class ImportSession(BaseModel):
+    """Session record in an import file."""
+
+    id: str
+    project_id: Optional[str] = None
+    name: Optional[str] = Field(None, max_length=255)
+    status: str = Field("ACTIVE", pattern="^(ACTIVE|ARCHIVED)$")
+    mode: str = Field("chat", pattern="^(chat|question|teaching|review)$")
+    role: Optional[str] = Field(None, max_length=100)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class ImportMessage(BaseModel):
+    """Message record in an import file."""
+
+    session_id: str
+    # System prompts are derived from the session, not stored as messages
+    role: str = Field(..., pattern="^(user|assistant)$")
+    content: str = Field(..., min_length=1, max_length=10000)
+    message_type: str = Field("text", pattern="^(text|code|question)$")
+    meta: Optional[Dict[str, Any]] = None
+    created_at: Optional[datetime] = None
+
+
+class ImportLineError(BaseModel):
+    """A rejected import line."""
+
+    line: int
+    error: str
+
+
+class ImportReport(BaseModel):
+    """Result of a bulk import."""
+
+    projects: int
+    sessions: int
+    messages: int
+    skipped: int
+    errors: List[ImportLineError]
+    elapsed_seconds: float
+    rows_per_second: float
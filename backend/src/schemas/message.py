@@ -3,6 +3,7 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional, List
+from uuid import UUID
 
 
 class MessageCreate(BaseModel):
@@ -15,9 +16,10 @@ class MessageCreate(BaseModel):
 class MessageResponse(BaseModel):
     """Message response."""
 
-    id: str
-    session_id: str
-    user_id: str
+    id: UUID
+    session_id: UUID
+    user_id: UUID
+    seq: Optional[int] = None
     role: str
     content: str
     message_type: str
@@ -41,3 +43,19 @@ class SendMessageResponse(BaseModel):
 
     user_message: MessageResponse
     assistant_response: MessageResponse
+
+
+class MessageTranscriptResponse(BaseModel):
+    """A session's whole message history."""
+
+    messages: List[MessageResponse]
+    total: int
+    last_seq: int
+
+
+class MessageSyncResponse(BaseModel):
+    """Messages added after a client's last seen sequence number."""
+
+    messages: List[MessageResponse]
+    last_seq: int
+    has_more: bool
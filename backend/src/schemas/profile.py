@@ -3,12 +3,13 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional
+from uuid import UUID
 
 
 class ProfileResponse(BaseModel):
     """User profile response."""
 
-    id: str
+    id: UUID
     username: str
     email: str
     first_name: Optional[str]
@@ -42,8 +43,8 @@ class ChangePasswordRequest(BaseModel):
 class PreferenceResponse(BaseModel):
     """User preferences response."""
 
-    id: str
-    user_id: str
+    id: UUID
+    user_id: UUID
     theme: str
     llm_model: str
     llm_temperature: float
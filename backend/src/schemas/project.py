@@ -3,6 +3,7 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional, List
+from uuid import UUID
 
 
 class ProjectCreate(BaseModel):
@@ -25,12 +26,12 @@ class ProjectUpdate(BaseModel):
 class ProjectResponse(BaseModel):
     """Project response."""
 
-    id: str
+    id: UUID
     name: str
     description: Optional[str]
     status: str
     technology_stack: List[str]
-    owner_id: str
+    owner_id: UUID
     created_at: datetime
     updated_at: datetime
 
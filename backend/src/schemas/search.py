@@ -0,0 +1,28 @@
+"""Pydantic schemas for search endpoints."""
+
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional, List
+from uuid import UUID
+
+
+class SearchResult(BaseModel):
+    """Single message search hit."""
+
+    message_id: UUID
+    session_id: UUID
+    project_id: Optional[UUID] = None
+    seq: Optional[int] = None
+    role: str
+    created_at: datetime
+    rank: float
+    snippet: str
+
+
+class SearchResponse(BaseModel):
+    """Ranked, paginated search results."""
+
+    results: List[SearchResult]
+    total: int
+    page: int
+    limit: int
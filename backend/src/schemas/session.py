@@ -32,13 +32,13 @@ class SessionToggleMode(BaseModel):
 class SessionResponse(BaseModel):
     """Session response."""
 
-    id: str
+    id: UUID
     name: Optional[str]
     status: str
     mode: str
     role: Optional[str]
-    project_id: Optional[str]
-    owner_id: str
+    project_id: Optional[UUID]
+    owner_id: UUID
     created_at: datetime
     updated_at: datetime
     message_count: int = 0
@@ -47,10 +47,18 @@ class SessionResponse(BaseModel):
         from_attributes = True
 
 
+class SessionListItem(SessionResponse):
+    """Session in a list, with its last message if requested."""
+
+    last_message_role: Optional[str] = None
+    last_message_preview: Optional[str] = None
+    last_message_at: Optional[datetime] = None
+
+
 class SessionListResponse(BaseModel):
     """List of sessions response."""
 
-    sessions: List[SessionResponse]
+    sessions: List[SessionListItem]
     total: int
     page: int
     limit: int
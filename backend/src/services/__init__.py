@@ -8,6 +8,12 @@ from backend.src.services.message_service import MessageService
 from backend.src.services.preference_service import PreferenceService
 from backend.src.services.document_service import DocumentService
 from backend.src.services.audit_log_service import AuditLogService
+from backend.src.services.search_service import SearchService
+from backend.src.services.export_service import ExportService
+from backend.src.services.import_service import ImportService
+from backend.src.services.purge_service import PurgeService
+from backend.src.services.archive_service import ArchiveService
+from backend.src.services.dashboard_service import DashboardService
 
 __all__ = [
     "BaseService",
@@ -18,4 +24,10 @@ __all__ = [
     "PreferenceService",
     "DocumentService",
     "AuditLogService",
+    "SearchService",
+    "ExportService",
+    "ImportService",
+    "PurgeService",
+    "ArchiveService",
+    "DashboardService",
 ]
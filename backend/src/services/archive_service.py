@@ -0,0 +1,208 @@
+"""Archive service for moving archived sessions' messages to cold storage."""
+
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import delete, exists, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from backend.src.config import settings
+from backend.src.models import Message, MessageArchive, Session as SessionModel
+from backend.src.models.message_search import index_written_messages
+from backend.src.repositories.message_archive_repository import (
+    ARCHIVED_COLUMNS,
+    MessageArchiveRepository,
+)
+from backend.src.services.base_service import BaseService
+from backend.src.utils.segments import SegmentStore
+
+
+class ArchiveService(BaseService):
+    """Service for the hot/cold message tiers.
+
+    Sessions that have been ``ARCHIVED`` for ARCHIVE_MIN_AGE_DAYS have their
+    messages written as one compressed record to an append-only segment
+    file and deleted from the ``messages`` table, shrinking the table and
+    its indexes. ``MessageRepository`` rehydrates them on read. Sending a
+    message to an archived session, or un-archiving it, restores the
+    messages to the table first and makes the session ``ACTIVE`` again.
+
+    Archived messages are not full-text searchable. Records of restored or
+    deleted sessions stay in their segment until ``compact`` copies the
+    segment's remaining records forward and removes the file.
+    """
+
+    def __init__(self, db: Session, store: SegmentStore = None):
+        """Initialize archive service.
+
+        Args:
+            db: SQLAlchemy session
+            store: Segment store (defaults to ARCHIVE_DIR)
+        """
+        super().__init__(db)
+        self.archive_repo = MessageArchiveRepository(db, store)
+
+    def archive_session(self, session_id: UUID) -> int:
+        """Move a session's messages to the archive.
+
+        The session row is locked first, so a concurrent ``send_message``
+        (which updates ``sessions.message_seq``) waits for the move.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Number of messages archived (0 if not ``ARCHIVED``, already
+            archived or empty)
+        """
+        status = self.db.scalar(
+            select(SessionModel.status).where(SessionModel.id == session_id).with_for_update()
+        )
+        if status != "ARCHIVED" or self.archive_repo.get(session_id) is not None:
+            self.rollback()
+            return 0
+
+        messages = [
+            dict(row)
+            for row in self.db.execute(
+                select(*Message.__table__.columns)
+                .where(Message.session_id == session_id)
+                .order_by(Message.seq)
+            ).mappings()
+        ]
+        if not messages:
+            self.rollback()
+            return 0
+
+        self.archive_repo.write(session_id, messages)
+        self.db.execute(
+            delete(Message).where(Message.session_id == session_id),
+            execution_options={"synchronize_session": False},
+        )
+        self.commit()
+
+        self.logger.info(f"Session archived to cold storage: {session_id} ({len(messages)} messages)")
+        return len(messages)
+
+    def restore_session(self, session_id: UUID) -> int:
+        """Move a session's archived messages back to the messages table.
+
+        IDs, sequence numbers and timestamps are kept, and the session
+        becomes ``ACTIVE``.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Number of messages restored (0 if the session is not archived)
+        """
+        self.db.execute(
+            update(SessionModel).where(SessionModel.id == session_id).values(status="ACTIVE")
+        )
+        messages = self.archive_repo.load(session_id)
+        if messages is None:
+            self.commit()
+            return 0
+
+        if messages:
+            rows = [{key: message[key] for key in ARCHIVED_COLUMNS} for message in messages]
+            self.db.execute(insert(Message), rows)
+            index_written_messages(self.db.connection(), rows)
+        self.db.execute(delete(MessageArchive).where(MessageArchive.session_id == session_id))
+        self.commit()
+
+        self.logger.info(f"Session restored from cold storage: {session_id} ({len(messages)} messages)")
+        return len(messages)
+
+    def archive_pending(self, min_age_days: Optional[int] = None, limit: Optional[int] = None) -> int:
+        """Archive every eligible session.
+
+        A session is eligible once it has been ``ARCHIVED`` for
+        ``min_age_days`` (by ``archived_at``, or ``updated_at`` if the status
+        was set directly) and is not archived yet. Sessions are committed one
+        at a time; a failure is logged and left for the next run.
+
+        Args:
+            min_age_days: Days a session must stay archived (defaults to ARCHIVE_MIN_AGE_DAYS)
+            limit: Maximum sessions to archive
+
+        Returns:
+            Number of sessions archived
+        """
+        if min_age_days is None:
+            min_age_days = settings.ARCHIVE_MIN_AGE_DAYS
+        cutoff = datetime.utcnow() - timedelta(days=min_age_days)
+
+        statement = (
+            select(SessionModel.id)
+            .where(
+                SessionModel.status == "ARCHIVED",
+                SessionModel.deleted_at.is_(None),
+                func.coalesce(SessionModel.archived_at, SessionModel.updated_at) <= cutoff,
+                ~exists().where(MessageArchive.session_id == SessionModel.id),
+            )
+            .order_by(SessionModel.archived_at)
+            .limit(limit)
+        )
+
+        archived = 0
+        for session_id in self.db.scalars(statement).all():
+            try:
+                if self.archive_session(session_id):
+                    archived += 1
+            except Exception as e:
+                self.rollback()
+                self.logger.error(f"Archiving session {session_id} failed: {e}")
+        return archived
+
+    def compact(
+        self,
+        max_dead_ratio: Optional[float] = None,
+        min_age_seconds: Optional[int] = None
+    ) -> int:
+        """Reclaim segment space held by restored and deleted sessions.
+
+        A segment whose share of unreferenced bytes exceeds
+        ``max_dead_ratio`` has its remaining records copied to the newest
+        segment, and is then removed. With the default of 0 any segment
+        holding a deleted session's messages is rewritten, so purged content
+        does not linger on disk. Segments modified within
+        ``min_age_seconds`` are skipped: their records may belong to
+        transactions that have not committed yet.
+
+        Args:
+            max_dead_ratio: Dead share tolerated (defaults to ARCHIVE_COMPACT_MAX_DEAD_RATIO)
+            min_age_seconds: Quiet period (defaults to ARCHIVE_COMPACT_MIN_AGE_SECONDS)
+
+        Returns:
+            Number of segments removed
+        """
+        if max_dead_ratio is None:
+            max_dead_ratio = settings.ARCHIVE_COMPACT_MAX_DEAD_RATIO
+        if min_age_seconds is None:
+            min_age_seconds = settings.ARCHIVE_COMPACT_MIN_AGE_SECONDS
+
+        store = self.archive_repo.store
+        live = self.archive_repo.live_bytes()
+        cutoff = time.time() - min_age_seconds
+        removed = 0
+        for segment in store.segments():
+            path = store.path(segment)
+            size = os.path.getsize(path)
+            if os.path.getmtime(path) > cutoff or size - live.get(segment, 0) <= size * max_dead_ratio:
+                continue
+            if segment == store.segments()[-1]:
+                store.seal()  # Live records must not be copied into this segment
+            try:
+                moved = self.archive_repo.relocate(segment)
+                self.commit()
+            except Exception as e:
+                self.rollback()
+                self.logger.error(f"Compacting archive segment {segment} failed: {e}")
+                continue
+            store.remove(segment)
+            removed += 1
+            self.logger.info(f"Archive segment {segment} compacted ({moved} records kept)")
+        return removed
@@ -1,21 +1,39 @@
 """Audit log service for change tracking."""
 
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
 
 from backend.src.models import AuditLog
 from backend.src.repositories import AuditLogRepository
 from backend.src.services.base_service import BaseService
+from backend.src.services.audit_writer import AuditLogWriter, audit_writer, build_audit_event
 
 
 class AuditLogService(BaseService):
-    """Service for audit trail."""
+    """Service for audit trail.
 
-    def __init__(self, db: Session):
-        """Initialize audit log service."""
+    Log calls hand events to an ``AuditLogWriter``, which writes them in
+    bulk outside the caller's transaction (or immediately in synchronous
+    mode).
+    """
+
+    def __init__(self, db: Session, writer: AuditLogWriter = None):
+        """Initialize audit log service.
+
+        Args:
+            db: SQLAlchemy session
+            writer: Audit writer (defaults to the application writer)
+        """
         super().__init__(db)
         self.repo = AuditLogRepository(db)
+        self.writer = writer or audit_writer
+
+    def _record(self, **fields: Any) -> AuditLog:
+        """Enqueue an audit event and return it as an unsaved AuditLog."""
+        event = build_audit_event(**fields)
+        self.writer.enqueue(event, db=self.db)
+        return AuditLog(**event)
 
     def log_create(
         self,
@@ -33,9 +51,9 @@ class AuditLogService(BaseService):
             new_value: New entity data
 
         Returns:
-            Created AuditLog
+            Queued AuditLog (not attached to the session)
         """
-        log = AuditLog(
+        log = self._record(
             user_id=user_id,
             entity_type=entity_type,
             entity_id=entity_id,
@@ -43,9 +61,6 @@ class AuditLogService(BaseService):
             new_value=new_value or {}
         )
 
-        self.db.add(log)
-        self.flush()
-
         self.logger.info(f"Audit log created: {entity_type} {entity_id}")
         return log
 
@@ -67,9 +82,9 @@ class AuditLogService(BaseService):
             new_value: New entity data
 
         Returns:
-            Created AuditLog
+            Queued AuditLog (not attached to the session)
         """
-        log = AuditLog(
+        log = self._record(
             user_id=user_id,
             entity_type=entity_type,
             entity_id=entity_id,
@@ -78,9 +93,6 @@ class AuditLogService(BaseService):
             new_value=new_value or {}
         )
 
-        self.db.add(log)
-        self.flush()
-
         self.logger.info(f"Audit log updated: {entity_type} {entity_id}")
         return log
 
@@ -100,9 +112,9 @@ class AuditLogService(BaseService):
             old_value: Deleted entity data
 
         Returns:
-            Created AuditLog
+            Queued AuditLog (not attached to the session)
         """
-        log = AuditLog(
+        log = self._record(
             user_id=user_id,
             entity_type=entity_type,
             entity_id=entity_id,
@@ -110,42 +122,100 @@ class AuditLogService(BaseService):
             old_value=old_value or {}
         )
 
-        self.db.add(log)
-        self.flush()
-
         self.logger.info(f"Audit log deleted: {entity_type} {entity_id}")
         return log
 
-    def get_user_audit_logs(self, user_id: UUID) -> List[AuditLog]:
-        """Get audit logs for user.
+    def get_user_audit_logs(
+        self,
+        user_id: UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[AuditLog], Optional[str]]:
+        """Get a page of audit logs for user.
 
         Args:
             user_id: User ID
+            limit: Page size
+            cursor: Cursor from the previous page
 
         Returns:
-            List of audit logs
+            Tuple of (audit logs, next cursor or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        return self.repo.get_by_user(user_id)
+        return self.repo.get_by_user(user_id, limit=limit, cursor=cursor)
 
-    def get_entity_audit_logs(self, entity_type: str, entity_id: UUID) -> List[AuditLog]:
-        """Get audit logs for entity.
+    def get_entity_audit_logs(
+        self,
+        entity_type: str,
+        entity_id: UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[AuditLog], Optional[str]]:
+        """Get a page of audit logs for entity.
 
         Args:
             entity_type: Type of entity
             entity_id: Entity ID
+            limit: Page size
+            cursor: Cursor from the previous page
 
         Returns:
-            List of audit logs
+            Tuple of (audit logs, next cursor or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        return self.repo.get_by_entity(entity_type, entity_id)
+        return self.repo.get_by_entity(entity_type, entity_id, limit=limit, cursor=cursor)
 
-    def get_action_logs(self, action: str) -> List[AuditLog]:
-        """Get logs by action.
+    def get_action_logs(
+        self,
+        action: str,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[AuditLog], Optional[str]]:
+        """Get a page of logs by action.
 
         Args:
             action: Action type (CREATE, UPDATE, DELETE)
+            limit: Page size
+            cursor: Cursor from the previous page
 
         Returns:
-            List of audit logs
+            Tuple of (audit logs, next cursor or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return self.repo.get_by_action(action, limit=limit, cursor=cursor)
+
+    def get_recent_logs(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[AuditLog], Optional[str]]:
+        """Get a page of all logs, newest first.
+
+        Args:
+            limit: Page size
+            cursor: Cursor from the previous page
+
+        Returns:
+            Tuple of (audit logs, next cursor or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return self.repo.get_recent(limit=limit, cursor=cursor)
+
+    def iter_action_logs(self, action: str) -> Iterator[AuditLog]:
+        """Stream every log for an action without loading them all.
+
+        Args:
+            action: Action type (CREATE, UPDATE, DELETE)
+
+        Yields:
+            Audit logs, newest first
         """
-        return self.repo.get_by_action(action)
+        return self.repo.iter_by_action(action)
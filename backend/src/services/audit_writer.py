@@ -0,0 +1,385 @@
+"""Batched, asynchronous audit log writer."""
+
+import json
+import logging
+import os
+import queue
+import re
+import socket
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.exc import DataError, DBAPIError, IntegrityError, StatementError
+from sqlalchemy.orm import Session
+
+from backend.src.config import settings
+from backend.src.database import SessionLocal
+from backend.src.models.guid import GUID
+from backend.src.repositories import AuditLogRepository
+from backend.src.utils.ids import uuid7
+
+logger = logging.getLogger(__name__)
+
+# spill-<host>-<pid>.jsonl / replay-<host>-<pid>-<token>.jsonl
+_SPILL_FILE = re.compile(r"^(spill|replay)-(?P<host>.+)-(?P<pid>\d+)(-[0-9a-f]+)?\.jsonl$")
+
+
+def _is_row_error(error: Exception) -> bool:
+    """Whether an insert failed because of the rows rather than the database.
+
+    Constraint violations, invalid values and parameters that cannot be
+    bound fail again on every retry; connection and server errors may not.
+    """
+    if isinstance(error, (IntegrityError, DataError)):
+        return True
+    return isinstance(error, StatementError) and not isinstance(error, DBAPIError)
+
+
+def _process_alive(pid: int) -> bool:
+    """Whether a process with this ID is running on this host."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _normalize_id(value: Any) -> Optional[uuid.UUID]:
+    """Convert string IDs to the UUIDs stored in audit_log."""
+    return GUID.coerce(value)
+
+
+def build_audit_event(
+    user_id: Any,
+    entity_type: str,
+    entity_id: Any,
+    action: str,
+    old_value: Dict[str, Any] = None,
+    new_value: Dict[str, Any] = None
+) -> Dict[str, Any]:
+    """Build an audit_log row.
+
+    The ID and timestamp are assigned at enqueue time so rows keep the order
+    and time of the audited change rather than the time they were flushed.
+
+    Args:
+        user_id: User performing action
+        entity_type: Type of entity
+        entity_id: Entity ID
+        action: Action type (CREATE, UPDATE, DELETE)
+        old_value: Previous entity data
+        new_value: New entity data
+
+    Returns:
+        Column values for an AuditLog row
+    """
+    return {
+        "id": uuid7(),
+        "user_id": _normalize_id(user_id),
+        "entity_type": entity_type,
+        "entity_id": _normalize_id(entity_id),
+        "action": action,
+        "old_value": old_value,
+        "new_value": new_value,
+        "created_at": datetime.utcnow(),
+    }
+
+
+class AuditLogWriter:
+    """Queue audit events in memory and write them in bulk.
+
+    A background thread drains the queue every ``flush_interval`` seconds,
+    or as soon as ``batch_size`` events are waiting, and writes each batch
+    with a single multi-row INSERT. Batches that cannot be written while the
+    database is unavailable are appended to a JSON-lines spill file and
+    replayed before the next batch. A batch rejected because of its rows is
+    retried row by row; rows that still fail go to a dead-letter file
+    instead of blocking the rest.
+
+    Each process spills to its own files in ``spill_dir``
+    (``spill-<host>-<pid>.jsonl``, ``dead-<host>-<pid>.jsonl``). A process
+    also replays files left by exited processes of the same host. Replays
+    skip rows already stored, so replaying a file twice is harmless.
+
+    In synchronous mode events are written immediately, in the caller's
+    session when one is given, so tests see rows without waiting.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = None,
+        flush_interval: float = 1.0,
+        batch_size: int = 500,
+        max_queue_size: int = 10000,
+        spill_dir: str = None,
+        synchronous: bool = False
+    ):
+        """Initialize writer.
+
+        Args:
+            session_factory: Callable returning a new database session
+            flush_interval: Seconds between background flushes
+            batch_size: Maximum events per INSERT
+            max_queue_size: Events held in memory before spilling to disk
+            spill_dir: Directory for spill and dead-letter files
+            synchronous: Write events immediately instead of queueing
+        """
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.spill_dir = os.path.abspath(spill_dir) if spill_dir else None
+        self.host = socket.gethostname()
+        self.synchronous = synchronous
+
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue_size)
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._write_lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def enqueue(self, event: Dict[str, Any], db: Session = None) -> None:
+        """Submit an audit event.
+
+        Args:
+            event: Row built by ``build_audit_event``
+            db: Caller's session, used only in synchronous mode
+        """
+        if self.synchronous:
+            if db is not None:
+                AuditLogRepository(db).insert_many([event])
+            else:
+                self._write_batch([event])
+            return
+
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            # Never block the request path; keep the event on disk instead
+            logger.warning("Audit queue full; spilling event to disk")
+            self._spill([event])
+            return
+
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+
+    def start(self) -> None:
+        """Start the background flush thread."""
+        if self.synchronous or self.running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="audit-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the background thread and flush remaining events.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def flush(self) -> int:
+        """Write all queued and spilled events now.
+
+        Returns:
+            Number of queued events drained
+        """
+        drained = 0
+        self._replay_spill()
+        while True:
+            batch = self._drain()
+            if not batch:
+                return drained
+            drained += len(batch)
+            self._write_batch(batch)
+
+    def _run(self) -> None:
+        """Background loop."""
+        while not self._stopping.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Audit flush failed: {e}")
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        """Take up to ``batch_size`` events off the queue."""
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch: List[Dict[str, Any]], skip_existing: bool = False) -> bool:
+        """Insert a batch in its own transaction.
+
+        If the rows are at fault, they are retried one by one and the ones
+        that still fail are dead-lettered. If the database is at fault,
+        whatever was not written is spilled for replay.
+
+        Args:
+            batch: Rows to insert
+            skip_existing: Ignore rows already stored (replays)
+
+        Returns:
+            True unless rows were spilled for a later retry
+        """
+        with self._write_lock:
+            db = self.session_factory()
+            try:
+                repo = AuditLogRepository(db)
+                try:
+                    repo.insert_many(batch, skip_existing=skip_existing)
+                    db.commit()
+                    return True
+                except Exception as e:
+                    db.rollback()
+                    if not _is_row_error(e):
+                        raise
+                    logger.warning(f"Audit batch of {len(batch)} rejected, retrying row by row: {e}")
+
+                for index, event in enumerate(batch):
+                    try:
+                        repo.insert_many([event], skip_existing=skip_existing)
+                        db.commit()
+                    except Exception as e:
+                        db.rollback()
+                        if not _is_row_error(e):
+                            batch = batch[index:]
+                            raise
+                        self._dead_letter(event, e)
+                return True
+            except Exception as e:
+                logger.error(f"Audit batch of {len(batch)} failed, spilling to disk: {e}")
+                self._spill(batch)
+                return False
+            finally:
+                db.close()
+
+    def _file(self, kind: str, pid: int = None, token: str = "") -> str:
+        """Path of one of this host's spill, replay or dead-letter files."""
+        suffix = f"-{token}" if token else ""
+        return os.path.join(self.spill_dir, f"{kind}-{self.host}-{pid or os.getpid()}{suffix}.jsonl")
+
+    def _append(self, path: str, lines: List[str]) -> None:
+        """Append lines to a file and fsync it."""
+        with self._spill_lock:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                for line in lines:
+                    f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _spill(self, batch: List[Dict[str, Any]]) -> None:
+        """Append events to this process's spill file."""
+        if not self.spill_dir:
+            logger.error(f"No audit spill directory configured; dropped {len(batch)} events")
+            return
+        self._append(self._file("spill"), [json.dumps(event, default=str) for event in batch])
+
+    def _dead_letter(self, event: Dict[str, Any], error: Exception) -> None:
+        """Set aside an event the database rejects, with the reason."""
+        logger.error(f"Audit event {event.get('id')} rejected, dead-lettered: {error}")
+        if not self.spill_dir:
+            return
+        record = {"error": str(error).splitlines()[0], "event": event}
+        self._append(self._file("dead"), [json.dumps(record, default=str)])
+
+    def _claim_spills(self) -> List[str]:
+        """Move spill files this process should replay aside.
+
+        Claims this process's spill file, and spill or replay files of
+        exited processes on this host, by renaming them to fresh replay
+        files. Renames are atomic, so each file is claimed by one process.
+        New spills during the replay go to a new spill file.
+
+        Returns:
+            Paths of claimed replay files
+        """
+        if not self.spill_dir or not os.path.isdir(self.spill_dir):
+            return []
+
+        pid = os.getpid()
+        claimed = []
+        for name in sorted(os.listdir(self.spill_dir)):
+            match = _SPILL_FILE.match(name)
+            if not match or match.group("host") != self.host:
+                continue
+            owner = int(match.group("pid"))
+            if owner != pid and _process_alive(owner):
+                continue
+            if owner == pid and match.group(1) == "replay":
+                claimed.append(os.path.join(self.spill_dir, name))
+                continue
+            target = self._file("replay", token=uuid.uuid4().hex[:12])
+            with self._spill_lock:
+                try:
+                    os.replace(os.path.join(self.spill_dir, name), target)
+                except FileNotFoundError:
+                    continue  # Claimed by another process
+            claimed.append(target)
+        return claimed
+
+    def _read_spill(self, path: str) -> List[Dict[str, Any]]:
+        """Read spilled events, skipping lines that cannot be parsed.
+
+        A crash while spilling can leave a truncated last line.
+        """
+        events = []
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    event = json.loads(line)
+                    event["created_at"] = datetime.fromisoformat(event["created_at"])
+                except (ValueError, TypeError, KeyError) as e:
+                    logger.error(f"Skipping unreadable audit spill line {path}:{number}: {e}")
+                    continue
+                events.append(event)
+        return events
+
+    def _replay_spill(self) -> None:
+        """Re-insert spilled events once the database is reachable again."""
+        for path in self._claim_spills():
+            events = self._read_spill(path)
+            written = True
+            for start in range(0, len(events), self.batch_size):
+                # Failed rows are spilled again, to this process's spill file
+                batch = events[start:start + self.batch_size]
+                written = self._write_batch(batch, skip_existing=True) and written
+
+            os.remove(path)
+            if written:
+                logger.info(f"Replayed {len(events)} spilled audit events from {path}")
+
+
+audit_writer = AuditLogWriter(
+    session_factory=SessionLocal,
+    flush_interval=settings.AUDIT_LOG_FLUSH_INTERVAL,
+    batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+    max_queue_size=settings.AUDIT_LOG_MAX_QUEUE,
+    spill_dir=settings.AUDIT_LOG_SPILL_DIR,
+    synchronous=not settings.AUDIT_LOG_ASYNC,
+)
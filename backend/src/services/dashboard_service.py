@@ -0,0 +1,114 @@
+"""Dashboard service for per-user aggregates."""
+
+from typing import Any, Dict
+from uuid import UUID
+from sqlalchemy import String, cast, func, literal, null, select, union_all
+from sqlalchemy.orm import Session
+
+from backend.src.cache import get_cache
+from backend.src.config import settings
+from backend.src.models import Project, Session as SessionModel
+from backend.src.repositories import SessionRepository
+from backend.src.services.base_service import BaseService
+from backend.src.utils.text import message_preview
+
+
+class DashboardService(BaseService):
+    """Service for the dashboard summary.
+
+    All counts come from one ``UNION ALL`` of grouped queries and the
+    recent sessions from a second query. The summary is cached under the
+    owner's ``projects`` and ``sessions`` scope tokens, so every write that
+    already invalidates those lists (including sending a message) refreshes
+    it.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize dashboard service."""
+        super().__init__(db)
+        self.session_repo = SessionRepository(db)
+
+    def get_dashboard(self, owner_id: UUID) -> Dict[str, Any]:
+        """Get a user's dashboard summary.
+
+        Args:
+            owner_id: Owner user ID
+
+        Returns:
+            Dict with project, session and message totals and the
+            most recently updated sessions
+        """
+        cache = get_cache()
+        if cache is None:
+            return self._build(owner_id)
+
+        namespace = ":".join((
+            "dashboard",
+            str(owner_id),
+            cache.scope_token("projects", owner_id),
+            cache.scope_token("sessions", owner_id),
+        ))
+        return cache.get_or_set(namespace, "summary", lambda: self._build(owner_id))
+
+    def _build(self, owner_id: UUID) -> Dict[str, Any]:
+        """Compute the dashboard summary."""
+        projects: Dict[str, int] = {}
+        sessions: Dict[str, int] = {}
+        messages = 0
+        for kind, status, total in self.db.execute(self._totals_statement(owner_id)):
+            if kind == "project":
+                projects[status] = total
+            elif kind == "session":
+                sessions[status] = total
+            else:
+                messages += total or 0
+
+        recent = []
+        for row in self.session_repo.get_recent_with_last_message(
+            owner_id, limit=settings.DASHBOARD_RECENT_SESSIONS
+        ):
+            data = dict(row._mapping)
+            data["last_message_preview"] = message_preview(data.pop("last_message_content"))
+            recent.append(data)
+
+        return {
+            "projects": {"total": sum(projects.values()), "by_status": projects},
+            "sessions": {
+                "total": sum(sessions.values()),
+                "active": sessions.get("ACTIVE", 0),
+                "archived": sessions.get("ARCHIVED", 0),
+                "by_status": sessions,
+            },
+            "messages": {"total": messages},
+            "recent_sessions": recent,
+        }
+
+    @staticmethod
+    def _totals_statement(owner_id: UUID):
+        """Build the grouped counts as rows of (kind, status, total).
+
+        Soft-deleted projects and sessions awaiting purge are left out, as
+        are their messages. Messages are totalled from
+        ``sessions.message_count`` rather than counted.
+        """
+        live_session = (SessionModel.owner_id == owner_id, SessionModel.deleted_at.is_(None))
+        no_status = cast(null(), String)
+
+        project_counts = (
+            select(literal("project").label("kind"), Project.status.label("status"),
+                   func.count().label("total"))
+            .where(Project.owner_id == owner_id, Project.deleted_at.is_(None))
+            .group_by(Project.status)
+        )
+        session_counts = (
+            select(literal("session"), SessionModel.status, func.count())
+            .where(*live_session)
+            .group_by(SessionModel.status)
+        )
+        # Maintained per-session counters, including messages in cold storage
+        message_counts = (
+            select(literal("message"), no_status, func.sum(SessionModel.message_count))
+            .where(*live_session)
+        )
+        return union_all(project_counts, session_counts, message_counts)
+
@@ -0,0 +1,180 @@
+"""Export service for streaming a user's history as NDJSON."""
+
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.src.middleware.compression import available_encodings, create_encoder
+from backend.src.models import Message, MessageArchive, Project, Session as SessionModel
+from backend.src.repositories.message_archive_repository import MessageArchiveRepository
+from backend.src.services.base_service import BaseService
+from backend.src.services.project_service import PROJECT_RESPONSE_COLUMNS
+from backend.src.services.session_service import SESSION_RESPONSE_COLUMNS
+from backend.src.utils.serialization import dumps
+
+EXPORT_FORMAT_VERSION = 1
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 1000
+
+# Bytes buffered before a chunk is handed to the response
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+EXPORT_MESSAGE_COLUMNS = (
+    Message.id,
+    Message.session_id,
+    Message.user_id,
+    Message.seq,
+    Message.role,
+    Message.content,
+    Message.message_type,
+    Message.meta,
+    Message.created_at,
+)
+
+# Compression option -> (encoding, level, file suffix, media type)
+EXPORT_COMPRESSION = {
+    "gzip": ("gzip", 6, ".gz", "application/gzip"),
+    "zstd": ("zstd", 3, ".zst", "application/zstd"),
+}
+
+
+def export_file_format(compression: Optional[str] = None) -> Tuple[str, str]:
+    """Get the file extension and media type for an export.
+
+    Args:
+        compression: ``gzip``, ``zstd`` or None
+
+    Returns:
+        Tuple of (file extension, media type)
+
+    Raises:
+        ValueError: If the compression option is unknown or unavailable
+    """
+    if not compression:
+        return ".ndjson", "application/x-ndjson"
+    if compression not in EXPORT_COMPRESSION:
+        raise ValueError(f"Unsupported compression: {compression}")
+    encoding, _, suffix, media_type = EXPORT_COMPRESSION[compression]
+    if encoding not in available_encodings():
+        raise ValueError(f"Compression not available on this server: {compression}")
+    return f".ndjson{suffix}", media_type
+
+
+class ExportService(BaseService):
+    """Service for exporting projects, sessions and messages."""
+
+    def __init__(self, db: Session, batch_size: int = EXPORT_BATCH_SIZE):
+        """Initialize export service.
+
+        Args:
+            db: SQLAlchemy session
+            batch_size: Rows per fetch
+        """
+        super().__init__(db)
+        self.batch_size = batch_size
+
+    def _stream(self, statement, record_type: str) -> Iterator[Dict[str, Any]]:
+        """Yield rows of a column query as tagged records.
+
+        ``yield_per`` uses a server-side cursor on PostgreSQL, and column
+        rows bypass the identity map, so memory does not grow with row count.
+        """
+        result = self.db.execute(statement.execution_options(yield_per=self.batch_size))
+        for row in result.mappings():
+            yield {"type": record_type, **row}
+
+    def iter_records(self, owner_id: UUID) -> Iterator[Dict[str, Any]]:
+        """Yield every export record for a user.
+
+        Records are emitted in dependency order (header, projects, sessions,
+        messages) so they can be imported line by line.
+
+        Args:
+            owner_id: Owner user ID
+
+        Yields:
+            Records tagged with a ``type`` field
+        """
+        yield {
+            "type": "export",
+            "version": EXPORT_FORMAT_VERSION,
+            "user_id": str(owner_id),
+            "exported_at": datetime.utcnow(),
+        }
+
+        yield from self._stream(
+            select(*PROJECT_RESPONSE_COLUMNS)
+            .where(Project.owner_id == owner_id, Project.deleted_at.is_(None))
+            .order_by(Project.created_at, Project.id),
+            "project",
+        )
+        yield from self._stream(
+            select(*SESSION_RESPONSE_COLUMNS)
+            .where(SessionModel.owner_id == owner_id, SessionModel.deleted_at.is_(None))
+            .order_by(SessionModel.created_at, SessionModel.id),
+            "session",
+        )
+        yield from self._stream(
+            select(*EXPORT_MESSAGE_COLUMNS)
+            .join(SessionModel, SessionModel.id == Message.session_id)
+            .where(SessionModel.owner_id == owner_id, SessionModel.deleted_at.is_(None))
+            .order_by(Message.session_id, Message.seq),
+            "message",
+        )
+        yield from self._archived_messages(owner_id)
+
+    def _archived_messages(self, owner_id: UUID) -> Iterator[Dict[str, Any]]:
+        """Yield message records of sessions moved to cold storage, one session at a time."""
+        archive = MessageArchiveRepository(self.db)
+        session_ids = self.db.scalars(
+            select(MessageArchive.session_id)
+            .join(SessionModel, SessionModel.id == MessageArchive.session_id)
+            .where(SessionModel.owner_id == owner_id, SessionModel.deleted_at.is_(None))
+            .order_by(MessageArchive.session_id)
+        ).all()
+        for session_id in session_ids:
+            for message in archive.load(session_id) or []:
+                yield {
+                    "type": "message",
+                    **{column.key: message[column.key] for column in EXPORT_MESSAGE_COLUMNS},
+                }
+
+    def iter_ndjson(self, owner_id: UUID, compression: Optional[str] = None) -> Iterator[bytes]:
+        """Yield the export as NDJSON chunks, optionally compressed.
+
+        Args:
+            owner_id: Owner user ID
+            compression: ``gzip``, ``zstd`` or None
+
+        Yields:
+            Byte chunks of roughly ``EXPORT_CHUNK_SIZE``
+
+        Raises:
+            ValueError: If the compression option is not supported
+        """
+        export_file_format(compression)
+        encoder = None
+        if compression:
+            encoding, level, _, _ = EXPORT_COMPRESSION[compression]
+            encoder = create_encoder(encoding, level)
+
+        buffer = bytearray()
+        for record in self.iter_records(owner_id):
+            buffer += dumps(record)
+            buffer += b"\n"
+            if len(buffer) >= EXPORT_CHUNK_SIZE:
+                chunk = bytes(buffer)
+                buffer.clear()
+                if encoder:
+                    chunk = encoder.compress(chunk)
+                if chunk:
+                    yield chunk
+
+        tail = bytes(buffer)
+        if encoder:
+            tail = encoder.compress(tail) + encoder.finish()
+        if tail:
+            yield tail
@@ -0,0 +1,268 @@
+"""Import service for bulk-loading history from NDJSON."""
+
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+from uuid import UUID
+from pydantic import ValidationError
+from sqlalchemy import bindparam, insert, update
+from sqlalchemy.orm import Session
+
+from backend.src.cache import invalidate
+from backend.src.models import Message, Project, Session as SessionModel
+from backend.src.models.message_search import index_written_messages
+from backend.src.schemas.history_import import ImportMessage, ImportProject, ImportSession
+from backend.src.services.base_service import BaseService
+from backend.src.services.export_service import EXPORT_FORMAT_VERSION
+from backend.src.utils.ids import uuid7
+from backend.src.utils.serialization import loads
+
+# Rejected lines reported back in full; later ones are only counted
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportService(BaseService):
+    """Service for importing projects, sessions and messages.
+
+    Reads the format written by ``ExportService``: one JSON record per line,
+    tagged with ``type`` and ordered projects -> sessions -> messages.
+    Records are validated one line at a time, given new IDs, and written
+    with multi-row INSERTs of ``batch_size`` rows, committing every
+    ``transaction_size`` rows. Message ``seq`` values are re-allocated per
+    session in file order.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        batch_size: int = 1000,
+        transaction_size: int = 10000,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """Initialize import service.
+
+        Args:
+            db: SQLAlchemy session
+            batch_size: Rows per INSERT statement
+            transaction_size: Rows per committed transaction
+            progress: Called with the running report after each commit
+        """
+        super().__init__(db)
+        self.batch_size = batch_size
+        self.transaction_size = transaction_size
+        self.progress = progress
+
+    def import_lines(self, owner_id: UUID, lines: Iterable[Union[bytes, str]]) -> Dict[str, Any]:
+        """Import NDJSON records for a user.
+
+        Invalid lines are skipped and reported; database errors roll back
+        the current transaction chunk and are raised.
+
+        Args:
+            owner_id: User who will own the imported data
+            lines: NDJSON lines
+
+        Returns:
+            Import report with counts, rejected lines and throughput
+        """
+        run = _ImportRun(self, owner_id)
+        for number, line in enumerate(lines, start=1):
+            if line.strip():
+                run.add_line(number, line)
+        run.finish()
+        return run.report()
+
+
+class _ImportRun:
+    """State for one import: ID mappings, pending rows and counters."""
+
+    def __init__(self, service: ImportService, owner_id: UUID):
+        """Start an import run for a user."""
+        self.service = service
+        self.db = service.db
+        self.owner_id = owner_id
+
+        self.project_ids: Dict[str, UUID] = {}
+        self.session_ids: Dict[str, UUID] = {}
+        self.next_seq: Dict[UUID, int] = {}
+
+        self.pending: Dict[type, List[Dict[str, Any]]] = {
+            Project: [], SessionModel: [], Message: []
+        }
+        self.touched_sessions: set = set()
+        self.uncommitted = 0
+
+        self.counts = {"projects": 0, "sessions": 0, "messages": 0}
+        self.skipped = 0
+        self.errors: List[Dict[str, Any]] = []
+        self.started = time.perf_counter()
+
+    def add_line(self, number: int, line: Union[bytes, str]) -> None:
+        """Validate one line and queue its row."""
+        try:
+            record = loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("Record must be a JSON object")
+            handler = {
+                "export": self._check_header,
+                "project": self._add_project,
+                "session": self._add_session,
+                "message": self._add_message,
+            }.get(record.get("type"))
+            if handler is None:
+                raise ValueError(f"Unknown record type: {record.get('type')!r}")
+            handler(record)
+        except (ValueError, ValidationError) as e:
+            self._reject(number, e)
+            return
+
+        if sum(len(rows) for rows in self.pending.values()) >= self.service.batch_size:
+            self._flush()
+
+    def finish(self) -> None:
+        """Write remaining rows and commit."""
+        self._flush()
+        self._commit()
+
+    def report(self) -> Dict[str, Any]:
+        """Build the import report."""
+        elapsed = time.perf_counter() - self.started
+        rows = sum(self.counts.values())
+        return {
+            **self.counts,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(rows / elapsed, 1) if elapsed else 0.0,
+        }
+
+    def _check_header(self, record: Dict[str, Any]) -> None:
+        """Reject files written by a newer export format."""
+        version = record.get("version")
+        if version is not None and version > EXPORT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported export version: {version}")
+
+    def _add_project(self, record: Dict[str, Any]) -> None:
+        """Queue a project under a new ID."""
+        project = ImportProject.model_validate(record)
+        new_id = uuid.uuid4()
+        created_at = project.created_at or datetime.utcnow()
+        self.pending[Project].append({
+            "id": new_id,
+            "owner_id": self.owner_id,
+            "name": project.name,
+            "description": project.description,
+            "status": project.status,
+            "technology_stack": project.technology_stack,
+            "created_at": created_at,
+            "updated_at": project.updated_at or created_at,
+        })
+        self.project_ids[project.id] = new_id
+
+    def _add_session(self, record: Dict[str, Any]) -> None:
+        """Queue a session, remapping its project."""
+        session = ImportSession.model_validate(record)
+        project_id = None
+        if session.project_id is not None:
+            project_id = self.project_ids.get(session.project_id)
+            if project_id is None:
+                raise ValueError(f"Unknown project_id: {session.project_id}")
+
+        new_id = uuid.uuid4()
+        created_at = session.created_at or datetime.utcnow()
+        self.pending[SessionModel].append({
+            "id": new_id,
+            "owner_id": self.owner_id,
+            "project_id": project_id,
+            "name": session.name,
+            "status": session.status,
+            "mode": session.mode,
+            "role": session.role,
+            "message_seq": 0,
+            "message_count": 0,
+            "created_at": created_at,
+            "updated_at": session.updated_at or created_at,
+        })
+        self.session_ids[session.id] = new_id
+        self.next_seq[new_id] = 1
+
+    def _add_message(self, record: Dict[str, Any]) -> None:
+        """Queue a message with the next seq of its remapped session."""
+        message = ImportMessage.model_validate(record)
+        session_id = self.session_ids.get(message.session_id)
+        if session_id is None:
+            raise ValueError(f"Unknown session_id: {message.session_id}")
+
+        seq = self.next_seq[session_id]
+        self.next_seq[session_id] = seq + 1
+        created_at = message.created_at or datetime.utcnow()
+        self.pending[Message].append({
+            "id": uuid7(created_at),
+            "session_id": session_id,
+            "user_id": self.owner_id,
+            "seq": seq,
+            "role": message.role,
+            "content": message.content,
+            "message_type": message.message_type,
+            "meta": message.meta or {},
+            "created_at": created_at,
+            "updated_at": created_at,
+        })
+        self.touched_sessions.add(session_id)
+
+    def _reject(self, number: int, error: Exception) -> None:
+        """Count a rejected line and keep its error for the report."""
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            if isinstance(error, ValidationError):
+                detail = "; ".join(
+                    f"{'.'.join(str(p) for p in e['loc'])}: {e['msg']}" for e in error.errors()
+                )
+            else:
+                detail = str(error)
+            self.errors.append({"line": number, "error": detail})
+
+    def _flush(self) -> None:
+        """Insert pending rows in FK order, then commit if the chunk is full."""
+        for model, key in ((Project, "projects"), (SessionModel, "sessions"), (Message, "messages")):
+            rows = self.pending[model]
+            if not rows:
+                continue
+            try:
+                self.db.execute(insert(model), rows)
+                if model is Message:
+                    index_written_messages(self.db.connection(), rows)
+            except Exception:
+                self.db.rollback()
+                raise
+            self.counts[key] += len(rows)
+            self.uncommitted += len(rows)
+            self.pending[model] = []
+
+        if self.uncommitted >= self.service.transaction_size:
+            self._commit()
+
+    def _commit(self) -> None:
+        """Store per-session seq and message counters and commit the chunk."""
+        if self.touched_sessions:
+            # Imported sessions are new and numbered from 1 without gaps
+            statement = update(SessionModel).where(
+                SessionModel.id == bindparam("session_id")
+            ).values(
+                message_seq=bindparam("last_seq"),
+                message_count=bindparam("last_seq"),
+                updated_at=SessionModel.updated_at
+            )
+            self.db.connection().execute(statement, [
+                {"session_id": session_id, "last_seq": self.next_seq[session_id] - 1}
+                for session_id in self.touched_sessions
+            ])
+            self.touched_sessions.clear()
+
+        self.service.commit()
+        invalidate("projects", self.owner_id)
+        invalidate("sessions", self.owner_id)
+        self.uncommitted = 0
+        if self.service.progress:
+            self.service.progress(self.report())
@@ -1,13 +1,23 @@
 """Message service for conversation handling."""
 
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 from anthropic import Anthropic
 
+from backend.src.cache import invalidate
+from backend.src.config import settings
 from backend.src.models import Message
-from backend.src.repositories import MessageRepository, SessionRepository
+from backend.src.repositories import MessageRepository, SessionRepository, TranscriptRepository
+from backend.src.repositories.transcript_repository import decode_rows
+from backend.src.schemas.message import MessageResponse
+from backend.src.services.archive_service import ArchiveService
 from backend.src.services.base_service import BaseService
+from backend.src.services.preference_service import PreferenceService
+from backend.src.utils.projection import schema_columns
+
+# Columns serialized by MessageResponse
+MESSAGE_RESPONSE_COLUMNS = schema_columns(Message, MessageResponse)
 
 
 class MessageService(BaseService):
@@ -23,6 +33,7 @@ class MessageService(BaseService):
         super().__init__(db)
         self.repo = MessageRepository(db)
         self.session_repo = SessionRepository(db)
+        self.transcripts = TranscriptRepository(db)
         self.client = Anthropic(api_key=anthropic_api_key)
 
     def send_message(
@@ -61,6 +72,10 @@ class MessageService(BaseService):
         if session.owner_id != user_id:
             raise ValueError("Not authorized for this session")
 
+        if session.status == "ARCHIVED":
+            # Continue the conversation in the hot table
+            ArchiveService(self.db).restore_session(session_id)
+
         # Save user message
         user_message = Message(
             session_id=session_id,
@@ -74,7 +89,7 @@ class MessageService(BaseService):
 
         # Generate assistant response
         try:
-            response_text = self._generate_response(session_id, content)
+            response_text = self._generate_response(session_id, user_id, content)
         except Exception as e:
             self.logger.error(f"Response generation failed: {e}")
             raise ValueError("Failed to generate AI response")
@@ -87,17 +102,54 @@ class MessageService(BaseService):
             content=response_text,
             message_type="text"
         )
+
+        # Reserve sequence numbers only now, so the session row is not held
+        # locked for the duration of the LLM call
+        first_seq = self.repo.allocate_seq(session_id, count=2)
+        user_message.seq = first_seq
+        assistant_message.seq = first_seq + 1
         self.db.add(assistant_message)
         self.commit()
 
+        self._extend_transcript(session_id, [user_message, assistant_message], first_seq)
+        # Session lists and the dashboard show message activity
+        invalidate("sessions", session.owner_id)
+
         self.logger.info(f"Message sent in session: {session_id}")
         return user_message, assistant_message
 
-    def _generate_response(self, session_id: UUID, user_input: str) -> str:
+    def _extend_transcript(self, session_id: UUID, messages: List[Message], first_seq: int) -> None:
+        """Append just-committed messages to the session's cached transcript.
+
+        Best effort: on failure the transcript is left stale and rebuilt on
+        the next ``get_transcript``.
+        """
+        if not settings.TRANSCRIPT_CACHE_ENABLED:
+            return
+        try:
+            transcript = self.transcripts.get_for_update(session_id)
+            if transcript is None:
+                # Nothing cached yet; built on the first read
+                self.rollback()
+                return
+            rows = [
+                {column.key: getattr(message, column.key) for column in MESSAGE_RESPONSE_COLUMNS}
+                for message in messages
+            ]
+            self.transcripts.append(transcript, rows, first_seq)
+            self.commit()
+        except Exception as e:
+            self.rollback()
+            self.logger.warning(f"Transcript append failed for session {session_id}: {e}")
+
+    def _generate_response(self, session_id: UUID, user_id: UUID, user_input: str) -> str:
         """Generate response using Claude API.
 
+        Model parameters come from the user's cached preferences.
+
         Args:
             session_id: Session ID for context
+            user_id: User whose preferences select the model
             user_input: User input
 
         Returns:
@@ -110,11 +162,7 @@ class MessageService(BaseService):
         session = self.session_repo.get_by_id(session_id)
 
         # Get message history for context (last 10 messages)
-        messages_history = self.repo.get_by_session_sorted(
-            session_id,
-            limit=10,
-            sort_order="asc"
-        )
+        messages_history = self.repo.get_context_window(session_id, limit=10)
 
         # Build message list for API
         messages = []
@@ -133,11 +181,14 @@ class MessageService(BaseService):
         # Get system prompt based on session mode
         system_prompt = self._get_system_prompt(session)
 
+        llm = PreferenceService(self.db).resolve_llm_settings(user_id)
+
         # Call Claude API with system prompt
         try:
             response = self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=2000,
+                model=llm["model"],
+                max_tokens=llm["max_tokens"],
+                temperature=llm["temperature"],
                 system=system_prompt,
                 messages=messages
             )
@@ -223,8 +274,11 @@ class MessageService(BaseService):
         if message.user_id != user_id:
             raise ValueError("Not authorized to delete this message")
 
+        self.transcripts.invalidate(message.session_id)
+        self.repo.record_deleted(message.session_id)
         self.db.delete(message)
         self.commit()
+        invalidate("sessions", user_id)
 
         self.logger.info(f"Message deleted: {message_id}")
         return True
@@ -249,13 +303,11 @@ class MessageService(BaseService):
         Returns:
             Count of messages
         """
-        from sqlalchemy import func
-        query = self.db.query(func.count(Message.id))
-
         if session_id:
-            query = query.filter(Message.session_id == session_id)
+            return self.repo.get_by_session_count(session_id)
 
-        return query.scalar()
+        from sqlalchemy import func
+        return self.db.query(func.count(Message.id)).scalar()
 
     def get_messages_paginated(
         self,
@@ -273,11 +325,95 @@ class MessageService(BaseService):
         Returns:
             List of messages
         """
-        query = self.db.query(Message).filter(Message.session_id == session_id)
+        return self.repo.get_by_session_sorted(session_id, skip=(page - 1) * limit, limit=limit)
+
+    def get_messages_paginated_rows(
+        self,
+        session_id: UUID,
+        page: int = 1,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Get paginated messages as plain dicts of response columns.
 
-        # Sort by created_at ascending (oldest first)
-        query = query.order_by(Message.created_at.asc())
+        Selects only the columns serialized by MessageResponse and skips ORM
+        hydration, so rows can be rendered straight to JSON.
 
-        # Apply pagination
-        skip = (page - 1) * limit
-        return query.offset(skip).limit(limit).all()
+        Args:
+            session_id: Session ID
+            page: Page number (1-indexed)
+            limit: Items per page
+
+        Returns:
+            List of message dicts
+        """
+        rows = self.repo.get_by_session_sorted(
+            session_id,
+            skip=(page - 1) * limit,
+            limit=limit,
+            columns=MESSAGE_RESPONSE_COLUMNS
+        )
+        return [dict(row._mapping) for row in rows]
+
+    def get_transcript(self, session_id: UUID) -> Dict[str, Any]:
+        """Get a session's whole history from its materialized transcript.
+
+        An up-to-date transcript is served with a single query and no ORM
+        hydration. A missing or stale one (messages added outside
+        ``send_message``, or deleted) is rebuilt from the messages and stored.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Dict with messages (response dicts in seq order), total and last_seq
+
+        Raises:
+            ValueError: If the session does not exist
+        """
+        transcript, message_seq = self.transcripts.get_current(session_id)
+        if message_seq is None:
+            raise ValueError("Session not found")
+
+        if transcript is not None:
+            messages = decode_rows(transcript.data)
+        else:
+            rows = self.repo.get_after_seq(session_id, 0, None, columns=MESSAGE_RESPONSE_COLUMNS)
+            messages = [dict(row._mapping) for row in rows]
+            if settings.TRANSCRIPT_CACHE_ENABLED:
+                try:
+                    self.transcripts.replace(session_id, messages, message_seq)
+                    self.commit()
+                except Exception as e:
+                    # A concurrent reader may have stored it first
+                    self.rollback()
+                    self.logger.warning(f"Transcript rebuild failed for session {session_id}: {e}")
+
+        return {"messages": messages, "total": len(messages), "last_seq": message_seq}
+
+    def get_messages_since(
+        self,
+        session_id: UUID,
+        after_seq: int = 0,
+        limit: int = 500
+    ) -> Dict[str, Any]:
+        """Get messages a reconnecting client has missed.
+
+        Args:
+            session_id: Session ID
+            after_seq: Last sequence number the client has seen
+            limit: Maximum messages to return
+
+        Returns:
+            Dict with messages, last_seq and has_more
+        """
+        rows = self.repo.get_after_seq(
+            session_id, after_seq, limit + 1, columns=MESSAGE_RESPONSE_COLUMNS
+        )
+        has_more = len(rows) > limit
+        messages = [dict(row._mapping) for row in rows[:limit]]
+
+        return {
+            "messages": messages,
+            "last_seq": messages[-1]["seq"] if messages else after_seq,
+            "has_more": has_more
+        }
@@ -1,16 +1,41 @@
 """Preference service for user settings."""
 
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 
+from backend.src.cache import get_cache
+from backend.src.config import settings
 from backend.src.models import UserPreference
 from backend.src.repositories import PreferenceRepository
+from backend.src.schemas.profile import PreferenceResponse
 from backend.src.services.base_service import BaseService
+from backend.src.utils.projection import schema_columns
+
+# Columns serialized by PreferenceResponse, plus the version timestamp
+PREFERENCE_ROW_COLUMNS = schema_columns(UserPreference, PreferenceResponse) + (
+    UserPreference.updated_at,
+)
+
+# Stored llm_model values that are not API model IDs
+LLM_MODEL_ALIASES = {
+    "claude-3-sonnet": None,  # Column default: use LLM_DEFAULT_MODEL
+}
+
+CACHE_NAMESPACE = "preferences"
 
 
 class PreferenceService(BaseService):
-    """Service for user preferences."""
+    """Service for user preferences.
+
+    Preferences are created with the user (``UserService.register_user``)
+    and cached per user as plain dicts, so steady-state reads, including
+    per-message model resolution, do not touch the database. Updates drop
+    the cached row after committing and the next read reloads it; writing
+    the row through instead could leave an older update's row cached when
+    two updates commit and reach the cache in opposite orders.
+    """
 
     def __init__(self, db: Session):
         """Initialize preference service."""
@@ -20,6 +45,9 @@ class PreferenceService(BaseService):
     def get_or_create_preferences(self, user_id: UUID) -> UserPreference:
         """Get preferences or create with defaults.
 
+        Only users registered before preferences were created at
+        registration can be missing them.
+
         Args:
             user_id: User ID
 
@@ -31,6 +59,7 @@ class PreferenceService(BaseService):
         if not prefs:
             prefs = self.repo.create_for_user(user_id)
             self.commit()
+            self._forget(user_id)
             self.logger.info(f"Default preferences created for user: {user_id}")
 
         return prefs
@@ -46,6 +75,49 @@ class PreferenceService(BaseService):
         """
         return self.repo.get_by_user_id(user_id)
 
+    def get_preferences_row(self, user_id: UUID) -> Optional[Dict[str, Any]]:
+        """Get user preferences as a plain dict, cached per user.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Dict of PreferenceResponse fields plus ``updated_at``, or None
+        """
+        cache = get_cache()
+        if cache is None:
+            return self._load_row(user_id)
+        return cache.get_or_set(CACHE_NAMESPACE, user_id, lambda: self._load_row(user_id))
+
+    def resolve_llm_settings(self, user_id: UUID) -> Dict[str, Any]:
+        """Get the model parameters to answer a user's message with.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Dict with ``model``, ``temperature`` and ``max_tokens``
+        """
+        prefs = self.get_preferences_row(user_id) or {}
+        model = prefs.get("llm_model") or None
+        model = LLM_MODEL_ALIASES.get(model, model)
+        return {
+            "model": model or settings.LLM_DEFAULT_MODEL,
+            "temperature": prefs.get("llm_temperature", 0.7),
+            "max_tokens": prefs.get("llm_max_tokens") or 2000,
+        }
+
+    def get_preferences_version(self, user_id: UUID):
+        """Get preferences version columns for ETag derivation.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Row with id and updated_at, or None if no preferences exist
+        """
+        return self.repo.get_version(user_id)
+
     def update_preferences(
         self,
         user_id: UUID,
@@ -104,7 +176,7 @@ class PreferenceService(BaseService):
         if notifications_enabled is not None:
             prefs.notifications_enabled = notifications_enabled
 
-        self.commit()
+        self._save(prefs)
         self.logger.info(f"Preferences updated for user: {user_id}")
         return prefs
 
@@ -127,6 +199,30 @@ class PreferenceService(BaseService):
         prefs.auto_sync = False
         prefs.notifications_enabled = True
 
-        self.commit()
+        self._save(prefs)
         self.logger.info(f"Preferences reset to defaults for user: {user_id}")
         return prefs
+
+    def _load_row(self, user_id: UUID) -> Optional[Dict[str, Any]]:
+        """Read a user's preferences row from the database."""
+        row = self.repo.get_by_user_id(user_id, columns=PREFERENCE_ROW_COLUMNS)
+        return dict(row._mapping) if row else None
+
+    def _save(self, prefs: UserPreference) -> None:
+        """Commit changed preferences and drop the cached row.
+
+        ``updated_at`` is stamped here with microseconds: the column's
+        ``onupdate`` uses the database clock, which has one-second
+        resolution on SQLite and would give quick successive updates the
+        same ETag.
+        """
+        prefs.updated_at = datetime.utcnow()
+        self.commit()
+        self._forget(prefs.user_id)
+
+    @staticmethod
+    def _forget(user_id: UUID) -> None:
+        """Drop a user's cached preferences."""
+        cache = get_cache()
+        if cache is not None:
+            cache.delete(CACHE_NAMESPACE, user_id)
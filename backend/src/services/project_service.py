@@ -1,12 +1,21 @@
 """Project service for project management."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 
+from backend.src.cache import cached, invalidate
+from backend.src.config import settings
 from backend.src.models import Project
+from backend.src.models.jsonb import json_contains
 from backend.src.repositories import ProjectRepository
+from backend.src.schemas.project import ProjectResponse
 from backend.src.services.base_service import BaseService
+from backend.src.services.purge_service import PurgeService
+from backend.src.utils.projection import schema_columns
+
+# Columns serialized by ProjectResponse
+PROJECT_RESPONSE_COLUMNS = schema_columns(Project, ProjectResponse)
 
 
 class ProjectService(BaseService):
@@ -54,6 +63,7 @@ class ProjectService(BaseService):
 
         self.db.add(project)
         self.commit()
+        invalidate("projects", owner_id)
 
         self.logger.info(f"Project created: {name} by {owner_id}")
         return project
@@ -103,9 +113,12 @@ class ProjectService(BaseService):
         description: str = None,
         status: str = None,
         technology_stack: List[str] = None
-    ) -> Project:
+    ) -> Optional[Project]:
         """Update project.
 
+        Ownership is checked in the UPDATE's WHERE clause, so the project is
+        not loaded first.
+
         Args:
             project_id: Project ID
             owner_id: Owner user ID (for authorization)
@@ -115,49 +128,53 @@ class ProjectService(BaseService):
             technology_stack: New technology stack
 
         Returns:
-            Updated project
+            Updated project, or None if the user owns no such project
 
         Raises:
             ValueError: If validation fails
         """
-        project = self.repo.get_by_id(project_id)
-
-        if not project:
-            raise ValueError("Project not found")
-
-        if project.owner_id != owner_id:
-            raise ValueError("Not authorized to update this project")
+        values = {}
 
         if name:
             if len(name) > 255:
                 raise ValueError("Project name too long")
-            project.name = name
+            values["name"] = name
 
         if description is not None:
-            project.description = description
+            values["description"] = description
 
         if status:
             valid_statuses = ["PLANNING", "DESIGN", "DEVELOPMENT", "TESTING", "COMPLETE"]
             if status not in valid_statuses:
                 raise ValueError(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
-            project.status = status
+            values["status"] = status
 
         if technology_stack is not None:
-            project.technology_stack = technology_stack
+            values["technology_stack"] = technology_stack
+
+        project = self.repo.partial_update(project_id, values, owner_id=owner_id)
+        if not project:
+            return None
 
         self.commit()
+        invalidate("projects", owner_id)
         self.logger.info(f"Project updated: {project_id}")
         return project
 
     def delete_project(self, project_id: UUID, owner_id: UUID) -> bool:
         """Delete project.
 
+        Projects with up to DELETE_INLINE_MAX_ROWS sessions and messages
+        are deleted at once, relying on ON DELETE CASCADE. Larger ones are
+        soft-deleted; the caller should then schedule
+        ``purge_in_background("project", project_id)``.
+
         Args:
             project_id: Project ID
             owner_id: Owner user ID (for authorization)
 
         Returns:
-            True if deleted
+            True if deleted, False if soft-deleted and awaiting purge
 
         Raises:
             ValueError: If authorization fails
@@ -170,12 +187,26 @@ class ProjectService(BaseService):
         if project.owner_id != owner_id:
             raise ValueError("Not authorized to delete this project")
 
+        purger = PurgeService(self.db)
+        if purger.estimate_rows("project", project_id) > settings.DELETE_INLINE_MAX_ROWS:
+            purger.mark_deleted("project", project_id)
+            self.commit()
+            self._invalidate_lists(owner_id)
+            return False
+
         self.db.delete(project)
         self.commit()
+        self._invalidate_lists(owner_id)
 
         self.logger.info(f"Project deleted: {project_id}")
         return True
 
+    @staticmethod
+    def _invalidate_lists(owner_id: UUID) -> None:
+        """Drop cached project and session lists (a project's sessions go with it)."""
+        invalidate("projects", owner_id)
+        invalidate("sessions", owner_id)
+
     def get_projects_by_status(self, status: str) -> List[Project]:
         """Get all projects by status.
 
@@ -187,18 +218,25 @@ class ProjectService(BaseService):
         """
         return self.repo.get_by_status(status)
 
-    def count_projects(self, owner_id: UUID = None, status: str = None) -> int:
+    @cached("projects", scope="owner_id")
+    def count_projects(
+        self,
+        owner_id: UUID = None,
+        status: str = None,
+        technology: str = None
+    ) -> int:
         """Count projects for user.
 
         Args:
             owner_id: Owner user ID
             status: Optional status filter
+            technology: Optional entry the technology stack must contain
 
         Returns:
             Count of projects
         """
         from sqlalchemy import func
-        query = self.db.query(func.count(Project.id))
+        query = self.db.query(func.count(Project.id)).filter(Project.deleted_at.is_(None))
 
         if owner_id:
             query = query.filter(Project.owner_id == owner_id)
@@ -206,6 +244,9 @@ class ProjectService(BaseService):
         if status:
             query = query.filter(Project.status == status)
 
+        if technology:
+            query = query.filter(json_contains(Project.technology_stack, technology))
+
         return query.scalar()
 
     def get_projects_paginated(
@@ -213,7 +254,8 @@ class ProjectService(BaseService):
         owner_id: UUID,
         page: int = 1,
         limit: int = 10,
-        status: str = None
+        status: str = None,
+        technology: str = None
     ) -> List[Project]:
         """Get paginated projects for user.
 
@@ -222,21 +264,60 @@ class ProjectService(BaseService):
             page: Page number (1-indexed)
             limit: Items per page
             status: Optional status filter
+            technology: Optional entry the technology stack must contain
 
         Returns:
             List of projects
         """
-        query = self.db.query(Project).filter(Project.owner_id == owner_id)
+        return self.repo.list_by_owner(
+            owner_id, skip=(page - 1) * limit, limit=limit, status=status, technology=technology
+        )
 
-        if status:
-            query = query.filter(Project.status == status)
+    @cached("projects", scope="owner_id")
+    def get_projects_paginated_rows(
+        self,
+        owner_id: UUID,
+        page: int = 1,
+        limit: int = 10,
+        status: str = None,
+        technology: str = None
+    ) -> List[Dict[str, Any]]:
+        """Get paginated projects as plain dicts of response columns.
+
+        Args:
+            owner_id: Owner user ID
+            page: Page number (1-indexed)
+            limit: Items per page
+            status: Optional status filter
+            technology: Optional entry the technology stack must contain
+
+        Returns:
+            List of project dicts
+        """
+        rows = []
+        for row in self.repo.list_by_owner(
+            owner_id,
+            skip=(page - 1) * limit,
+            limit=limit,
+            status=status,
+            columns=PROJECT_RESPONSE_COLUMNS,
+            technology=technology
+        ):
+            data = dict(row._mapping)
+            data["technology_stack"] = data["technology_stack"] or []
+            rows.append(data)
+        return rows
+
+    def get_project_version(self, project_id: UUID):
+        """Get project version columns for ETag derivation.
 
-        # Sort by created_at descending
-        query = query.order_by(Project.created_at.desc())
+        Args:
+            project_id: Project ID
 
-        # Apply pagination
-        skip = (page - 1) * limit
-        return query.offset(skip).limit(limit).all()
+        Returns:
+            Row with owner_id and updated_at, or None if not found
+        """
+        return self.repo.get_version(project_id)
 
     def get_project_by_id(self, project_id: UUID) -> Optional[Project]:
         """Get project by ID.
@@ -0,0 +1,212 @@
+"""Purge service for removing users, projects and sessions in batches."""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from backend.src.config import settings
+from backend.src.database import SessionLocal
+from backend.src.models import AuditLog, Message, Project, Session as SessionModel, User
+from backend.src.services.base_service import BaseService
+
+logger = logging.getLogger(__name__)
+
+PURGE_MODELS = {
+    "user": User,
+    "project": Project,
+    "session": SessionModel,
+}
+
+
+class PurgeService(BaseService):
+    """Service for deleting entities whose children are too many to cascade at once.
+
+    Small deletes rely on ``ON DELETE CASCADE``. Large ones are first marked
+    with ``deleted_at`` (hiding them from every read path) and then purged
+    here: children go in ``batch_size``-row DELETEs, each committed on its
+    own so no single statement holds locks for long, and the parent row is
+    deleted last. Purging is idempotent, so an interrupted purge can simply
+    be run again (see ``purge_pending``).
+    """
+
+    def __init__(self, db: Session, batch_size: int = 1000):
+        """Initialize purge service.
+
+        Args:
+            db: SQLAlchemy session
+            batch_size: Rows per DELETE statement
+        """
+        super().__init__(db)
+        self.batch_size = batch_size
+
+    def estimate_rows(self, entity_type: str, entity_id: UUID) -> int:
+        """Estimate rows removed by deleting an entity, without counting messages.
+
+        Uses ``sessions.message_seq`` (the last allocated message number) as
+        an upper bound on each session's message count.
+
+        Args:
+            entity_type: ``user``, ``project`` or ``session``
+            entity_id: Entity ID
+
+        Returns:
+            Upper bound on sessions plus messages below the entity
+        """
+        model = PURGE_MODELS[entity_type]
+        column = {
+            User: SessionModel.owner_id,
+            Project: SessionModel.project_id,
+            SessionModel: SessionModel.id,
+        }[model]
+        return self.db.scalar(
+            select(func.coalesce(func.sum(SessionModel.message_seq + 1), 0))
+            .where(column == entity_id)
+        )
+
+    def mark_deleted(self, entity_type: str, entity_id: UUID) -> None:
+        """Soft-delete an entity so it disappears until the purger removes it.
+
+        A project's sessions are marked with it, so they stop showing up in
+        session lists too. Deleted users are also made inactive, which
+        invalidates their tokens.
+
+        Args:
+            entity_type: ``user``, ``project`` or ``session``
+            entity_id: Entity ID
+        """
+        model = PURGE_MODELS[entity_type]
+        now = datetime.utcnow()
+        values = {"deleted_at": now}
+        if model is User:
+            values["status"] = "DELETED"
+
+        self.db.execute(
+            update(model).where(model.id == entity_id).values(**values),
+            execution_options={"synchronize_session": False},
+        )
+        if model is Project:
+            self.db.execute(
+                update(SessionModel)
+                .where(SessionModel.project_id == entity_id, SessionModel.deleted_at.is_(None))
+                .values(deleted_at=now),
+                execution_options={"synchronize_session": False},
+            )
+        self.logger.info(f"{entity_type.capitalize()} marked for purge: {entity_id}")
+
+    def purge(self, entity_type: str, entity_id: UUID) -> int:
+        """Delete an entity and everything below it in batches.
+
+        Commits after every batch.
+
+        Args:
+            entity_type: ``user``, ``project`` or ``session``
+            entity_id: Entity ID
+
+        Returns:
+            Number of rows deleted
+        """
+        model = PURGE_MODELS[entity_type]
+        deleted = 0
+
+        for child, condition in self._children(model, entity_id):
+            deleted += self._delete_in_batches(child, condition)
+
+        if model is User:
+            # audit_log keeps its rows; clear the reference ahead of ON DELETE SET NULL
+            self._detach_audit_log(entity_id)
+
+        result = self.db.execute(
+            delete(model).where(model.id == entity_id),
+            execution_options={"synchronize_session": False},
+        )
+        self.commit()
+        deleted += result.rowcount
+
+        self.logger.info(f"{entity_type.capitalize()} purged: {entity_id} ({deleted} rows)")
+        return deleted
+
+    def purge_pending(self) -> Dict[str, int]:
+        """Purge every soft-deleted entity, e.g. after a restart.
+
+        Returns:
+            Dict of entity type -> number of entities purged
+        """
+        report = {}
+        # Sessions first: they are the cheapest and may belong to pending projects
+        for entity_type in ("session", "project", "user"):
+            model = PURGE_MODELS[entity_type]
+            ids = self.db.scalars(select(model.id).where(model.deleted_at.isnot(None))).all()
+            for entity_id in ids:
+                self.purge(entity_type, entity_id)
+            report[entity_type] = len(ids)
+        return report
+
+    @staticmethod
+    def _children(model: type, entity_id: UUID) -> List[tuple]:
+        """(table, condition) pairs to clear below an entity, leaves first."""
+        if model is SessionModel:
+            return [(Message, Message.session_id == entity_id)]
+
+        owner_column = SessionModel.project_id if model is Project else SessionModel.owner_id
+        sessions = select(SessionModel.id).where(owner_column == entity_id)
+        children = [(Message, Message.session_id.in_(sessions))]
+        if model is User:
+            children += [
+                (Message, Message.user_id == entity_id),
+                (SessionModel, SessionModel.owner_id == entity_id),
+                (Project, Project.owner_id == entity_id),
+            ]
+        else:
+            children.append((SessionModel, SessionModel.project_id == entity_id))
+        return children
+
+    def _delete_in_batches(self, model: type, condition: Any) -> int:
+        """Delete matching rows ``batch_size`` at a time, committing each batch."""
+        statement = delete(model).where(
+            model.id.in_(select(model.id).where(condition).limit(self.batch_size))
+        )
+        deleted = 0
+        while True:
+            result = self.db.execute(statement, execution_options={"synchronize_session": False})
+            self.commit()
+            deleted += result.rowcount
+            if result.rowcount < self.batch_size:
+                return deleted
+
+    def _detach_audit_log(self, user_id: UUID) -> None:
+        """Null out audit_log.user_id for a user in batches."""
+        statement = update(AuditLog).where(
+            AuditLog.id.in_(
+                select(AuditLog.id).where(AuditLog.user_id == user_id).limit(self.batch_size)
+            )
+        ).values(user_id=None)
+        while True:
+            result = self.db.execute(statement, execution_options={"synchronize_session": False})
+            self.commit()
+            if result.rowcount < self.batch_size:
+                return
+
+
+def purge_in_background(entity_type: str, entity_id: UUID, batch_size: Optional[int] = None) -> None:
+    """Purge a soft-deleted entity in a session of its own.
+
+    Meant for ``BackgroundTasks``: the request's session is closed by the
+    time this runs. Failures are logged; the entity stays soft-deleted and
+    is picked up by the next ``purge_pending`` run.
+
+    Args:
+        entity_type: ``user``, ``project`` or ``session``
+        entity_id: Entity ID
+        batch_size: Rows per DELETE (defaults to PURGE_BATCH_SIZE)
+    """
+    db = SessionLocal()
+    try:
+        PurgeService(db, batch_size or settings.PURGE_BATCH_SIZE).purge(entity_type, entity_id)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Purge of {entity_type} {entity_id} failed: {e}")
+    finally:
+        db.close()
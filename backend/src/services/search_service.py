@@ -0,0 +1,67 @@
+"""Search service for message history."""
+
+from typing import Any, Dict
+from uuid import UUID
+from sqlalchemy.orm import Session
+
+from backend.src.repositories import MessageSearchRepository
+from backend.src.services.base_service import BaseService
+
+MAX_QUERY_LENGTH = 200
+
+
+class SearchService(BaseService):
+    """Service for full-text search over past sessions."""
+
+    def __init__(self, db: Session):
+        """Initialize search service."""
+        super().__init__(db)
+        self.search_repo = MessageSearchRepository(db)
+
+    def search_messages(
+        self,
+        owner_id: UUID,
+        query: str,
+        project_id: UUID = None,
+        session_id: UUID = None,
+        page: int = 1,
+        limit: int = 20
+    ) -> Dict[str, Any]:
+        """Search a user's messages.
+
+        Args:
+            owner_id: Owner user ID
+            query: Search text
+            project_id: Optional project scope
+            session_id: Optional session scope
+            page: Page number (1-indexed)
+            limit: Results per page
+
+        Returns:
+            Dict with ranked results, total, page and limit
+
+        Raises:
+            ValueError: If the query is empty or too long
+        """
+        query = (query or "").strip()
+        if not query:
+            raise ValueError("Search query must not be empty")
+        if len(query) > MAX_QUERY_LENGTH:
+            raise ValueError(f"Search query must be at most {MAX_QUERY_LENGTH} characters")
+
+        skip = (page - 1) * limit
+        results, total = self.search_repo.search(
+            owner_id,
+            query,
+            project_id=project_id,
+            session_id=session_id,
+            skip=skip,
+            limit=limit
+        )
+
+        return {
+            "results": results,
+            "total": total,
+            "page": page,
+            "limit": limit
+        }
@@ -1,13 +1,22 @@
 """Session service for session management."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
+from backend.src.cache import cached, invalidate
+from backend.src.config import settings
 from backend.src.models import Session as SessionModel
 from backend.src.repositories import SessionRepository, MessageRepository
+from backend.src.schemas.session import SessionResponse
 from backend.src.services.base_service import BaseService
+from backend.src.services.purge_service import PurgeService
+from backend.src.utils.projection import schema_columns
+from backend.src.utils.text import message_preview
+
+# Columns serialized by SessionResponse
+SESSION_RESPONSE_COLUMNS = schema_columns(SessionModel, SessionResponse)
 
 
 class SessionService(BaseService):
@@ -57,6 +66,7 @@ class SessionService(BaseService):
 
         self.db.add(session)
         self.commit()
+        invalidate("sessions", owner_id)
 
         self.logger.info(f"Session created: {session.id} by {owner_id}")
         return session
@@ -109,31 +119,35 @@ class SessionService(BaseService):
         """
         return self.session_repo.get_by_project(project_id)
 
-    def toggle_mode(self, session_id: UUID, owner_id: UUID, new_mode: str) -> SessionModel:
+    def toggle_mode(self, session_id: UUID, owner_id: UUID, new_mode: str) -> Optional[SessionModel]:
         """Change session mode.
 
+        Ownership is checked in the UPDATE's WHERE clause, so the session is
+        not loaded first.
+
         Args:
             session_id: Session ID
             owner_id: Owner user ID
             new_mode: New mode
 
         Returns:
-            Updated session
+            Updated session, or None if the user owns no such session
 
         Raises:
             ValueError: If validation fails
         """
-        session = self.get_session(session_id, owner_id)
-
-        if not session:
-            raise ValueError("Session not found")
-
         valid_modes = ["chat", "question", "teaching", "review"]
         if new_mode not in valid_modes:
             raise ValueError(f"Invalid mode. Must be one of: {', '.join(valid_modes)}")
 
-        session.mode = new_mode
+        session = self.session_repo.partial_update(
+            session_id, {"mode": new_mode}, owner_id=owner_id
+        )
+        if not session:
+            return None
+
         self.commit()
+        invalidate("sessions", owner_id)
 
         self.logger.info(f"Session mode changed: {session_id} -> {new_mode}")
         return session
@@ -159,6 +173,7 @@ class SessionService(BaseService):
         session.status = "ARCHIVED"
         session.archived_at = func.now()
         self.commit()
+        invalidate("sessions", owner_id)
 
         self.logger.info(f"Session archived: {session_id}")
         return session
@@ -166,12 +181,17 @@ class SessionService(BaseService):
     def delete_session(self, session_id: UUID, owner_id: UUID) -> bool:
         """Delete session.
 
+        Sessions with up to DELETE_INLINE_MAX_ROWS messages are deleted at
+        once and their messages removed by ON DELETE CASCADE. Larger ones
+        are soft-deleted; the caller should then schedule
+        ``purge_in_background("session", session_id)``.
+
         Args:
             session_id: Session ID
             owner_id: Owner user ID
 
         Returns:
-            True if deleted
+            True if deleted, False if soft-deleted and awaiting purge
 
         Raises:
             ValueError: If authorization fails
@@ -184,12 +204,32 @@ class SessionService(BaseService):
         if session.owner_id != owner_id:
             raise ValueError("Not authorized to delete this session")
 
+        purger = PurgeService(self.db)
+        if purger.estimate_rows("session", session_id) > settings.DELETE_INLINE_MAX_ROWS:
+            purger.mark_deleted("session", session_id)
+            self.commit()
+            invalidate("sessions", owner_id)
+            return False
+
         self.db.delete(session)
         self.commit()
+        invalidate("sessions", owner_id)
 
         self.logger.info(f"Session deleted: {session_id}")
         return True
 
+    def get_session_version(self, session_id: UUID):
+        """Get session version columns for ETag derivation.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Row with owner_id, updated_at, message_seq and message_count,
+            or None if not found
+        """
+        return self.session_repo.get_version(session_id)
+
     def get_session_message_count(self, session_id: UUID) -> int:
         """Get message count for session.
 
@@ -201,6 +241,7 @@ class SessionService(BaseService):
         """
         return self.message_repo.get_by_session_count(session_id)
 
+    @cached("sessions", scope="owner_id")
     def count_sessions(self, owner_id: UUID = None, project_id: UUID = None, status: str = None) -> int:
         """Count sessions for user.
 
@@ -212,7 +253,7 @@ class SessionService(BaseService):
         Returns:
             Count of sessions
         """
-        query = self.db.query(func.count(SessionModel.id))
+        query = self.db.query(func.count(SessionModel.id)).filter(SessionModel.deleted_at.is_(None))
 
         if owner_id:
             query = query.filter(SessionModel.owner_id == owner_id)
@@ -245,20 +286,63 @@ class SessionService(BaseService):
         Returns:
             List of sessions
         """
-        query = self.db.query(SessionModel).filter(SessionModel.owner_id == owner_id)
-
-        if project_id:
-            query = query.filter(SessionModel.project_id == project_id)
+        return self.session_repo.list_by_owner(
+            owner_id,
+            skip=(page - 1) * limit,
+            limit=limit,
+            project_id=project_id,
+            status=status
+        )
 
-        if status:
-            query = query.filter(SessionModel.status == status)
+    @cached("sessions", scope="owner_id")
+    def get_sessions_paginated_rows(
+        self,
+        owner_id: UUID,
+        page: int = 1,
+        limit: int = 10,
+        project_id: UUID = None,
+        status: str = None,
+        include_last_message: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get paginated sessions as plain dicts of response columns.
 
-        # Sort by created_at descending
-        query = query.order_by(SessionModel.created_at.desc())
+        Args:
+            owner_id: Owner user ID
+            page: Page number (1-indexed)
+            limit: Items per page
+            project_id: Optional project ID filter
+            status: Optional status filter
+            include_last_message: Also fill in a preview of the last message
+                and the time of the last message, in the same query
 
-        # Apply pagination
-        skip = (page - 1) * limit
-        return query.offset(skip).limit(limit).all()
+        Returns:
+            List of session dicts
+        """
+        if include_last_message:
+            rows = self.session_repo.list_by_owner_with_last_message(
+                owner_id,
+                SESSION_RESPONSE_COLUMNS,
+                skip=(page - 1) * limit,
+                limit=limit,
+                project_id=project_id,
+                status=status
+            )
+            sessions = []
+            for row in rows:
+                data = dict(row._mapping)
+                data["last_message_preview"] = message_preview(data.pop("last_message_content"))
+                sessions.append(data)
+            return sessions
+
+        rows = self.session_repo.list_by_owner(
+            owner_id,
+            skip=(page - 1) * limit,
+            limit=limit,
+            project_id=project_id,
+            status=status,
+            columns=SESSION_RESPONSE_COLUMNS
+        )
+        return [dict(row._mapping) for row in rows]
 
     def get_session_by_id(self, session_id: UUID, owner_id: UUID = None) -> Optional[SessionModel]:
         """Get session by ID.
@@ -7,8 +7,9 @@ from sqlalchemy.orm import Session
 from passlib.context import CryptContext
 
 from backend.src.models import User
-from backend.src.repositories import UserRepository
+from backend.src.repositories import PreferenceRepository, UserRepository
 from backend.src.services.base_service import BaseService
+from backend.src.services.purge_service import PurgeService
 
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
@@ -134,6 +135,10 @@ class UserService(BaseService):
             status="ACTIVE"
         )
         self.db.add(user)
+        self.flush()
+
+        # Default preferences are created with the user, so reads never have to
+        PreferenceRepository(self.db).create_for_user(user.id)
         self.commit()
 
         self.logger.info(f"User created: {username}")
@@ -151,7 +156,7 @@ class UserService(BaseService):
         """
         user = self.repo.get_by_username(username)
 
-        if not user:
+        if not user or user.deleted_at is not None:
             self.logger.warning(f"Login attempt for non-existent user: {username}")
             return None
 
@@ -310,3 +315,23 @@ class UserService(BaseService):
 
         self.logger.info(f"User activated: {user_id}")
         return user
+
+    def delete_user(self, user_id: UUID) -> None:
+        """Delete user account.
+
+        Accounts are always soft-deleted, since their history can be large;
+        the caller should then schedule ``purge_in_background("user", user_id)``.
+
+        Args:
+            user_id: User ID
+
+        Raises:
+            ValueError: If user not found
+        """
+        if not self.repo.get_by_id(user_id):
+            raise ValueError("User not found")
+
+        PurgeService(self.db).mark_deleted("user", user_id)
+        self.commit()
+
+        self.logger.info(f"User deleted: {user_id}")
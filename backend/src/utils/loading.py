@@ -0,0 +1,35 @@
+"""Relationship loading guards.
+
+Relationships default to lazy loading, so code that touches one on a list
+of rows issues a query per row without it being visible at the call site.
+With STRICT_LOADING enabled every ORM query gets ``raiseload("*")``: a
+relationship that was not loaded explicitly (``selectinload``,
+``joinedload``, ...) raises instead of quietly querying.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, raiseload
+
+
+def _raise_on_lazy_load(execute_state: ORMExecuteState) -> None:
+    """Add ``raiseload("*")`` to top-level ORM SELECTs.
+
+    Loader options set by the query itself name specific relationships and
+    take precedence over the wildcard.
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+    ):
+        execute_state.statement = execute_state.statement.options(raiseload("*"))
+
+
+def enable_strict_loading(session_target) -> None:
+    """Make lazy relationship loads raise for a session class or factory.
+
+    Args:
+        session_target: ``Session`` subclass or ``sessionmaker``
+    """
+    if not event.contains(session_target, "do_orm_execute", _raise_on_lazy_load):
+        event.listen(session_target, "do_orm_execute", _raise_on_lazy_load)
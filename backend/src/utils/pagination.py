@@ -0,0 +1,80 @@
+"""Keyset (cursor) pagination helpers."""
+
+import base64
+from datetime import datetime
+from typing import Any, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+
+def encode_cursor(created_at: datetime, obj_id: Any) -> str:
+    """Build an opaque cursor pointing just past a row.
+
+    Args:
+        created_at: Row timestamp
+        obj_id: Row ID (tie-breaker for equal timestamps)
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{obj_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Parse a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (created_at, id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, obj_id = base64.urlsafe_b64decode(padded).decode("utf-8").split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(obj_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def keyset_page(
+    query: Query,
+    model: type,
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[list, Optional[str]]:
+    """Fetch one page newest-first, continuing after ``cursor``.
+
+    Uses a ``(created_at, id) < (:created_at, :id)`` row comparison so each
+    page is an index range scan rather than an ever-growing OFFSET.
+
+    Args:
+        query: Filtered query over ``model``
+        model: Model with ``created_at`` and ``id`` columns
+        limit: Page size
+        cursor: Cursor from the previous page
+
+    Returns:
+        Tuple of (rows, next cursor or None on the last page)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if cursor:
+        created_at, obj_id = decode_cursor(cursor)
+        query = query.filter(tuple_(model.created_at, model.id) < (created_at, obj_id))
+
+    rows = query.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last.created_at, last.id)
+
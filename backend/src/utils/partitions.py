@@ -0,0 +1,222 @@
+"""Monthly range partitions for append-only tables.
+
+On PostgreSQL ``audit_log`` and ``messages`` are partitioned by month on
+``created_at`` (see migration 004), so retention is a metadata-only
+``DETACH PARTITION`` + ``DROP``/``SET SCHEMA`` instead of a table-wide
+``DELETE``. SQLite keeps the single-table layout and falls back to batched
+deletes.
+"""
+
+import logging
+import re
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Partitioned tables and their partition key
+PARTITIONED_TABLES = {
+    "audit_log": "created_at",
+    "messages": "created_at",
+}
+
+_PARTITION_SUFFIX = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+def month_start(value: datetime) -> datetime:
+    """Truncate a timestamp to the first instant of its month."""
+    return datetime(value.year, value.month, 1)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """Shift a month start by a number of months."""
+    index = value.year * 12 + value.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def retention_cutoff(keep_months: int, now: datetime = None) -> datetime:
+    """First instant kept when keeping ``keep_months`` months, including the current one."""
+    return add_months(month_start(now or datetime.utcnow()), -(keep_months - 1))
+
+
+def partition_name(table: str, start: datetime) -> str:
+    """Name of the partition holding the month starting at ``start``."""
+    return f"{table}_p{start:%Y%m}"
+
+
+def create_partition_sql(table: str, start: datetime) -> str:
+    """DDL creating the monthly partition that starts at ``start``.
+
+    Args:
+        table: Partitioned parent table
+        start: First day of the month
+
+    Returns:
+        CREATE TABLE ... PARTITION OF statement
+    """
+    end = add_months(start, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, start)} "
+        f"PARTITION OF {table} "
+        f"FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+    )
+
+
+class PartitionManager:
+    """Create upcoming partitions and apply retention to old ones."""
+
+    def __init__(self, db: Session, delete_batch_size: int = 5000):
+        """Initialize partition manager.
+
+        Args:
+            db: SQLAlchemy session
+            delete_batch_size: Rows per DELETE on non-partitioned tables
+        """
+        self.db = db
+        self.delete_batch_size = delete_batch_size
+
+    def is_partitioned(self, table: str) -> bool:
+        """Check whether a table uses native partitioning.
+
+        Args:
+            table: Table name
+
+        Returns:
+            True on PostgreSQL once migration 004 has run
+        """
+        if self.db.get_bind().dialect.name != "postgresql":
+            return False
+        return self.db.execute(text("""
+            SELECT 1 FROM pg_partitioned_table
+            JOIN pg_class ON pg_class.oid = pg_partitioned_table.partrelid
+            WHERE pg_class.relname = :table
+        """), {"table": table}).first() is not None
+
+    def list_partitions(self, table: str) -> List[Tuple[str, datetime]]:
+        """List monthly partitions of a table, oldest first.
+
+        Args:
+            table: Partitioned parent table
+
+        Returns:
+            List of (partition name, month start); the default partition is
+            not included
+        """
+        if not self.is_partitioned(table):
+            return []
+
+        rows = self.db.execute(text("""
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = :table
+        """), {"table": table}).scalars()
+
+        partitions = []
+        for name in rows:
+            match = _PARTITION_SUFFIX.search(name)
+            if match:
+                partitions.append((name, datetime(int(match[1]), int(match[2]), 1)))
+        return sorted(partitions, key=lambda p: p[1])
+
+    def ensure_partitions(self, table: str, months_ahead: int = 3, now: datetime = None) -> List[str]:
+        """Create partitions for the current month and the next few.
+
+        Creating them ahead of time keeps new rows out of the default
+        partition, which would otherwise block creating the month later.
+
+        Args:
+            table: Partitioned parent table
+            months_ahead: Number of future months to create
+            now: Reference time (defaults to current UTC time)
+
+        Returns:
+            Names of partitions that were created
+        """
+        if not self.is_partitioned(table):
+            return []
+
+        existing = {name for name, _ in self.list_partitions(table)}
+        current = month_start(now or datetime.utcnow())
+        created = []
+        for offset in range(months_ahead + 1):
+            start = add_months(current, offset)
+            name = partition_name(table, start)
+            if name not in existing:
+                self.db.execute(text(create_partition_sql(table, start)))
+                created.append(name)
+
+        if created:
+            logger.info(f"Created partitions: {', '.join(created)}")
+        return created
+
+    def apply_retention(
+        self,
+        table: str,
+        keep_months: int,
+        archive_schema: Optional[str] = None,
+        now: datetime = None
+    ) -> List[str]:
+        """Remove months older than the retention window.
+
+        Partitioned tables detach whole partitions and then drop them or
+        move them to ``archive_schema``; cost does not depend on row count.
+        Otherwise old rows are deleted in batches.
+
+        Args:
+            table: Partitioned table
+            keep_months: Number of months to keep, including the current one
+            archive_schema: Schema to move detached partitions to instead of
+                dropping them
+            now: Reference time (defaults to current UTC time)
+
+        Returns:
+            Names of partitions removed (or ``[table]`` if rows were deleted
+            from a non-partitioned table)
+
+        Raises:
+            ValueError: If keep_months is less than 1
+        """
+        if keep_months < 1:
+            raise ValueError("keep_months must be at least 1")
+
+        cutoff = retention_cutoff(keep_months, now)
+
+        if not self.is_partitioned(table):
+            return [table] if self._delete_before(table, cutoff) else []
+
+        removed = []
+        if archive_schema:
+            self.db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {archive_schema}"))
+        for name, start in self.list_partitions(table):
+            if add_months(start, 1) > cutoff:
+                break
+            self.db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+            if archive_schema:
+                self.db.execute(text(f"ALTER TABLE {name} SET SCHEMA {archive_schema}"))
+            else:
+                self.db.execute(text(f"DROP TABLE {name}"))
+            removed.append(name)
+
+        if removed:
+            action = f"archived to {archive_schema}" if archive_schema else "dropped"
+            logger.info(f"Partitions {action}: {', '.join(removed)}")
+        return removed
+
+    def _delete_before(self, table: str, cutoff: datetime) -> int:
+        """Delete rows older than ``cutoff`` in batches (non-partitioned fallback)."""
+        key = PARTITIONED_TABLES[table]
+        statement = text(
+            f"DELETE FROM {table} WHERE id IN ("
+            f"SELECT id FROM {table} WHERE {key} < :cutoff LIMIT :batch)"
+        )
+        deleted = 0
+        while True:
+            result = self.db.execute(statement, {"cutoff": cutoff, "batch": self.delete_batch_size})
+            deleted += result.rowcount
+            if result.rowcount < self.delete_batch_size:
+                return deleted
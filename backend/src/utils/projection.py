@@ -0,0 +1,26 @@
+"""Column projections derived from response schemas."""
+
+from typing import Tuple
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+
+
+def schema_columns(model: type, schema: type[BaseModel]) -> Tuple:
+    """Get the model columns a response schema serializes.
+
+    Fields without a matching column (computed or defaulted values) are
+    skipped, so the schema stays the single source
+    of truth for what a list query selects.
+
+    Args:
+        model: SQLAlchemy model class
+        schema: Pydantic response schema
+
+    Returns:
+        Tuple of column attributes in schema field order
+    """
+    columns = inspect(model).columns
+    return tuple(
+        getattr(model, name) for name in schema.model_fields if name in columns
+    )
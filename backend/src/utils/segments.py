@@ -0,0 +1,134 @@
+"""Append-only segment files for cold data.
+
+A segment store is a directory of numbered files (``00000001.seg``, ...).
+Records are only ever appended, to the newest segment until it reaches
+``max_bytes``, and addressed by ``(segment, offset, length)``; callers keep
+those in an index table. Space is reclaimed by copying a segment's live
+records to the newest segment and removing the file. Each record is a 12-byte header (magic, payload
+length, CRC32) followed by the payload, so a torn or corrupted record is
+detected on read instead of returning garbage.
+
+Appends are serialized with a process-wide lock and, where available, an
+exclusive ``flock`` on the segment, so several workers can share one store.
+"""
+
+import os
+import struct
+import threading
+import zlib
+from typing import Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - fcntl is POSIX only
+    fcntl = None
+
+MAGIC = b"SEG1"
+HEADER = struct.Struct(">4sII")  # magic, payload length, crc32
+
+_append_lock = threading.Lock()
+
+
+class SegmentStore:
+    """Directory of append-only segment files."""
+
+    suffix = ".seg"
+
+    def __init__(self, directory: str, max_bytes: int):
+        """Initialize segment store.
+
+        Args:
+            directory: Directory holding the segment files (created if missing)
+            max_bytes: Size after which appends go to a new segment
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def path(self, segment: int) -> str:
+        """Get the file path of a segment."""
+        return os.path.join(self.directory, f"{segment:08d}{self.suffix}")
+
+    def segments(self) -> list:
+        """List existing segment numbers in ascending order."""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            int(name[:-len(self.suffix)])
+            for name in os.listdir(self.directory)
+            if name.endswith(self.suffix) and name[:-len(self.suffix)].isdigit()
+        )
+
+    def append(self, payload: bytes) -> Tuple[int, int, int]:
+        """Append a record and flush it to disk.
+
+        Args:
+            payload: Record payload
+
+        Returns:
+            (segment, offset, length) of the record, header included
+        """
+        record = HEADER.pack(MAGIC, len(payload), zlib.crc32(payload)) + payload
+        os.makedirs(self.directory, exist_ok=True)
+
+        with _append_lock:
+            existing = self.segments()
+            segment = existing[-1] if existing else 1
+            if existing and os.path.getsize(self.path(segment)) >= self.max_bytes:
+                segment += 1
+
+            with open(self.path(segment), "ab") as f:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    offset = f.seek(0, os.SEEK_END)
+                    f.write(record)
+                    f.flush()
+                    os.fsync(f.fileno())
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(f, fcntl.LOCK_UN)
+
+        return segment, offset, len(record)
+
+    def seal(self) -> None:
+        """Start a new, empty segment so later appends leave the current one."""
+        os.makedirs(self.directory, exist_ok=True)
+        with _append_lock:
+            existing = self.segments()
+            open(self.path(existing[-1] + 1 if existing else 1), "ab").close()
+
+    def remove(self, segment: int) -> None:
+        """Delete a segment file (no-op if it is already gone)."""
+        try:
+            os.remove(self.path(segment))
+        except FileNotFoundError:
+            pass
+
+    def read(self, segment: int, offset: int, length: int) -> bytes:
+        """Read a record's payload.
+
+        Args:
+            segment: Segment number
+            offset: Byte offset of the record
+            length: Record length, header included
+
+        Returns:
+            Record payload
+
+        Raises:
+            ValueError: If the record is missing, truncated or corrupted
+        """
+        try:
+            with open(self.path(segment), "rb") as f:
+                f.seek(offset)
+                record = f.read(length)
+        except FileNotFoundError:
+            raise ValueError(f"Segment {segment} not found in {self.directory}")
+
+        if len(record) < HEADER.size:
+            raise ValueError(f"Truncated record at {segment}:{offset}")
+        magic, size, checksum = HEADER.unpack_from(record)
+        payload = record[HEADER.size:]
+        if magic != MAGIC or size != len(payload) or zlib.crc32(payload) != checksum:
+            raise ValueError(f"Corrupted record at {segment}:{offset}")
+        return payload
@@ -0,0 +1,70 @@
+"""Fast JSON serialization helpers."""
+
+import json
+from typing import Any, Union
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON-compatible representation
+
+    Raises:
+        TypeError: If the object cannot be serialized
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize object to compact JSON bytes.
+
+    Uses orjson when installed (UUID, datetime and dataclasses are handled
+    natively) and falls back to the stdlib encoder otherwise.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+    return json.dumps(
+        jsonable_encoder(obj),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or text.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,23 @@
+"""Text helpers."""
+
+from typing import Optional
+
+from backend.src.config import settings
+
+
+def message_preview(content: Optional[str], limit: Optional[int] = None) -> Optional[str]:
+    """Shorten message content for list and dashboard previews.
+
+    Args:
+        content: Message content, or None
+        limit: Maximum characters (defaults to MESSAGE_PREVIEW_CHARS)
+
+    Returns:
+        Content, cut to ``limit`` characters with an ellipsis if longer
+    """
+    if content is None:
+        return None
+    limit = limit or settings.MESSAGE_PREVIEW_CHARS
+    if len(content) <= limit:
+        return content
+    return content[:limit - 1].rstrip() + "…"
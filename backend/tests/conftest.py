@@ -1,12 +1,21 @@
 """Pytest configuration and fixtures."""
 
+import os
 import uuid
 import pytest
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+# Write audit events inline so tests can assert on them immediately
+os.environ.setdefault("AUDIT_LOG_ASYNC", "false")
+# Fail on accidental lazy relationship loads
+os.environ.setdefault("STRICT_LOADING", "true")
+# Tests that exercise caching configure a cache explicitly
+os.environ.setdefault("CACHE_BACKEND", "none")
+
 from backend.src.models import Base
+from backend.src.utils.loading import enable_strict_loading
 
 
 # Use in-memory SQLite for testing
@@ -30,6 +39,7 @@ def set_sqlite_pragma(dbapi_conn, connection_record):
 
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+enable_strict_loading(TestingSessionLocal)
 
 try:
     # Try to create all tables - this may fail with UUID on SQLite
@@ -60,6 +70,30 @@ def db():
         session.close()
 
 
+@pytest.fixture
+def query_counter():
+    """Record SQL statements executed on the test engine."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def cache():
+    """Enable an in-process cache for the test; caching is off otherwise."""
+    from backend.src.cache import Cache, MemoryBackend, configure_cache
+
+    cache = Cache(MemoryBackend())
+    configure_cache(cache)
+    yield cache
+    configure_cache(None)
+
+
 @pytest.fixture
 def sample_uuid():
     """Provide a sample UUID."""
@@ -0,0 +1,46 @@
+"""In-memory stand-ins for external services used in tests."""
+
+import time
+
+
+class FakeRedis:
+    """Subset of ``redis.Redis`` used by ``RedisBackend``.
+
+    Set ``down = True`` to make every command fail like a lost connection.
+    """
+
+    def __init__(self):
+        self.store = {}
+        self.down = False
+
+    def _check(self):
+        if self.down:
+            raise ConnectionError("Connection refused")
+
+    def _live(self, key):
+        entry = self.store.get(key)
+        if entry is not None and entry[0] is not None and entry[0] <= time.monotonic():
+            del self.store[key]
+            return None
+        return entry
+
+    def get(self, key):
+        self._check()
+        entry = self._live(key)
+        return None if entry is None else entry[1]
+
+    def mget(self, keys):
+        self._check()
+        return [self.get(key) for key in keys]
+
+    def set(self, key, value, ex=None, px=None, nx=False):
+        self._check()
+        if nx and self._live(key) is not None:
+            return None
+        ttl = ex if ex is not None else (px / 1000 if px is not None else None)
+        self.store[key] = (None if ttl is None else time.monotonic() + ttl, value)
+        return True
+
+    def delete(self, *keys):
+        self._check()
+        return sum(self.store.pop(key, None) is not None for key in keys)
@@ -133,6 +133,105 @@ class TestProfileEndpointsSmokeTest:
         assert response.status_code != 404
 
 
+class TestFastJSONResponse:
+    """Test the orjson-backed response class."""
+
+    def test_renders_uuid_and_datetime(self):
+        """Test rows with UUID and datetime values render like Pydantic."""
+        import json
+        from datetime import datetime
+        from uuid import uuid4
+        from backend.src.api.responses import FastJSONResponse
+
+        row_id = uuid4()
+        created = datetime(2025, 1, 2, 3, 4, 5, 678000)
+        response = FastJSONResponse({"id": row_id, "created_at": created})
+
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {
+            "id": str(row_id),
+            "created_at": "2025-01-02T03:04:05.678000",
+        }
+
+
+class TestConditionalGet:
+    """Test ETag / If-None-Match handling."""
+
+    @pytest.fixture
+    def profile_user(self):
+        """Authenticate requests as an in-memory user."""
+        from datetime import datetime
+        from backend.src.dependencies import get_current_user
+        from backend.src.models import User
+
+        user = User(
+            id="0b4a1d1e-0000-4000-8000-000000000001",
+            username="etaguser",
+            email="etag@example.com",
+            password_hash="x",
+            status="ACTIVE",
+            created_at=datetime(2025, 1, 1),
+            updated_at=datetime(2025, 1, 2),
+        )
+        app.dependency_overrides[get_current_user] = lambda: user
+        yield user
+        app.dependency_overrides.pop(get_current_user, None)
+
+    def test_make_etag_is_weak_and_stable(self):
+        """Test ETags are weak and depend only on their parts."""
+        from backend.src.api.etag import make_etag
+
+        etag = make_etag("id", "2025-01-01", 3)
+        assert etag.startswith('W/"')
+        assert etag == make_etag("id", "2025-01-01", 3)
+        assert etag != make_etag("id", "2025-01-01", 4)
+
+    def test_profile_returns_etag_and_304(self, profile_user):
+        """Test a matching If-None-Match yields 304 with no body."""
+        first = client.get("/api/profile")
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        second = client.get("/api/profile", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+    def test_profile_etag_changes_with_updated_at(self, profile_user):
+        """Test a stale ETag gets the full representation."""
+        from datetime import datetime
+
+        etag = client.get("/api/profile").headers["etag"]
+        profile_user.updated_at = datetime(2025, 1, 3)
+
+        response = client.get("/api/profile", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+
+class TestSessionWebSocket:
+    """Test WebSocket session commands."""
+
+    @pytest.mark.parametrize("after_seq", ["abc", -1, True, [1]])
+    def test_sync_rejects_invalid_after_seq(self, after_seq):
+        """Test a bad after_seq gets an error frame and keeps the socket open."""
+        import uuid
+        from backend.src.auth.jwt_handler import JWTHandler
+
+        token = JWTHandler.create_access_token(uuid.uuid4())
+        path = f"/ws/sessions/{uuid.uuid4()}?token={token}"
+        with client.websocket_connect(path) as websocket:
+            assert websocket.receive_json()["type"] == "user_joined"
+
+            websocket.send_json({"type": "sync", "after_seq": after_seq})
+            assert websocket.receive_json() == {
+                "type": "error", "message": "after_seq must be a non-negative integer"
+            }
+
+            websocket.send_json({"type": "typing", "is_typing": True})
+            assert websocket.receive_json()["type"] == "typing"
+
+
 class TestOpenAPIDocs:
     """Test that OpenAPI documentation is available."""
 
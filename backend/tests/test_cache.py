@@ -0,0 +1,124 @@
+"""Tests for the caching layer."""
+
+import threading
+import time
+
+from backend.src.cache import Cache, MemoryBackend, RedisBackend, cached, configure_cache, invalidate
+from backend.tests.fakes import FakeRedis
+
+
+class TestMemoryBackend:
+    """Tests for the in-process LRU backend."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry goes first when full."""
+        backend = MemoryBackend(max_entries=2)
+        backend.set("a", b"1", 60)
+        backend.set("b", b"2", 60)
+        backend.get("a")
+        backend.set("c", b"3", 60)
+
+        assert backend.get_many(["a", "b", "c"]) == {"a": b"1", "c": b"3"}
+
+    def test_entries_expire(self):
+        """Test entries are gone after their TTL."""
+        backend = MemoryBackend()
+        backend.set("a", b"1", 0.01)
+        time.sleep(0.02)
+
+        assert backend.get("a") is None
+        assert backend.add("a", b"2", 60) is True
+        assert backend.add("a", b"3", 60) is False
+
+
+class TestCache:
+    """Tests for Cache over memory and Redis backends."""
+
+    def test_get_or_set_loads_once_under_concurrency(self):
+        """Test concurrent misses for one key run the loader once."""
+        cache = Cache(MemoryBackend())
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return {"value": 42}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_set("ns", "k", loader)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"value": 42}] * 8
+
+    def test_redis_backend_round_trip(self):
+        """Test values are namespaced and read back in one MGET."""
+        client = FakeRedis()
+        cache = Cache(RedisBackend(client), prefix="app")
+        cache.set("users", 1, {"name": "ada"})
+        cache.set("users", 2, [1, 2])
+
+        assert "app:users:1" in client.store
+        assert cache.get_many("users", [1, 2, 3]) == {1: {"name": "ada"}, 2: [1, 2]}
+        cache.delete("users", 1)
+        assert cache.get("users", 1) is None
+
+    def test_backend_outage_fails_open(self):
+        """Test a Redis outage degrades to uncached loads instead of errors."""
+        client = FakeRedis()
+        cache = Cache(RedisBackend(client), retry_after=60)
+        client.down = True
+
+        assert cache.get_or_set("ns", "k", lambda: "fresh") == "fresh"
+
+        client.down = False
+        # Still bypassed until retry_after passes
+        assert cache.get("ns", "k") is None
+        assert client.store == {}
+
+
+class Counter:
+    """Service-like class using the decorator."""
+
+    def __init__(self):
+        self.calls = 0
+
+    @cached("counts", scope="owner_id")
+    def count(self, owner_id, status=None):
+        self.calls += 1
+        return self.calls
+
+
+class TestCachedDecorator:
+    """Tests for the cached decorator and scoped invalidation."""
+
+    def test_results_cached_per_arguments_until_invalidated(self):
+        """Test calls share entries by bound arguments and scopes drop together."""
+        configure_cache(Cache(MemoryBackend()))
+        try:
+            counter = Counter()
+            assert counter.count("u1") == 1
+            assert counter.count(owner_id="u1", status=None) == 1
+            assert counter.count("u1", status="open") == 2
+            assert counter.count("u2") == 3
+
+            invalidate("counts", "u1")
+
+            assert counter.count("u1") == 4
+            assert counter.count("u1", status="open") == 5
+            assert counter.count("u2") == 3
+        finally:
+            configure_cache(None)
+
+    def test_disabled_cache_calls_through(self):
+        """Test the decorator is a no-op without a cache."""
+        configure_cache(None)
+        counter = Counter()
+
+        assert [counter.count("u1"), counter.count("u1")] == [1, 2]
@@ -0,0 +1,136 @@
+"""Tests for compressed message content."""
+
+import pytest
+from sqlalchemy import text
+
+from backend.src.models import Message
+from backend.src.models.compressed import (
+    ZLIB, ZlibCodec, compress_text, decompress_text
+)
+from backend.src.repositories import MessageRepository, MessageSearchRepository
+
+LONG_REPLY = " ".join(
+    f"Step {i}: memoization caches the result of each recursive call." for i in range(60)
+)
+
+
+class TestCompressText:
+    """Tests for the codec helpers."""
+
+    def test_small_values_stay_text(self):
+        """Test values under the threshold are stored unchanged."""
+        assert compress_text("short", min_bytes=1024) == "short"
+
+    def test_round_trip(self):
+        """Test large values shrink and decode back to the original."""
+        packed = compress_text(LONG_REPLY, min_bytes=1024, codec=ZlibCodec())
+
+        assert isinstance(packed, bytes)
+        assert packed[0] == ZLIB
+        assert len(packed) < len(LONG_REPLY) / 4
+        assert decompress_text(packed) == LONG_REPLY
+
+    def test_unknown_codec_raises(self):
+        """Test bytes written by an unavailable codec are not misread."""
+        with pytest.raises(ValueError, match="codec"):
+            decompress_text(b"\x7fdata")
+
+
+class TestCompressedColumn:
+    """Tests for Message.content on SQLite."""
+
+    def test_long_content_stored_compressed(self, db, test_user, test_session):
+        """Test long bodies are compressed at rest and decoded on load."""
+        repo = MessageRepository(db)
+        message = repo.create({
+            "session_id": test_session.id, "user_id": test_user.id,
+            "role": "assistant", "content": LONG_REPLY, "message_type": "text",
+        })
+        short = repo.create({
+            "session_id": test_session.id, "user_id": test_user.id,
+            "role": "user", "content": "Explain memoization", "message_type": "text",
+        })
+        db.commit()
+        message_id, short_id = message.id, short.id
+        db.expunge_all()
+
+        stored = dict(db.execute(text("SELECT seq, typeof(content) FROM messages")).all())
+        assert sorted(stored.values()) == ["blob", "text"]
+        assert db.get(Message, message_id).content == LONG_REPLY
+        assert db.get(Message, short_id).content == "Explain memoization"
+
+    def test_search_reads_compressed_content(self, db, test_user, test_session):
+        """Test full-text search indexes and highlights decompressed text."""
+        MessageRepository(db).create({
+            "session_id": test_session.id, "user_id": test_user.id,
+            "role": "assistant", "content": LONG_REPLY + " Fibonacci.",
+            "message_type": "text",
+        })
+        db.commit()
+
+        hits, total = MessageSearchRepository(db).search(test_user.id, "fibonacci")
+
+        assert total == 1
+        assert "<mark>Fibonacci</mark>" in hits[0]["snippet"]
+
+    def test_bulk_inserted_compressed_content_is_searchable(self, db, test_user, test_session):
+        """Test executemany inserts index compressed rows, deletes unindex them."""
+        repo = MessageRepository(db)
+        repo.create_many([
+            {"session_id": test_session.id, "user_id": test_user.id, "role": "assistant",
+             "content": LONG_REPLY + " Fibonacci.", "message_type": "text"},
+            {"session_id": test_session.id, "user_id": test_user.id, "role": "user",
+             "content": "Fibonacci again?", "message_type": "text"},
+        ])
+        db.commit()
+        search = MessageSearchRepository(db)
+
+        assert search.search(test_user.id, "fibonacci")[1] == 2
+
+        db.execute(text("DELETE FROM messages WHERE typeof(content) = 'blob'"))
+        assert search.search(test_user.id, "fibonacci")[1] == 1
+        assert search.search(test_user.id, "memoization")[1] == 0
+
+    def test_updated_compressed_content_is_reindexed(self, db, test_user, test_session):
+        """Test core UPDATEs replace the index entry of compressed rows."""
+        repo = MessageRepository(db)
+        message = repo.create({
+            "session_id": test_session.id, "user_id": test_user.id,
+            "role": "assistant", "content": LONG_REPLY, "message_type": "text",
+        })
+        db.commit()
+        search = MessageSearchRepository(db)
+
+        repo.update(message.id, {"content": "zebra " * 400})
+        db.commit()
+
+        assert search.search(test_user.id, "zebra")[1] == 1
+        assert search.search(test_user.id, "memoization")[1] == 0
+
+        repo.update_many([message.id], {"content": LONG_REPLY})
+        db.commit()
+
+        assert search.search(test_user.id, "memoization")[1] == 1
+        assert search.search(test_user.id, "zebra")[1] == 0
+
+    def test_triggers_need_no_application_functions(self, db):
+        """Test other writers can insert messages without text_content()."""
+        triggers = db.execute(text(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'messages'"
+        )).scalars().all()
+
+        assert triggers
+        assert not any("text_content" in sql for sql in triggers)
+
+    def test_rebuild_reindexes_compressed_content(self, db, test_user, test_session):
+        """Test a rebuild restores compressed rows to the index."""
+        MessageRepository(db).create({
+            "session_id": test_session.id, "user_id": test_user.id,
+            "role": "assistant", "content": LONG_REPLY, "message_type": "text",
+        })
+        db.commit()
+        search = MessageSearchRepository(db)
+
+        search.rebuild_index()
+
+        assert search.search(test_user.id, "memoization")[1] == 1
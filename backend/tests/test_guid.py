@@ -0,0 +1,55 @@
+"""Tests for the GUID column type."""
+
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql, sqlite
+
+from backend.src.models import Project
+from backend.src.models.guid import GUID
+
+
+class TestGUIDType:
+    """Tests for GUID bind and result processing."""
+
+    def test_binds_uuid_and_strings_as_bytes_on_sqlite(self):
+        """Test SQLite receives the raw 16 bytes whatever form the ID is in."""
+        value = uuid.uuid4()
+        guid, dialect = GUID(), sqlite.dialect()
+
+        for bound in (value, str(value), value.hex):
+            assert guid.process_bind_param(bound, dialect) == value.bytes
+        assert guid.process_result_value(value.bytes, dialect) == value
+        assert guid.process_bind_param(None, dialect) is None
+
+    def test_binds_native_uuid_on_postgresql(self):
+        """Test PostgreSQL receives uuid.UUID values for its native type."""
+        value = uuid.uuid4()
+        assert GUID().process_bind_param(str(value), postgresql.dialect()) == value
+
+    def test_rejects_malformed_ids(self):
+        """Test values that are not UUIDs fail before reaching the database."""
+        with pytest.raises(ValueError):
+            GUID.coerce("not-a-uuid")
+
+
+class TestGUIDColumns:
+    """Tests for GUID-keyed models on SQLite."""
+
+    def test_ids_stored_as_16_bytes(self, db, test_project):
+        """Test keys are stored compactly and load back as UUIDs."""
+        stored = db.execute(text(
+            "SELECT typeof(id), length(id), length(owner_id) FROM projects"
+        )).one()
+
+        assert tuple(stored) == ("blob", 16, 16)
+        assert isinstance(test_project.id, uuid.UUID)
+
+    def test_lookup_by_string_id(self, db, test_project):
+        """Test string IDs (path params, cursors, JSON) match stored UUIDs."""
+        project_id = test_project.id
+        db.expunge_all()
+
+        found = db.query(Project).filter(Project.id == str(project_id)).one()
+        assert found.id == project_id
@@ -0,0 +1,38 @@
+"""Tests for UUIDv7 generation."""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.src.utils.ids import uuid7, uuid7_time
+
+
+class TestUUID7:
+    """Tests for time-ordered IDs."""
+
+    def test_version_and_variant(self):
+        """Test IDs are RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_ids_increase_within_a_millisecond(self):
+        """Test a burst of IDs sorts in generation order."""
+        ids = [uuid7() for _ in range(10000)]
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_embeds_timestamp(self):
+        """Test the creation time can be read back from the ID."""
+        at = datetime(2026, 10, 19, 12, 30, 15, 123000)
+        assert uuid7_time(uuid7(at)) == at
+        assert uuid7(at) < uuid7(at + timedelta(milliseconds=1))
+
+        before = datetime.utcnow() - timedelta(seconds=1)
+        assert before < uuid7_time(uuid7()) < before + timedelta(seconds=2)
+
+    def test_uuid7_time_rejects_other_versions(self):
+        """Test random UUIDs carry no timestamp."""
+        with pytest.raises(ValueError):
+            uuid7_time(uuid.uuid4())
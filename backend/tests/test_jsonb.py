@@ -0,0 +1,34 @@
+"""Tests for JSON filter compilation."""
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from backend.src.models import Message, Project
+from backend.src.models.jsonb import json_contains, json_has_key
+
+
+def compile_sql(statement, dialect) -> str:
+    """Render a statement for a dialect."""
+    return str(statement.compile(dialect=dialect))
+
+
+class TestJSONFilters:
+    """Tests for dialect-specific JSON filters."""
+
+    def test_postgresql_uses_gin_operators(self):
+        """Test PostgreSQL filters use the operators GIN indexes serve."""
+        contains = select(Project.id).where(json_contains(Project.technology_stack, "Python"))
+        has_key = select(Message.id).where(json_has_key(Message.meta, "code_language"))
+
+        assert "projects.technology_stack @> jsonb_build_array(" in compile_sql(
+            contains, postgresql.dialect()
+        )
+        assert "messages.meta ? " in compile_sql(has_key, postgresql.dialect())
+
+    def test_sqlite_uses_json1(self):
+        """Test SQLite filters fall back to JSON1 functions."""
+        contains = select(Project.id).where(json_contains(Project.technology_stack, "Python"))
+        has_key = select(Message.id).where(json_has_key(Message.meta, "code_language"))
+
+        assert "json_each(projects.technology_stack)" in compile_sql(contains, sqlite.dialect())
+        assert "json_type(messages.meta" in compile_sql(has_key, sqlite.dialect())
@@ -0,0 +1,131 @@
+"""Tests for HTTP middleware."""
+
+import asyncio
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.src.middleware.compression import (
+    CompressionMetrics,
+    CompressionMiddleware,
+    _parse_accept_encoding,
+)
+
+LARGE_PAYLOAD = {"messages": [{"content": "What do you already know? " * 20}] * 50}
+
+
+@pytest.fixture
+def metrics():
+    """Provide isolated compression metrics."""
+    return CompressionMetrics()
+
+
+@pytest.fixture
+def app(metrics):
+    """Create a small app wrapped in the compression middleware."""
+    app = FastAPI()
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=500,
+        content_types=["application/json", "text/event-stream"],
+        metrics=metrics,
+    )
+
+    @app.get("/large")
+    async def large():
+        return JSONResponse(LARGE_PAYLOAD)
+
+    @app.get("/small")
+    async def small():
+        return JSONResponse({"ok": True})
+
+    @app.get("/text")
+    async def text():
+        return PlainTextResponse("x" * 5000)
+
+    return app
+
+
+class TestCompressionMiddleware:
+    """Tests for CompressionMiddleware."""
+
+    def test_compresses_large_json(self, app, metrics):
+        """Test large allowlisted bodies are gzip-compressed."""
+        client = TestClient(app)
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json() == LARGE_PAYLOAD
+
+        stats = metrics.snapshot()["gzip"]
+        assert stats["responses"] == 1
+        assert stats["bytes_saved"] > 0
+        assert stats["bytes_out"] == int(response.headers["content-length"])
+
+    def test_skips_small_body(self, app, metrics):
+        """Test bodies under the threshold are sent as-is."""
+        client = TestClient(app)
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert metrics.snapshot() == {}
+
+    def test_skips_content_type_not_allowlisted(self, app):
+        """Test non-allowlisted content types are not compressed."""
+        client = TestClient(app)
+        response = client.get("/text", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_skips_without_accept_encoding(self, app):
+        """Test clients that do not accept compression get plain bodies."""
+        client = TestClient(app)
+        response = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_event_stream_chunks_are_flushed(self, metrics):
+        """Test each SSE chunk is decodable as soon as it arrives."""
+        events = [f"data: event {i}\n\n".encode() for i in range(3)]
+
+        async def stream():
+            for event in events:
+                yield event
+
+        inner = StreamingResponse(stream(), media_type="text/event-stream")
+        middleware = CompressionMiddleware(
+            inner, content_types=["text/event-stream"], metrics=metrics
+        )
+        sent = []
+
+        async def receive():
+            # Block like a connected client until the response completes
+            await asyncio.Event().wait()
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/events",
+            "headers": [(b"accept-encoding", b"gzip")],
+        }
+        asyncio.run(middleware(scope, receive, send))
+
+        start = sent[0]
+        assert (b"content-encoding", b"gzip") in start["headers"]
+        assert all(name != b"content-length" for name, _ in start["headers"])
+
+        decoder = zlib.decompressobj(31)
+        bodies = [m["body"] for m in sent[1:] if m.get("body")]
+        for event, body in zip(events, bodies):
+            assert decoder.decompress(body) == event
+
+    def test_parse_accept_encoding(self):
+        """Test q-values are honoured."""
+        assert _parse_accept_encoding("gzip;q=0, br") == {"gzip": 0.0, "br": 1.0}
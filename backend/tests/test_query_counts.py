@@ -0,0 +1,236 @@
+"""Query-count tests for API endpoints.
+
+Each endpoint runs against the test database. Authentication is replaced
+by a plain user lookup, which costs the same single SELECT as the real
+dependency, so counts include it. Counts must not grow with the number of
+rows returned, and strict loading (enabled in conftest) turns any lazy
+relationship load into an error.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.src.database import get_db
+from backend.src.dependencies import get_current_user
+from backend.src.main import app
+from backend.src.repositories import (
+    MessageRepository, ProjectRepository, SessionRepository, UserRepository
+)
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def api(db, test_user):
+    """Route requests through the test session as ``test_user``."""
+    user_id = test_user.id
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: UserRepository(db).get_by_id(user_id)
+    yield client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def history(db, test_user):
+    """Give the user projects, sessions and messages."""
+    def create(count):
+        projects = ProjectRepository(db).create_many([
+            {"owner_id": test_user.id, "name": f"Project {i}", "status": "PLANNING"}
+            for i in range(count)
+        ])
+        sessions = SessionRepository(db).create_many([
+            {"owner_id": test_user.id, "project_id": project_id, "name": "Session",
+             "status": "ACTIVE", "mode": "chat"}
+            for project_id in projects
+        ])
+        MessageRepository(db).create_many([
+            {"session_id": session_id, "user_id": test_user.id, "role": "user",
+             "content": "recursion and memoization", "message_type": "text"}
+            for session_id in sessions
+        ])
+        db.commit()
+    return create
+
+
+def count_queries(query_counter, request):
+    """Run a request and return (response, number of SELECTs)."""
+    query_counter.clear()
+    response = request()
+    selects = [s for s in query_counter if s.lstrip().upper().startswith(("SELECT", "WITH"))]
+    return response, len(selects)
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("/api/projects", 3),
+    ("/api/sessions", 3),
+    ("/api/search?q=recursion", 3),
+    ("/api/sessions?include_last_message=true", 3),
+    ("/api/dashboard", 3),
+])
+def test_list_endpoints_do_not_grow_with_rows(api, history, query_counter, path, expected):
+    """Test list endpoints issue a fixed number of SELECTs."""
+    history(1)
+    response, few = count_queries(query_counter, lambda: api.get(path))
+    assert response.status_code == 200
+
+    history(5)
+    response, many = count_queries(query_counter, lambda: api.get(path))
+    assert response.status_code == 200
+
+    assert few == many == expected
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("/api/projects/{project_id}", 3),
+    ("/api/sessions/{session_id}", 3),
+    # Empty ACTIVE sessions skip the message_archives lookup
+    ("/api/sessions/{session_id}/messages", 4),
+])
+def test_detail_endpoints_bind_uuid_path_ids(api, test_session, query_counter, path, expected):
+    """Test UUID path parameters match GUID keys."""
+    path = path.format(project_id=test_session.project_id, session_id=test_session.id)
+    response, selects = count_queries(query_counter, lambda: api.get(path))
+
+    assert response.status_code == 200
+    assert selects == expected
+
+
+def test_session_list_includes_last_message(api, db, test_session):
+    """Test the session list can carry each session's count and last message."""
+    MessageRepository(db).create_many([
+        {"session_id": test_session.id, "user_id": test_session.owner_id, "role": role,
+         "content": content, "message_type": "text", "seq": seq}
+        for seq, (role, content) in enumerate([("user", "What is a fold?"), ("assistant", "x" * 500)], 1)
+    ])
+    db.commit()
+
+    sessions = api.get("/api/sessions?include_last_message=true").json()["sessions"]
+
+    assert len(sessions) == 1
+    assert sessions[0]["message_count"] == 2
+    assert sessions[0]["last_message_role"] == "assistant"
+    assert sessions[0]["last_message_preview"].endswith("…")
+    assert len(sessions[0]["last_message_preview"]) == 160
+    assert sessions[0]["last_message_at"] is not None
+
+
+def test_dashboard_totals_cached_until_write(api, history, cache, query_counter):
+    """Test the dashboard aggregates rows and is served from the cache until a write."""
+    history(3)
+
+    data = api.get("/api/dashboard").json()
+    assert data["projects"] == {"total": 3, "by_status": {"PLANNING": 3}}
+    assert data["sessions"]["active"] == 3
+    assert data["messages"]["total"] == 3
+    assert len(data["recent_sessions"]) == 3
+    assert data["recent_sessions"][0]["last_message_preview"] == "recursion and memoization"
+
+    response, selects = count_queries(query_counter, lambda: api.get("/api/dashboard"))
+    assert response.status_code == 200
+    assert selects == 1
+
+    api.post("/api/projects", json={"name": "Another"})
+    assert api.get("/api/dashboard").json()["projects"]["total"] == 4
+
+
+def test_profile_uses_authenticated_user(api, query_counter):
+    """Test the profile is served from the user loaded by authentication."""
+    response, selects = count_queries(query_counter, lambda: api.get("/api/profile"))
+
+    assert response.status_code == 200
+    assert selects == 1
+
+
+def test_settings_fetched_once(api, query_counter):
+    """Test settings cost one fetch, which also yields the ETag."""
+    response, selects = count_queries(query_counter, lambda: api.get("/api/settings"))
+
+    assert response.status_code == 200
+    assert selects == 2
+
+
+def test_settings_served_from_cache(api, db, test_user, cache, query_counter):
+    """Test cached settings and their ETag need no query beyond authentication."""
+    api.get("/api/settings")
+
+    response, selects = count_queries(query_counter, lambda: api.get("/api/settings"))
+    assert response.status_code == 200
+    assert selects == 1
+
+    etag = response.headers["etag"]
+    response = api.put("/api/settings", json={"theme": "light"})
+    assert response.status_code == 200
+
+    response = api.get("/api/settings", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["data"]["theme"] == "light"
+
+
+def test_settings_update_refreshes_cache(api, cache, query_counter):
+    """Test an update's response re-caches the settings for the next read."""
+    response = api.put("/api/settings", json={"llm_max_tokens": 1234})
+    assert response.status_code == 200
+    assert response.json()["data"]["llm_max_tokens"] == 1234
+
+    response, selects = count_queries(query_counter, lambda: api.get("/api/settings"))
+    assert response.json()["data"]["llm_max_tokens"] == 1234
+    assert selects == 1
+
+
+def test_lazy_relationship_load_raises(db, test_session):
+    """Test strict loading rejects relationships that were not loaded explicitly."""
+    from sqlalchemy.exc import InvalidRequestError
+    from sqlalchemy.orm import selectinload
+    from backend.src.models import Session
+
+    session_id = test_session.id
+    db.expunge_all()
+    session = db.query(Session).filter_by(id=session_id).one()
+    with pytest.raises(InvalidRequestError):
+        session.messages
+
+    db.expunge_all()
+    session = db.query(Session).options(
+        selectinload(Session.messages)
+    ).filter_by(id=session_id).one()
+    assert session.messages == []
+
+
+def test_context_window_loads_only_needed_columns(db, test_user, test_session, query_counter):
+    """Test the LLM context query returns the latest messages in order, in one SELECT."""
+    session_id = test_session.id
+    repo = MessageRepository(db)
+    repo.create_many([
+        {"session_id": session_id, "user_id": test_user.id, "role": "user",
+         "content": f"Message {i}", "message_type": "text"}
+        for i in range(12)
+    ])
+    db.commit()
+    db.expunge_all()
+
+    query_counter.clear()
+    window = repo.get_context_window(session_id, limit=10)
+
+    assert [m.content for m in window] == [f"Message {i}" for i in range(2, 12)]
+    assert [m.role for m in window] == ["user"] * 10
+    assert len(query_counter) == 1
+
+
+def test_transcript_is_one_read_once_cached(api, db, test_user, test_session, query_counter):
+    """Test whole-history loads read the stored transcript instead of message rows."""
+    MessageRepository(db).create_many([
+        {"session_id": test_session.id, "user_id": test_user.id, "role": "user",
+         "content": f"Message {i}", "message_type": "text"}
+        for i in range(20)
+    ])
+    db.commit()
+    path = f"/api/sessions/{test_session.id}/transcript"
+
+    response, _ = count_queries(query_counter, lambda: api.get(path))
+    assert response.status_code == 200
+    assert response.json()["total"] == 20
+
+    response, selects = count_queries(query_counter, lambda: api.get(path))
+    assert response.json()["messages"][-1]["content"] == "Message 19"
+    # User, session, transcript
+    assert selects == 3
@@ -1,8 +1,10 @@
 """Tests for repository layer."""
 
 import uuid
+from datetime import datetime, timedelta
 import pytest
 from passlib.context import CryptContext
+from sqlalchemy import text
 
 from backend.src.repositories import (
     UserRepository,
@@ -12,6 +14,7 @@ from backend.src.repositories import (
     PreferenceRepository,
     DocumentRepository,
     AuditLogRepository,
+    MessageSearchRepository,
 )
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -198,6 +201,41 @@ class TestProjectRepository:
         projects = repo.get_by_status("PLANNING")
         assert len(projects) == 1
 
+    def test_list_by_owner_projects_schema_columns(self, db, user, query_counter):
+        """Test list queries select only the columns the response schema needs."""
+        from backend.src.schemas.session import SessionResponse
+        from backend.src.utils.projection import schema_columns
+        from backend.src.models import Project, Session
+
+        columns = schema_columns(Session, SessionResponse)
+        assert "message_count" in [c.key for c in columns]  # Maintained counter column
+        assert "message_seq" not in [c.key for c in columns]
+
+        repo = ProjectRepository(db)
+        repo.create({"owner_id": user.id, "name": "Project 1", "description": "x" * 500})
+        db.commit()
+
+        query_counter.clear()
+        rows = repo.list_by_owner(user.id, columns=(Project.id, Project.name))
+
+        assert rows[0]._fields == ("id", "name")
+        assert rows[0].name == "Project 1"
+        assert "description" not in query_counter[0]
+
+    def test_filter_by_technology(self, db, user):
+        """Test technology filters match whole entries of the JSON stack."""
+        repo = ProjectRepository(db)
+        repo.create_many([
+            {"owner_id": user.id, "name": "API", "technology_stack": ["Python", "FastAPI"]},
+            {"owner_id": user.id, "name": "Web", "technology_stack": ["TypeScript"]},
+            {"owner_id": user.id, "name": "Empty", "technology_stack": []},
+        ])
+        db.commit()
+
+        assert [p.name for p in repo.get_by_technology(user.id, "Python")] == ["API"]
+        assert repo.get_by_technology(user.id, "Pyth") == []
+        assert [p.name for p in repo.list_by_owner(user.id, technology="TypeScript")] == ["Web"]
+
 
 class TestSessionRepository:
     """Tests for SessionRepository."""
@@ -379,6 +417,21 @@ class TestMessageRepository:
         assert len(assistant_messages) == 1
         assert assistant_messages[0].role == "assistant"
 
+    def test_get_by_meta_key(self, db, user_project_session):
+        """Test filtering messages by a top-level metadata key."""
+        user, project, session = user_project_session
+        repo = MessageRepository(db)
+        repo.create_many([
+            {"session_id": session.id, "user_id": user.id, "role": "user",
+             "content": f"Message {i}", "message_type": "text", "meta": meta}
+            for i, meta in enumerate([{"code_language": "python"}, {}, {"code_language": None}])
+        ])
+        db.commit()
+
+        found = repo.get_by_meta_key(session.id, "code_language")
+        assert [m.content for m in found] == ["Message 0", "Message 2"]
+        assert repo.get_by_meta_key(session.id, "missing") == []
+
     def test_get_session_count(self, db, user_project_session):
         """Test getting message count."""
         user, project, session = user_project_session
@@ -402,6 +455,175 @@ class TestMessageRepository:
         count = repo.get_by_session_count(session.id)
         assert count == 2
 
+    def test_create_assigns_session_seq(self, db, user_project_session):
+        """Test messages get consecutive per-session sequence numbers."""
+        user, project, session = user_project_session
+        repo = MessageRepository(db)
+        messages = [
+            repo.create({
+                "session_id": session.id,
+                "user_id": user.id,
+                "role": "user",
+                "content": f"Message {i}",
+                "message_type": "text",
+            })
+            for i in range(3)
+        ]
+        db.commit()
+
+        assert [m.seq for m in messages] == [1, 2, 3]
+        assert repo.allocate_seq(session.id, count=2) == 4
+        assert repo.allocate_seq(session.id) == 6
+
+    def test_get_after_seq(self, db, user_project_session):
+        """Test only messages after the cursor are returned, in order."""
+        user, project, session = user_project_session
+        repo = MessageRepository(db)
+        for i in range(5):
+            repo.create({
+                "session_id": session.id,
+                "user_id": user.id,
+                "role": "user",
+                "content": f"Message {i}",
+                "message_type": "text",
+            })
+        db.commit()
+
+        missed = repo.get_after_seq(session.id, after_seq=3, limit=10)
+        assert [m.content for m in missed] == ["Message 3", "Message 4"]
+        assert repo.get_after_seq(session.id, after_seq=5, limit=10) == []
+
+    def test_session_version_tracks_messages(self, db, user_project_session):
+        """Test session versions change when messages are added or deleted."""
+        user, project, session = user_project_session
+        session_repo = SessionRepository(db)
+        message_repo = MessageRepository(db)
+
+        before = session_repo.get_version(session.id)
+        assert before.owner_id == user.id
+        assert before.message_count == 0
+
+        message = message_repo.create({
+            "session_id": session.id,
+            "user_id": user.id,
+            "role": "user",
+            "content": "Message 1",
+            "message_type": "text",
+        })
+        db.commit()
+
+        added = session_repo.get_version(session.id)
+        assert added.message_count == 1
+        assert added.message_seq > before.message_seq
+
+        message_repo.record_deleted(session.id)
+        db.delete(message)
+        db.commit()
+
+        deleted = session_repo.get_version(session.id)
+        assert deleted.message_count == 0
+        assert deleted.message_seq > added.message_seq
+        assert session_repo.get_version(str(uuid.uuid4())) is None
+
+
+class TestBulkOperations:
+    """Tests for BaseRepository bulk methods."""
+
+    @pytest.fixture
+    def owner(self, db):
+        """Create a project owner."""
+        user = UserRepository(db).create({
+            "username": "bulkowner",
+            "email": "bulk@example.com",
+            "password_hash": pwd_context.hash("Test@1234"),
+        })
+        db.commit()
+        return user
+
+    def test_create_many_and_get_many(self, db, owner):
+        """Test bulk insert returns IDs in order and get_many maps them."""
+        repo = ProjectRepository(db)
+        ids = repo.create_many([
+            {"owner_id": owner.id, "name": f"Project {i}", "status": "PLANNING"}
+            for i in range(5)
+        ])
+        db.commit()
+
+        found = repo.get_many(ids + [uuid.uuid4()])
+        assert set(found) == set(ids)
+        assert [found[obj_id].name for obj_id in ids] == [f"Project {i}" for i in range(5)]
+
+    def test_update_many_syncs_loaded_objects(self, db, owner):
+        """Test set-based updates are visible on objects already loaded."""
+        repo = ProjectRepository(db)
+        ids = repo.create_many([
+            {"owner_id": owner.id, "name": f"Project {i}", "status": "PLANNING"}
+            for i in range(3)
+        ])
+        loaded = repo.get_by_id(ids[0])
+
+        assert repo.update_many(ids[:2], {"status": "ACTIVE"}) == 2
+        assert loaded.status == "ACTIVE"
+        assert repo.get_by_id(ids[2]).status == "PLANNING"
+
+    def test_delete_many(self, db, owner):
+        """Test set-based deletes report the rows removed."""
+        repo = ProjectRepository(db)
+        ids = repo.create_many([
+            {"owner_id": owner.id, "name": f"Project {i}", "status": "PLANNING"}
+            for i in range(3)
+        ])
+
+        assert repo.delete_many(ids[:2] + [uuid.uuid4()]) == 2
+        assert list(repo.get_many(ids)) == [ids[2]]
+
+    def test_partial_update_checks_conditions(self, db, owner):
+        """Test partial updates refresh loaded objects and honour conditions."""
+        repo = ProjectRepository(db)
+        project = repo.create({"owner_id": owner.id, "name": "Partial", "status": "PLANNING"})
+        db.commit()
+
+        assert repo.partial_update(project.id, {"status": "DESIGN"}, owner_id=uuid.uuid4()) is None
+        assert repo.get_by_id(project.id).status == "PLANNING"
+
+        updated = repo.partial_update(project.id, {"status": "DESIGN"}, owner_id=owner.id)
+        assert updated is project
+        assert project.status == "DESIGN"
+        assert repo.partial_update(uuid.uuid4(), {"status": "DESIGN"}) is None
+
+    def test_delete_all_returns_count(self, db, owner):
+        """Test delete_all removes matching rows in one statement."""
+        repo = ProjectRepository(db)
+        repo.create_many([
+            {"owner_id": owner.id, "name": f"Project {i}", "status": "PLANNING"}
+            for i in range(3)
+        ])
+        loaded = repo.get_all()[0]
+
+        assert repo.delete_all(owner_id=owner.id) == 3
+        assert repo.count() == 0
+        assert loaded not in db
+
+    def test_message_create_many_allocates_seq(self, db, owner):
+        """Test bulk message inserts reserve seq numbers per session."""
+        session = SessionRepository(db).create({
+            "owner_id": owner.id, "name": "Bulk", "status": "ACTIVE", "mode": "chat"
+        })
+        repo = MessageRepository(db)
+        repo.create({
+            "session_id": session.id, "user_id": owner.id,
+            "role": "user", "content": "first", "message_type": "text",
+        })
+        ids = repo.create_many([
+            {"session_id": session.id, "user_id": owner.id,
+             "role": "user", "content": f"bulk {i}", "message_type": "text"}
+            for i in range(3)
+        ])
+        db.commit()
+
+        messages = repo.get_many(ids)
+        assert [messages[obj_id].seq for obj_id in ids] == [2, 3, 4]
+
 
 class TestPreferenceRepository:
     """Tests for PreferenceRepository."""
@@ -562,7 +784,8 @@ class TestAuditLogRepository:
         })
         db.commit()
 
-        logs = repo.get_by_user(user.id)
+        logs, next_cursor = repo.get_by_user(user.id)
+        assert next_cursor is None
         assert len(logs) == 2
 
     def test_get_by_action(self, db, user):
@@ -582,5 +805,239 @@ class TestAuditLogRepository:
         })
         db.commit()
 
-        creates = repo.get_by_action("CREATE")
+        creates, _ = repo.get_by_action("CREATE")
         assert len(creates) == 1
+
+    def test_get_user_paginated_recent_window(self, db, user):
+        """Test pagination only covers the recent window, newest first."""
+        from datetime import datetime, timedelta
+
+        repo = AuditLogRepository(db)
+        now = datetime.utcnow()
+        for days_ago in (1, 10, 200):
+            repo.create({
+                "user_id": user.id,
+                "entity_type": "User",
+                "action": "UPDATE",
+                "created_at": now - timedelta(days=days_ago),
+            })
+        db.commit()
+
+        logs, total = repo.get_user_paginated(user.id, skip=0, limit=10)
+        assert total == 2
+        assert logs[0].created_at > logs[1].created_at
+
+        _, total = repo.get_user_paginated(user.id, since=now - timedelta(days=365))
+        assert total == 3
+
+    def test_keyset_pages_cover_all_rows(self, db, user):
+        """Test cursors walk every row once, including timestamp ties."""
+        from datetime import datetime
+
+        repo = AuditLogRepository(db)
+        same_time = datetime(2026, 10, 1, 12, 0)
+        project_id = uuid.uuid4()
+        for i in range(5):
+            repo.create({
+                "user_id": user.id,
+                "entity_type": "Project",
+                "entity_id": project_id,
+                "action": "UPDATE",
+                "created_at": same_time if i < 3 else datetime(2026, 10, 2 + i),
+            })
+        db.commit()
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = repo.get_by_entity("Project", project_id, limit=2, cursor=cursor)
+            seen.extend(page)
+            if cursor is None:
+                break
+
+        assert len({log.id for log in seen}) == 5
+        assert [log.created_at for log in seen] == sorted(
+            (log.created_at for log in seen), reverse=True
+        )
+
+    def test_invalid_cursor(self, db, user):
+        """Test malformed cursors are rejected."""
+        repo = AuditLogRepository(db)
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            repo.get_by_user(user.id, cursor="not-a-cursor")
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            repo.get_recent(cursor="not-a-cursor")
+
+    def test_get_recent_orders_legacy_ids_by_time(self, db, user):
+        """Test logs with pre-UUIDv7 (uuid4) IDs page in write order."""
+        repo = AuditLogRepository(db)
+        start = datetime(2024, 1, 1)
+        for i in range(5):
+            log = {"user_id": user.id, "entity_type": "User", "action": f"A{i}",
+                   "created_at": start + timedelta(minutes=i)}
+            if i < 3:
+                log["id"] = uuid.uuid4()
+            repo.create(log)
+        db.commit()
+
+        actions, cursor = [], None
+        while True:
+            page, cursor = repo.get_recent(limit=2, cursor=cursor)
+            actions.extend(log.action for log in page)
+            if cursor is None:
+                break
+
+        assert actions == ["A4", "A3", "A2", "A1", "A0"]
+
+    def test_iter_by_action_streams(self, db, user):
+        """Test streaming yields every matching row."""
+        repo = AuditLogRepository(db)
+        for _ in range(5):
+            repo.create({"user_id": user.id, "action": "DELETE"})
+        db.commit()
+
+        assert sum(1 for _ in repo.iter_by_action("DELETE", batch_size=2)) == 5
+
+
+class TestMessageSearchRepository:
+    """Tests for MessageSearchRepository."""
+
+    @pytest.fixture
+    def indexed_messages(self, db):
+        """Create a user with two sessions of messages and a second user."""
+        user_repo = UserRepository(db)
+        user = user_repo.create({
+            "username": "searcher",
+            "email": "searcher@example.com",
+            "password_hash": pwd_context.hash("Test@1234"),
+        })
+        other = user_repo.create({
+            "username": "other",
+            "email": "other@example.com",
+            "password_hash": pwd_context.hash("Test@1234"),
+        })
+
+        session_repo = SessionRepository(db)
+        first = session_repo.create({"owner_id": user.id, "name": "First", "status": "ACTIVE", "mode": "chat"})
+        second = session_repo.create({"owner_id": user.id, "name": "Second", "status": "ACTIVE", "mode": "chat"})
+        foreign = session_repo.create({"owner_id": other.id, "name": "Other", "status": "ACTIVE", "mode": "chat"})
+        db.flush()
+
+        message_repo = MessageRepository(db)
+        for session, content in [
+            (first, "Recursion needs a base case to terminate"),
+            (first, "Recursion recursion everywhere: recursion is a function calling itself"),
+            (second, "What is a database index and when does recursion help?"),
+            (second, "Unrelated message about testing"),
+            (foreign, "Recursion belongs to someone else"),
+        ]:
+            message_repo.create({
+                "session_id": session.id,
+                "user_id": session.owner_id,
+                "role": "user",
+                "content": content,
+                "message_type": "text",
+            })
+        db.commit()
+        return user, first, second
+
+    def test_search_is_ranked_and_owner_scoped(self, db, indexed_messages):
+        """Test hits are limited to the owner's sessions and ranked."""
+        user, first, second = indexed_messages
+        repo = MessageSearchRepository(db)
+
+        hits, total = repo.search(user.id, "recursion")
+
+        assert total == 3
+        assert {hit["session_id"] for hit in hits} == {first.id, second.id}
+        assert hits[0]["rank"] >= hits[-1]["rank"]
+        assert "<mark>" in hits[0]["snippet"]
+
+    def test_search_snippet_escapes_message_markup(self, db, indexed_messages):
+        """Test markup in message text is escaped while matches stay highlighted."""
+        user, first, second = indexed_messages
+        MessageRepository(db).create({
+            "session_id": first.id,
+            "user_id": user.id,
+            "role": "user",
+            "content": '<img src=x onerror="alert(1)"> memoization & friends',
+            "message_type": "text",
+        })
+        db.commit()
+
+        hits, _ = MessageSearchRepository(db).search(user.id, "memoization")
+
+        snippet = hits[0]["snippet"]
+        assert "<img" not in snippet
+        assert "&lt;img" in snippet
+        assert "<mark>memoization</mark>" in snippet
+        assert "&amp;" in snippet
+
+    def test_search_stems_and_scopes_by_session(self, db, indexed_messages):
+        """Test stemmed matching and session filtering."""
+        user, first, second = indexed_messages
+        repo = MessageSearchRepository(db)
+
+        hits, total = repo.search(user.id, "terminating", session_id=first.id)
+
+        assert total == 1
+        assert hits[0]["seq"] == 1
+
+    def test_search_paginates(self, db, indexed_messages):
+        """Test skip/limit apply after ranking while total stays complete."""
+        user, _, _ = indexed_messages
+        repo = MessageSearchRepository(db)
+
+        hits, total = repo.search(user.id, "recursion", skip=2, limit=2)
+
+        assert total == 3
+        assert len(hits) == 1
+
+    def test_search_ignores_query_syntax(self, db, indexed_messages):
+        """Test FTS operators in user input are treated as plain terms."""
+        user, _, _ = indexed_messages
+        repo = MessageSearchRepository(db)
+
+        hits, total = repo.search(user.id, 'index" OR "NEAR(')
+
+        assert total == 0
+
+    def test_index_follows_updates_and_deletes(self, db, indexed_messages):
+        """Test triggers keep the index in sync and rebuild is safe."""
+        user, first, _ = indexed_messages
+        message_repo = MessageRepository(db)
+        repo = MessageSearchRepository(db)
+
+        message = message_repo.get_by_session(first.id)[0]
+        message_repo.update(message.id, {"content": "Memoization avoids repeated work"})
+        db.commit()
+
+        assert repo.search(user.id, "memoization")[1] == 1
+        assert repo.search(user.id, "recursion")[1] == 2
+
+        message_repo.delete(message.id)
+        db.commit()
+        repo.rebuild_index()
+
+        assert repo.search(user.id, "memoization")[1] == 0
+
+    def test_index_survives_renumbered_rowids(self, db, indexed_messages):
+        """Test hits and deletes follow message ids when VACUUM renumbers rowids."""
+        user, first, second = indexed_messages
+        repo = MessageSearchRepository(db)
+
+        # What VACUUM may do to a table without an INTEGER PRIMARY KEY
+        db.execute(text("UPDATE messages SET rowid = -rowid"))
+        db.execute(text("UPDATE messages SET rowid = 1 - rowid"))
+        db.commit()
+
+        hits, total = repo.search(user.id, "terminating")
+        assert total == 1
+        assert hits[0]["session_id"] == first.id
+        assert "<mark>terminate</mark>" in hits[0]["snippet"]
+
+        message_repo = MessageRepository(db)
+        message_repo.delete(hits[0]["message_id"])
+        db.commit()
+
+        assert repo.search(user.id, "terminating")[1] == 0
+        assert repo.search(user.id, "recursion")[1] == 2
@@ -0,0 +1,42 @@
+"""Tests for append-only segment files."""
+
+import pytest
+
+from backend.src.utils.segments import SegmentStore
+
+
+class TestSegmentStore:
+    """Tests for SegmentStore."""
+
+    def test_append_and_read(self, tmp_path):
+        """Test records are addressed by segment, offset and length."""
+        store = SegmentStore(str(tmp_path), max_bytes=1024)
+        first = store.append(b"first")
+        second = store.append(b"second record")
+
+        assert first[:2] == (1, 0)
+        assert second[:2] == (1, first[2])
+        assert store.read(*first) == b"first"
+        assert store.read(*second) == b"second record"
+
+    def test_rolls_over_to_new_segment(self, tmp_path):
+        """Test appends move to a new segment once the current one is full."""
+        store = SegmentStore(str(tmp_path), max_bytes=16)
+        store.append(b"x" * 16)
+        segment, offset, _ = store.append(b"y")
+
+        assert (segment, offset) == (2, 0)
+        assert store.segments() == [1, 2]
+
+    def test_corruption_is_detected(self, tmp_path):
+        """Test damaged records raise instead of returning bad data."""
+        store = SegmentStore(str(tmp_path), max_bytes=1024)
+        segment, offset, length = store.append(b"payload")
+        with open(store.path(segment), "r+b") as f:
+            f.seek(offset + length - 1)
+            f.write(b"X")
+
+        with pytest.raises(ValueError, match="Corrupted"):
+            store.read(segment, offset, length)
+        with pytest.raises(ValueError, match="not found"):
+            store.read(9, 0, length)
@@ -1,5 +1,7 @@
 """Comprehensive unit tests for service layer."""
 
+import json
+import os
 import pytest
 from uuid import uuid4
 from datetime import datetime, timedelta
@@ -9,14 +11,20 @@ from backend.src.services.project_service import ProjectService
 from backend.src.services.session_service import SessionService
 from backend.src.services.message_service import MessageService
 from backend.src.services.preference_service import PreferenceService
+from backend.src.services.search_service import SearchService
+from backend.src.services.audit_log_service import AuditLogService
+from backend.src.services.audit_writer import AuditLogWriter, build_audit_event
+from backend.src.services.export_service import ExportService
+from backend.src.services.import_service import ImportService
 from backend.src.repositories import (
     UserRepository,
     ProjectRepository,
     SessionRepository,
     MessageRepository,
     PreferenceRepository,
+    AuditLogRepository,
 )
-from backend.src.models import User, Project, Session, Message, UserPreference
+from backend.src.models import User, Project, Session, Message, UserPreference, AuditLog
 
 
 class TestUserService:
@@ -207,6 +215,35 @@ class TestProjectService:
         retrieved = service.get_project_by_id(project.id)
         assert retrieved is None
 
+    def test_get_projects_paginated_rows(self, db, test_user):
+        """Test projected project rows match the response schema."""
+        from backend.src.schemas.project import ProjectResponse
+
+        service = ProjectService(db)
+        service.create_project(name="Rows Project", owner_id=test_user.id)
+
+        rows = service.get_projects_paginated_rows(owner_id=test_user.id)
+
+        assert len(rows) == 1
+        assert set(rows[0]) == set(ProjectResponse.model_fields)
+        assert rows[0]["name"] == "Rows Project"
+        assert rows[0]["technology_stack"] == []
+
+
+    def test_paginated_rows_cached_until_write(self, db, test_user, cache, query_counter):
+        """Test cached project lists skip the database and refresh after writes."""
+        service = ProjectService(db)
+        service.create_project(name="First", owner_id=test_user.id)
+        assert len(service.get_projects_paginated_rows(owner_id=test_user.id)) == 1
+
+        query_counter.clear()
+        assert service.get_projects_paginated_rows(test_user.id)[0]["name"] == "First"
+        assert query_counter == []
+
+        service.create_project(name="Second", owner_id=test_user.id)
+        assert len(service.get_projects_paginated_rows(owner_id=test_user.id)) == 2
+        assert service.count_projects(owner_id=test_user.id) == 2
+
 
 class TestSessionService:
     """Test SessionService functionality."""
@@ -276,6 +313,136 @@ class TestSessionService:
 class TestMessageService:
     """Test MessageService functionality."""
 
+    def test_get_messages_paginated_rows(self, db, test_user, test_session):
+        """Test projected message rows are ordered and schema-shaped."""
+        from backend.src.schemas.message import MessageResponse
+
+        repo = MessageRepository(db)
+        for i in range(3):
+            repo.create({
+                "session_id": test_session.id,
+                "user_id": test_user.id,
+                "role": "user",
+                "content": f"Message {i}",
+                "message_type": "text",
+            })
+        db.commit()
+
+        service = MessageService(db, anthropic_api_key="")
+        rows = service.get_messages_paginated_rows(test_session.id, page=1, limit=2)
+
+        assert len(rows) == 2
+        assert set(rows[0]) == set(MessageResponse.model_fields)
+        assert all(MessageResponse.model_validate(row) for row in rows)
+
+    def test_get_messages_since(self, db, test_user, test_session):
+        """Test incremental sync pages through missed messages."""
+        repo = MessageRepository(db)
+        for i in range(4):
+            repo.create({
+                "session_id": test_session.id,
+                "user_id": test_user.id,
+                "role": "user",
+                "content": f"Message {i}",
+                "message_type": "text",
+            })
+        db.commit()
+
+        service = MessageService(db, anthropic_api_key="")
+        first = service.get_messages_since(test_session.id, after_seq=1, limit=2)
+        assert [m["seq"] for m in first["messages"]] == [2, 3]
+        assert first["has_more"] is True
+
+        rest = service.get_messages_since(test_session.id, after_seq=first["last_seq"], limit=2)
+        assert [m["seq"] for m in rest["messages"]] == [4]
+        assert rest["has_more"] is False
+
+        empty = service.get_messages_since(test_session.id, after_seq=4)
+        assert empty == {"messages": [], "last_seq": 4, "has_more": False}
+
+    def test_get_transcript_is_rebuilt_when_stale(self, db, test_user, test_session):
+        """Test the transcript is stored on first read and refreshed after new messages."""
+        from backend.src.utils.serialization import dumps
+
+        repo = MessageRepository(db)
+        for i in range(2):
+            repo.create({
+                "session_id": test_session.id, "user_id": test_user.id,
+                "role": "user", "content": f"Message {i}", "message_type": "text",
+            })
+        db.commit()
+        service = MessageService(db, anthropic_api_key="")
+
+        built = service.get_transcript(test_session.id)
+        cached = service.get_transcript(test_session.id)
+        assert built["total"] == 2 and built["last_seq"] == 2
+        assert dumps(cached) == dumps(built)
+
+        repo.create({
+            "session_id": test_session.id, "user_id": test_user.id,
+            "role": "assistant", "content": "Message 2", "message_type": "text",
+        })
+        db.commit()
+        assert [m["content"] for m in service.get_transcript(test_session.id)["messages"]] == [
+            "Message 0", "Message 1", "Message 2"
+        ]
+
+    def test_transcript_appends_and_invalidates(self, db, test_user, test_session, monkeypatch):
+        """Test sent messages extend the transcript and deletes drop it."""
+        from backend.src.config import settings
+        from backend.src.models import SessionTranscript
+
+        monkeypatch.setattr(settings, "TRANSCRIPT_MAX_CHUNKS", 2)
+        repo = MessageRepository(db)
+        service = MessageService(db, anthropic_api_key="")
+        service.get_transcript(test_session.id)
+
+        for i in range(3):
+            message = repo.create({
+                "session_id": test_session.id, "user_id": test_user.id,
+                "role": "user", "content": f"Message {i}", "message_type": "text",
+            })
+            db.commit()
+            service._extend_transcript(test_session.id, [message], message.seq)
+
+        transcript = db.get(SessionTranscript, test_session.id)
+        assert (transcript.last_seq, transcript.message_count, transcript.chunks) == (3, 3, 2)
+        assert service.get_transcript(test_session.id)["total"] == 3
+
+        service.delete_message(message.id, test_user.id)
+        assert db.get(SessionTranscript, test_session.id) is None
+        assert service.get_transcript(test_session.id)["total"] == 2
+
+    def test_transcript_rebuild_racing_a_delete_is_not_stored(self, db, test_user, test_session):
+        """Test a rebuild that read a message deleted before it was stored is discarded."""
+        from backend.src.models import SessionTranscript
+
+        repo = MessageRepository(db)
+        messages = [
+            repo.create({
+                "session_id": test_session.id, "user_id": test_user.id,
+                "role": "user", "content": f"Message {i}", "message_type": "text",
+            })
+            for i in range(2)
+        ]
+        db.commit()
+        service = MessageService(db, anthropic_api_key="")
+        read_rows = service.repo.get_after_seq
+
+        def read_then_delete(*args, **kwargs):
+            rows = read_rows(*args, **kwargs)
+            MessageService(db, anthropic_api_key="").delete_message(messages[0].id, test_user.id)
+            return rows
+
+        service.repo.get_after_seq = read_then_delete
+        assert service.get_transcript(test_session.id)["total"] == 2
+        assert db.get(SessionTranscript, test_session.id) is None
+
+        service.repo.get_after_seq = read_rows
+        assert [m["content"] for m in service.get_transcript(test_session.id)["messages"]] == [
+            "Message 1"
+        ]
+
     def test_create_message(self, db, test_user, test_session):
         """Test creating a message."""
         service = MessageService(db)
@@ -327,6 +494,35 @@ class TestMessageService:
         assert count == 5
 
 
+class TestSearchService:
+    """Test SearchService functionality."""
+
+    def test_search_messages(self, db, test_user, test_session):
+        """Test search results are shaped for the search response."""
+        from backend.src.schemas.search import SearchResponse
+
+        MessageRepository(db).create({
+            "session_id": test_session.id,
+            "user_id": test_user.id,
+            "role": "user",
+            "content": "How does a Python generator pause execution?",
+            "message_type": "question",
+        })
+        db.commit()
+
+        service = SearchService(db)
+        result = service.search_messages(test_user.id, "generators", page=1, limit=10)
+
+        assert result["total"] == 1
+        assert SearchResponse.model_validate(result).results[0].session_id == test_session.id
+
+    def test_search_messages_empty_query(self, db, test_user):
+        """Test blank queries are rejected."""
+        service = SearchService(db)
+        with pytest.raises(ValueError, match="must not be empty"):
+            service.search_messages(test_user.id, "   ")
+
+
 class TestPreferenceService:
     """Test PreferenceService functionality."""
 
@@ -370,6 +566,472 @@ class TestPreferenceService:
         assert updated.theme == "dark"
         assert updated.llm_temperature == 0.9
 
+    def test_registration_creates_preferences(self, db, test_user):
+        """Test users get default preferences when they register."""
+        prefs = PreferenceRepository(db).get_by_user_id(test_user.id)
+
+        assert prefs is not None
+        assert prefs.theme == "dark"
+
+    def test_resolve_llm_settings_cached(self, db, test_user, cache, query_counter):
+        """Test model resolution reads preferences once, then from the cache."""
+        from backend.src.config import settings
+
+        user_id = test_user.id
+        service = PreferenceService(db)
+        assert service.resolve_llm_settings(user_id)["model"] == settings.LLM_DEFAULT_MODEL
+
+        service.update_preferences(user_id, llm_model="claude-3-haiku-20240307", llm_max_tokens=512)
+        assert cache.get("preferences", user_id) is None
+        llm = service.resolve_llm_settings(user_id)
+        query_counter.clear()
+
+        assert service.resolve_llm_settings(user_id) == llm
+        assert llm == {"model": "claude-3-haiku-20240307", "temperature": 0.7, "max_tokens": 512}
+        assert query_counter == []
+
+
+class TestAuditLogService:
+    """Test AuditLogService and the batched writer."""
+
+    class _UnavailableSession:
+        """Session stand-in for a database that is down."""
+
+        def execute(self, *args, **kwargs):
+            raise ConnectionError("database unavailable")
+
+        def rollback(self):
+            pass
+
+        def close(self):
+            pass
+
+    def test_synchronous_mode_writes_in_caller_session(self, db, test_user):
+        """Test synchronous mode inserts the row immediately."""
+        writer = AuditLogWriter(synchronous=True)
+        service = AuditLogService(db, writer=writer)
+
+        log = service.log_create(test_user.id, "Project", uuid4(), {"name": "P"})
+
+        rows, _ = AuditLogRepository(db).get_by_user(test_user.id)
+        assert [row.id for row in rows] == [log.id]
+        assert rows[0].new_value == {"name": "P"}
+
+    def test_queued_events_are_written_in_batches(self, db, test_user):
+        """Test queued events are only written on flush, in bulk."""
+        from sqlalchemy.orm import Session as OrmSession
+
+        writer = AuditLogWriter(
+            session_factory=lambda: OrmSession(bind=db.connection()),
+            batch_size=2,
+        )
+        service = AuditLogService(db, writer=writer)
+        for _ in range(3):
+            service.log_update(test_user.id, "Session", uuid4(), {"a": 1}, {"a": 2})
+
+        repo = AuditLogRepository(db)
+        assert repo.get_by_user(test_user.id)[0] == []
+
+        assert writer.flush() == 3
+        assert len(repo.get_by_user(test_user.id)[0]) == 3
+
+    @staticmethod
+    def _savepoint_factory(db):
+        """Sessions on the test connection that roll back to a savepoint."""
+        from sqlalchemy.orm import Session as OrmSession
+
+        return lambda: OrmSession(bind=db.connection(), join_transaction_mode="create_savepoint")
+
+    def test_failed_batches_spill_and_replay(self, db, test_user, tmp_path):
+        """Test events survive an outage via a per-process spill file."""
+        writer = AuditLogWriter(
+            session_factory=self._UnavailableSession,
+            spill_dir=str(tmp_path),
+        )
+        service = AuditLogService(db, writer=writer)
+        service.log_delete(test_user.id, "Project", uuid4(), {"name": "P"})
+        writer.flush()
+
+        spill = tmp_path / f"spill-{writer.host}-{os.getpid()}.jsonl"
+        assert len(spill.read_text().splitlines()) == 1
+
+        writer.session_factory = self._savepoint_factory(db)
+        writer.flush()
+
+        assert list(tmp_path.iterdir()) == []
+        logs, _ = AuditLogRepository(db).get_by_action("DELETE")
+        assert [log.old_value for log in logs] == [{"name": "P"}]
+
+    def test_replay_skips_corrupt_lines_and_stored_rows(self, db, test_user, tmp_path):
+        """Test a truncated line or an already written row does not block replay."""
+        writer = AuditLogWriter(
+            session_factory=self._savepoint_factory(db),
+            spill_dir=str(tmp_path),
+        )
+        stored = build_audit_event(test_user.id, "Project", uuid4(), "CREATE")
+        spilled = build_audit_event(test_user.id, "Project", uuid4(), "UPDATE")
+        writer._write_batch([stored])
+        (tmp_path / f"spill-{writer.host}-{os.getpid()}.jsonl").write_text(
+            json.dumps(stored, default=str) + "\n"
+            + json.dumps(spilled, default=str) + "\n"
+            + '{"id": "trunc'
+        )
+
+        writer.flush()
+
+        rows, _ = AuditLogRepository(db).get_by_user(test_user.id)
+        assert sorted(row.action for row in rows) == ["CREATE", "UPDATE"]
+        assert list(tmp_path.iterdir()) == []
+
+    def test_rejected_rows_are_dead_lettered(self, db, test_user, tmp_path):
+        """Test a row the database rejects does not fail the rest of its batch."""
+        writer = AuditLogWriter(
+            session_factory=self._savepoint_factory(db),
+            spill_dir=str(tmp_path),
+        )
+        good = build_audit_event(test_user.id, "Session", uuid4(), "CREATE")
+        bad = dict(build_audit_event(test_user.id, "Session", uuid4(), "CREATE"),
+                   created_at="yesterday")
+        writer._queue.put(good)
+        writer._queue.put(bad)
+
+        writer.flush()
+        writer.flush()
+
+        rows, _ = AuditLogRepository(db).get_by_user(test_user.id)
+        assert [row.id for row in rows] == [good["id"]]
+        dead = (tmp_path / f"dead-{writer.host}-{os.getpid()}.jsonl").read_text().splitlines()
+        assert len(dead) == 1
+        assert json.loads(dead[0])["event"]["id"] == str(bad["id"])
+        assert not (tmp_path / f"spill-{writer.host}-{os.getpid()}.jsonl").exists()
+
+    def test_spills_of_exited_processes_are_replayed(self, db, test_user, tmp_path):
+        """Test spill files left by a dead worker are claimed, live ones are not."""
+        writer = AuditLogWriter(
+            session_factory=self._savepoint_factory(db),
+            spill_dir=str(tmp_path),
+        )
+        orphan = build_audit_event(test_user.id, "Project", uuid4(), "DELETE")
+        live = build_audit_event(test_user.id, "Project", uuid4(), "UPDATE")
+        dead_pid = 2 ** 22 + 1  # Above the default pid_max
+        (tmp_path / f"spill-{writer.host}-{dead_pid}.jsonl").write_text(
+            json.dumps(orphan, default=str) + "\n"
+        )
+        live_file = tmp_path / f"spill-{writer.host}-{os.getppid()}.jsonl"
+        live_file.write_text(json.dumps(live, default=str) + "\n")
+
+        writer.flush()
+
+        rows, _ = AuditLogRepository(db).get_by_user(test_user.id)
+        assert [row.id for row in rows] == [orphan["id"]]
+        assert [path.name for path in tmp_path.iterdir()] == [live_file.name]
+
+    def test_stop_flushes_pending_events(self, db, test_user):
+        """Test stopping the background writer drains the queue."""
+        from sqlalchemy.orm import Session as OrmSession
+
+        writer = AuditLogWriter(
+            session_factory=lambda: OrmSession(bind=db.connection()),
+            flush_interval=60,
+        )
+        writer.start()
+        AuditLogService(db, writer=writer).log_create(test_user.id, "User", test_user.id)
+        writer.stop()
+
+        assert not writer.running
+        assert len(AuditLogRepository(db).get_by_user(test_user.id)[0]) == 1
+
+
+class TestExportService:
+    """Test ExportService functionality."""
+
+    def _add_messages(self, db, user, session, count):
+        """Add numbered messages to a session."""
+        repo = MessageRepository(db)
+        for i in range(count):
+            repo.create({
+                "session_id": session.id,
+                "user_id": user.id,
+                "role": "user",
+                "content": f"Message {i}",
+                "message_type": "text",
+            })
+        db.commit()
+
+    def test_iter_records_in_dependency_order(self, db, test_user, test_session):
+        """Test records are scoped to the owner and ordered for import."""
+        self._add_messages(db, test_user, test_session, 3)
+
+        records = list(ExportService(db, batch_size=2).iter_records(test_user.id))
+
+        assert [r["type"] for r in records] == [
+            "export", "project", "session", "message", "message", "message"
+        ]
+        assert [r["seq"] for r in records if r["type"] == "message"] == [1, 2, 3]
+
+    def test_iter_ndjson_gzip(self, db, test_user, test_session):
+        """Test the compressed stream decodes to one JSON object per line."""
+        import gzip
+        import json
+
+        self._add_messages(db, test_user, test_session, 2)
+
+        chunks = list(ExportService(db).iter_ndjson(test_user.id, compression="gzip"))
+        lines = gzip.decompress(b"".join(chunks)).decode().splitlines()
+
+        assert len(lines) == 5
+        assert json.loads(lines[-1])["content"] == "Message 1"
+
+    def test_iter_ndjson_rejects_unknown_compression(self, db, test_user):
+        """Test unsupported compression options are rejected."""
+        with pytest.raises(ValueError):
+            list(ExportService(db).iter_ndjson(test_user.id, compression="lz4"))
+
+
+class TestImportService:
+    """Test ImportService functionality."""
+
+    def test_round_trip_from_export(self, db, test_user, test_session):
+        """Test an export re-imports as new rows with fresh ids and seqs."""
+        repo = MessageRepository(db)
+        for i in range(5):
+            repo.create({
+                "session_id": test_session.id,
+                "user_id": test_user.id,
+                "role": "user" if i % 2 == 0 else "assistant",
+                "content": f"Message {i}",
+                "message_type": "text",
+            })
+        db.commit()
+        lines = b"".join(ExportService(db).iter_ndjson(test_user.id)).splitlines()
+        progress = []
+
+        report = ImportService(
+            db, batch_size=2, transaction_size=3, progress=progress.append
+        ).import_lines(test_user.id, lines)
+
+        assert (report["projects"], report["sessions"], report["messages"]) == (1, 1, 5)
+        assert report["skipped"] == 0
+        assert len(progress) >= 2
+
+        sessions = SessionRepository(db).get_by_owner(test_user.id)
+        imported = next(s for s in sessions if s.id != test_session.id)
+        assert imported.project_id != test_session.project_id
+        assert imported.message_seq == 5
+        messages = MessageRepository(db).get_by_session_sorted(imported.id)
+        assert sorted(m.seq for m in messages) == [1, 2, 3, 4, 5]
+
+    def test_invalid_lines_are_reported(self, db, test_user):
+        """Test bad lines are skipped with line numbers."""
+        lines = [
+            b'{"type": "session", "id": "s1", "mode": "chat"}',
+            b"not json",
+            b'{"type": "message", "session_id": "missing", "role": "user", "content": "x"}',
+            b'{"type": "message", "session_id": "s1", "role": "robot", "content": "x"}',
+            b'{"type": "message", "session_id": "s1", "role": "user", "content": "ok"}',
+        ]
+
+        report = ImportService(db).import_lines(test_user.id, lines)
+
+        assert report["messages"] == 1
+        assert report["skipped"] == 3
+        assert [e["line"] for e in report["errors"]] == [2, 3, 4]
+        assert "role" in report["errors"][2]["error"]
+
+    def test_records_are_validated_like_the_api(self, db, test_user):
+        """Test imports reject values the API itself would not accept."""
+        lines = [
+            b'{"type": "project", "id": "p1", "name": "P", "status": "DONE"}',
+            b'{"type": "session", "id": "s1", "status": "DELETED"}',
+            b'{"type": "session", "id": "s2"}',
+            b'{"type": "message", "session_id": "s2", "role": "system", "content": "x"}',
+            b'{"type": "message", "session_id": "s2", "role": "user", "content": "x",'
+            b' "message_type": "html"}',
+            b'{"type": "message", "session_id": "s2", "role": "user", "content": "'
+            + b"x" * 10001 + b'"}',
+        ]
+
+        report = ImportService(db).import_lines(test_user.id, lines)
+
+        assert (report["projects"], report["sessions"], report["messages"]) == (0, 1, 0)
+        assert [e["line"] for e in report["errors"]] == [1, 2, 4, 5, 6]
+
+
+class TestPurgeService:
+    """Test inline, soft and background deletion."""
+
+    @staticmethod
+    def _add_messages(db, session, count):
+        repo = MessageRepository(db)
+        for i in range(count):
+            repo.create({
+                "session_id": session.id,
+                "user_id": session.owner_id,
+                "role": "user",
+                "content": f"Message {i}",
+                "message_type": "text",
+            })
+        db.commit()
+
+    def test_small_session_delete_cascades(self, db, test_session):
+        """Test small sessions are deleted at once with their messages."""
+        self._add_messages(db, test_session, 3)
+
+        assert SessionService(db).delete_session(test_session.id, test_session.owner_id) is True
+        assert db.query(Message).filter_by(session_id=test_session.id).count() == 0
+
+    def test_large_project_is_soft_deleted_then_purged(self, db, test_user, test_session, monkeypatch):
+        """Test large projects are hidden first and purged in batches."""
+        from backend.src.config import settings
+        from backend.src.services.purge_service import PurgeService
+
+        monkeypatch.setattr(settings, "DELETE_INLINE_MAX_ROWS", 2)
+        self._add_messages(db, test_session, 5)
+        project_id, session_id = test_session.project_id, test_session.id
+
+        assert ProjectService(db).delete_project(project_id, test_user.id) is False
+        assert ProjectService(db).get_project_by_id(project_id) is None
+        assert SessionService(db).get_session_by_id(session_id) is None
+        assert db.query(Message).filter_by(session_id=session_id).count() == 5
+
+        deleted = PurgeService(db, batch_size=2).purge("project", project_id)
+
+        assert deleted == 7
+        assert db.query(Project).filter_by(id=project_id).count() == 0
+        assert db.query(Message).filter_by(session_id=session_id).count() == 0
+
+    def test_deleted_user_is_purged_by_pending_run(self, db, test_user, test_session):
+        """Test deleted accounts cannot log in and are purged, keeping audit rows."""
+        from backend.src.services.purge_service import PurgeService
+
+        user_id = test_user.id
+        self._add_messages(db, test_session, 2)
+        AuditLogRepository(db).create({"user_id": user_id, "action": "LOGIN"})
+        db.commit()
+
+        UserService(db).delete_user(user_id)
+        assert UserService(db).authenticate_user("testuser", "TestPass123") is None
+
+        report = PurgeService(db, batch_size=1).purge_pending()
+
+        assert report["user"] == 1
+        assert db.query(User).filter_by(id=user_id).count() == 0
+        assert db.query(Session).count() == 0
+        assert db.query(AuditLog).filter_by(action="LOGIN").one().user_id is None
+
+
+class TestArchiveService:
+    """Test moving archived sessions' messages to cold storage and back."""
+
+    @pytest.fixture(autouse=True)
+    def archive_dir(self, tmp_path, monkeypatch):
+        from backend.src.config import settings
+        monkeypatch.setattr(settings, "ARCHIVE_DIR", str(tmp_path))
+
+    @staticmethod
+    def _add_messages(db, session, count):
+        repo = MessageRepository(db)
+        for i in range(count):
+            repo.create({
+                "session_id": session.id,
+                "user_id": session.owner_id,
+                "role": "user" if i % 2 == 0 else "assistant",
+                "content": f"Message {i}",
+                "message_type": "text",
+            })
+        db.commit()
+
+    def test_archived_messages_are_read_from_segment(self, db, test_session):
+        """Test archived sessions leave the hot table but stay readable."""
+        from backend.src.services.archive_service import ArchiveService
+
+        self._add_messages(db, test_session, 3)
+        test_session.status = "ARCHIVED"
+        db.commit()
+        assert ArchiveService(db).archive_session(test_session.id) == 3
+        assert db.query(Message).filter_by(session_id=test_session.id).count() == 0
+
+        service = MessageService(db, anthropic_api_key="")
+        rows = service.get_messages_paginated_rows(test_session.id, page=1, limit=2)
+        assert [row["content"] for row in rows] == ["Message 0", "Message 1"]
+        assert service.count_messages(test_session.id) == 3
+        assert [m["seq"] for m in service.get_messages_since(test_session.id, after_seq=2)["messages"]] == [3]
+        assert [m.role for m in MessageRepository(db).get_context_window(test_session.id, 2)] == [
+            "assistant", "user"
+        ]
+        assert SessionService(db).get_session_version(test_session.id).message_count == 3
+
+    def test_restore_returns_messages_to_table(self, db, test_session):
+        """Test restoring keeps ids and sequence numbers."""
+        from backend.src.services.archive_service import ArchiveService
+
+        self._add_messages(db, test_session, 2)
+        ids = [m.id for m in db.query(Message).order_by(Message.seq)]
+        test_session.status = "ARCHIVED"
+        db.commit()
+        service = ArchiveService(db)
+        service.archive_session(test_session.id)
+
+        assert service.restore_session(test_session.id) == 2
+        assert service.restore_session(test_session.id) == 0
+        assert [m.id for m in db.query(Message).order_by(Message.seq)] == ids
+        assert test_session.status == "ACTIVE"
+
+    def test_empty_active_sessions_skip_the_archive(self, db, test_session, query_counter):
+        """Test reads of an empty, non-archived session cost no archive lookup."""
+        repo = MessageRepository(db)
+        db.get(Session, test_session.id)
+        query_counter.clear()
+
+        assert repo.get_by_session(test_session.id) == []
+        assert repo.get_by_session_count(test_session.id) == 0
+        assert not any("message_archives" in statement for statement in query_counter)
+
+    def test_compact_removes_records_of_deleted_sessions(self, db, test_user, test_session, tmp_path):
+        """Test compaction drops dead records and keeps live ones readable."""
+        from backend.src.services.archive_service import ArchiveService
+
+        other = SessionService(db).create_session(owner_id=test_user.id, name="Other", mode="chat")
+        for session in (test_session, other):
+            self._add_messages(db, session, 2)
+            session.status = "ARCHIVED"
+        db.commit()
+        service = ArchiveService(db)
+        service.archive_session(test_session.id)
+        service.archive_session(other.id)
+        db.delete(other)
+        db.commit()
+
+        assert service.compact(min_age_seconds=60) == 0
+        assert service.compact(min_age_seconds=0) == 1
+
+        from backend.src.models import MessageArchive
+        entry = db.get(MessageArchive, test_session.id)
+        assert [path.name for path in tmp_path.iterdir()] == ["00000002.seg"]
+        assert (entry.segment, entry.offset) == (2, 0)
+        assert (tmp_path / "00000002.seg").stat().st_size == entry.length
+        rows = MessageService(db, anthropic_api_key="").get_messages_paginated_rows(
+            test_session.id, page=1, limit=5
+        )
+        assert [row["content"] for row in rows] == ["Message 0", "Message 1"]
+        assert service.compact(min_age_seconds=0) == 0
+
+    def test_archive_pending_waits_for_min_age(self, db, test_session):
+        """Test only sessions archived long enough are moved."""
+        from backend.src.services.archive_service import ArchiveService
+
+        self._add_messages(db, test_session, 2)
+        test_session.status = "ARCHIVED"
+        test_session.archived_at = datetime.utcnow() - timedelta(days=3)
+        db.commit()
+
+        assert ArchiveService(db).archive_pending(min_age_days=7) == 0
+        assert ArchiveService(db).archive_pending(min_age_days=2) == 1
+        assert ArchiveService(db).archive_pending(min_age_days=2) == 0
+
+        records = list(ExportService(db).iter_records(test_session.owner_id))
+        assert [r["seq"] for r in records if r["type"] == "message"] == [1, 2]
+
 
 class TestServiceIntegration:
     """Integration tests for multiple services working together."""